@@ -0,0 +1,62 @@
+"""
+일일 기록 추가 벤치마크
+
+기존 기록이 1,000행 / 100,000행인 Excel 파일에 며칠치 기록을 추가할 때
+append_daily_record 반복 호출과 append_daily_records 일괄 호출의 처리 시간을
+비교합니다. 각 측정은 임시 디렉토리의 복사본에서 실행됩니다.
+
+사용법:
+    python -m benchmarks.bench_append
+    python -m benchmarks.bench_append --sizes 1000 --days 30
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+from benchmarks.datagen import make_batch, make_history
+from finance_util import append_daily_record, append_daily_records
+
+
+def timed_copy(source, workdir, name, func):
+    """source 를 복사한 파일에 func(filename) 을 실행하고 경과 시간(초)을 반환합니다."""
+    shutil.copy(source, os.path.join(workdir, name))
+    start = time.perf_counter()
+    func(name)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="일일 기록 추가 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs='+', default=[1_000, 100_000],
+                        help="기존 기록 행 수 (기본값: 1000 100000)")
+    parser.add_argument("--days", type=int, default=5,
+                        help="추가할 거래일 수 (기본값: 5, 기존 날짜 1건 업데이트 포함)")
+    args = parser.parse_args()
+
+    records, summaries = make_batch(args.days)
+
+    print(f"{'rows':>10} {'records':>8} {'loop (s)':>10} {'bulk (s)':>10} {'speedup':>8}")
+    with tempfile.TemporaryDirectory() as workdir:
+        for rows in args.sizes:
+            source = os.path.join(workdir, f'history_{rows}.xlsx')
+            make_history(rows).to_excel(source, index=False, engine='openpyxl')
+
+            def loop(name):
+                for record, summary in zip(records, summaries):
+                    append_daily_record(record, summary, name, workdir)
+
+            def bulk(name):
+                append_daily_records(records, summaries, name, workdir)
+
+            loop_time = timed_copy(source, workdir, 'loop.xlsx', loop)
+            bulk_time = timed_copy(source, workdir, 'bulk.xlsx', bulk)
+
+            print(f"{rows:>10,} {len(records):>8} {loop_time:>10.2f} {bulk_time:>10.2f} "
+                  f"{loop_time / bulk_time:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+PER 계산 벤치마크
+
+calculate_per_vectorized 를 1e3 ~ 1e7 행에 대해 실행하여 처리 시간과
+행당 추가 메모리(tracemalloc 피크)를 측정합니다. 작은 크기에서는
+calculate_per_for_stocks(딕셔너리 리스트) 경로와도 비교합니다.
+
+사용법:
+    python -m benchmarks.bench_per
+    python -m benchmarks.bench_per --max-rows 1000000
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from benchmarks.datagen import make_per_inputs
+from finance_util import calculate_per_for_stocks, calculate_per_vectorized
+
+
+def measure(func, *args):
+    """(경과 시간 초, tracemalloc 피크 바이트) 를 반환합니다."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    func(*args)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PER 계산 벤치마크")
+    parser.add_argument("--max-rows", type=int, default=10_000_000,
+                        help="최대 행 수 (기본값: 10,000,000)")
+    parser.add_argument("--dict-max-rows", type=int, default=100_000,
+                        help="calculate_per_for_stocks 를 측정할 최대 행 수 (기본값: 100,000)")
+    args = parser.parse_args()
+
+    sizes = [n for n in (10**3, 10**4, 10**5, 10**6, 10**7) if n <= args.max_rows]
+
+    print(f"{'rows':>12} {'vectorized (s)':>15} {'ns/row':>8} {'peak MB':>9} {'bytes/row':>10} {'dicts (s)':>11}")
+    for rows in sizes:
+        prices, eps = make_per_inputs(rows)
+        elapsed, peak = measure(calculate_per_vectorized, prices, eps)
+
+        dicts = ""
+        if rows <= args.dict_max_rows:
+            stocks = [{'name': str(i), 'price': float(p), 'eps': float(e)}
+                      for i, (p, e) in enumerate(zip(prices, eps))]
+            start = time.perf_counter()
+            calculate_per_for_stocks(stocks)
+            dicts = f"{time.perf_counter() - start:.3f}"
+
+        print(f"{rows:>12,} {elapsed:>15.4f} {elapsed / rows * 1e9:>8.1f} "
+              f"{peak / 1e6:>9.1f} {peak / rows:>10.1f} {dicts:>11}")
+
+
+if __name__ == "__main__":
+    main()
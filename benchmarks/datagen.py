@@ -0,0 +1,123 @@
+"""
+벤치마크용 합성 데이터 생성기
+
+모든 생성기는 seed 를 받아 같은 입력을 다시 만들 수 있으므로, 실행 간
+결과를 비교할 수 있습니다.
+"""
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import numpy as np
+import pandas as pd
+
+
+def make_per_inputs(rows, seed=0):
+    """가격/EPS 합성 데이터를 생성합니다 (약 0.5%는 EPS <= 0)."""
+    rng = np.random.default_rng(seed)
+    prices = rng.uniform(1, 500_000, rows)
+    eps = rng.uniform(-100, 20_000, rows)
+    return prices, eps
+
+
+def make_stocks(rows, seed=0):
+    """
+    calculate_per_for_stocks / export_to_excel 입력 형식의 딕셔너리 리스트를 생성합니다.
+
+    make_per_inputs 의 EPS <= 0 행을 그대로 두어 실제 데이터처럼 오류 메시지
+    경로 (PER 열이 'Error: ...' 문자열로 바뀌는 경우) 도 측정합니다.
+    """
+    prices, eps = make_per_inputs(rows, seed)
+    return [{'name': f'STOCK{i:07d}', 'price': float(p), 'eps': float(e)}
+            for i, (p, e) in enumerate(zip(prices, eps))]
+
+
+def make_history(rows, seed=0):
+    """rows 거래일 분량의 추적 기록 DataFrame 을 생성합니다 (최신 날짜가 먼저)."""
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range(end='2026-01-15', periods=rows)[::-1]
+    close = np.round(rng.uniform(50, 500, rows), 2)
+    prev_close = np.round(close * rng.uniform(0.95, 1.05, rows), 2)
+    return pd.DataFrame({
+        '날짜': dates.strftime('%Y-%m-%d'),
+        '전일종가': prev_close,
+        '시가': np.round(close * 0.99, 2),
+        '종가': close,
+        '최고가': np.round(close * 1.02, 2),
+        '최저가': np.round(close * 0.98, 2),
+        '거래량': rng.integers(1_000_000, 50_000_000, rows),
+        '변동가격': np.round(close - prev_close, 2),
+        '변동률(%)': np.round((close - prev_close) / prev_close * 100, 2),
+        '뉴스/이유': '뉴스 없음',
+    })
+
+
+def make_batch(days):
+    """기존 기록 이후 days 거래일 + 마지막 기존 날짜 1건(업데이트) 의 기록을 생성합니다."""
+    dates = list(pd.bdate_range(start='2026-01-16', periods=days).strftime('%Y-%m-%d')) + ['2026-01-15']
+    records = [
+        {'date': d, 'open': 100.0, 'close': 101.0, 'high': 102.0, 'low': 99.0,
+         'volume': 1_000_000, 'change': 1.0, 'change_pct': 1.0, 'prev_close': 100.0}
+        for d in dates
+    ]
+    return records, [f"뉴스 {d}" for d in dates]
+
+
+def make_rss_feed(items, target_date='2026-01-15', seed=0):
+    """
+    Google News 형식의 RSS 문서를 생성합니다.
+
+    발행일은 target_date 전후 30일에 고르게 퍼져 있어, 날짜 필터를
+    통과하는 항목이 일부만 있습니다.
+
+    Returns:
+        bytes: RSS XML 문서
+    """
+    rng = np.random.default_rng(seed)
+    target = datetime.strptime(target_date, '%Y-%m-%d').replace(hour=12, tzinfo=timezone.utc)
+    offsets = rng.integers(-30 * 24, 30 * 24, items)
+    parts = ['<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel><title>Google News</title>']
+    for i, hours in enumerate(offsets.tolist()):
+        published = format_datetime(target + timedelta(hours=hours), usegmt=True)
+        parts.append(
+            f'<item><title>Synthetic headline {i} about NVIDIA - Publisher {i % 17}</title>'
+            f'<link>https://news.example.com/articles/{i}</link>'
+            f'<guid isPermaLink="false">{i}</guid><pubDate>{published}</pubDate>'
+            f'<description>Synthetic description {i}</description>'
+            f'<source url="https://publisher{i % 17}.example.com">Publisher {i % 17}</source></item>'
+        )
+    parts.append('</channel></rss>')
+    return ''.join(parts).encode('utf-8')
+
+
+def make_financials_page(rows=30, columns=10, payload_bytes=200_000, seed=0):
+    """
+    stockanalysis.com 형식의 재무제표 페이지 HTML 을 생성합니다.
+
+    실제 페이지처럼 테이블 앞에 큰 스크립트 페이로드가 있고, 값은 천 단위
+    구분자, %, B/M 접미사, 괄호 음수, '-' 가 섞인 문자열입니다.
+
+    Returns:
+        str: 페이지 HTML
+    """
+    rng = np.random.default_rng(seed)
+    values = rng.uniform(-50_000, 50_000, (rows, columns))
+    formats = (
+        lambda v: f"{v:,.0f}",
+        lambda v: f"{v / 1000:.2f}%",
+        lambda v: f"{abs(v) / 10:.1f}B" if v > 0 else f"{abs(v):.1f}M",
+        lambda v: f"({abs(v):,.0f})" if v < 0 else f"{v:,.0f}",
+        lambda v: '-',
+    )
+    header = ''.join(f'<th>Q{(c % 4) + 1} {2026 - c // 4}</th>' for c in range(columns))
+    body = []
+    for r in range(rows):
+        fmt = formats[r % len(formats)]
+        cells = ''.join(f'<td class="svelte-1yyv6eq">{fmt(v)}</td>' for v in values[r].tolist())
+        body.append(f'<tr><td class="left"><a href="#">Line item {r}</a></td>{cells}</tr>')
+    return (
+        f'<!doctype html><html><head><script>const data = "{"x" * payload_bytes}";</script></head>'
+        f'<body><main><div class="overflow-x-auto"><table id="main-table"><thead>'
+        f'<tr><th class="left">Fiscal Quarter</th>{header}</tr></thead>'
+        f'<tbody>{"".join(body)}</tbody></table></div></main></body></html>'
+    )
@@ -0,0 +1,347 @@
+"""
+finance_util 계산/저장 경로 벤치마크 모음
+
+합성 데이터(benchmarks/datagen.py)로 다음 경로를 측정하고 결과를 JSON 으로
+저장합니다. 저장된 기준 결과(benchmarks/baseline.json)와 비교하여 중앙값이
+임계값 이상 느려진 항목이 있으면 종료 코드 1을 반환합니다.
+
+- per_vectorized: calculate_per_vectorized, 1e3 ~ 1e7 행
+- per_for_stocks: calculate_per_for_stocks (딕셔너리 리스트), 1e3 ~ 1e5 행
+- export_to_excel: 1e2 ~ 1e4 행
+- append_daily_record / append_daily_records: 기존 기록 10 ~ 100,000 행
+- rss_parse: _parse_news_items (조기 종료), rss_scan: 전체 항목 순회, 1e3 ~ 1e5 항목
+- financials_table: 재무제표 페이지 테이블 추출 + float 변환 (read_numeric_table), 1e2 ~ 1e3 페이지
+
+사용법:
+    python -m benchmarks.suite                          # 전체 실행 + 기준 비교
+    python -m benchmarks.suite --quick                  # 작은 크기만 (CI)
+    python -m benchmarks.suite --only per rss           # 이름이 per/rss 로 시작하는 항목만
+    python -m benchmarks.suite --save-baseline          # 결과를 기준으로 저장
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Optional
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.datagen import (
+    make_batch,
+    make_financials_page,
+    make_history,
+    make_per_inputs,
+    make_rss_feed,
+    make_stocks,
+)
+from finance_util import (
+    append_daily_record,
+    append_daily_records,
+    calculate_per_for_stocks,
+    calculate_per_vectorized,
+    export_to_excel,
+)
+from finance_util.news import _iter_feed_items, _parse_news_items
+from financials_table import read_numeric_table
+
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE = os.path.join(BENCHMARK_DIR, 'baseline.json')
+DEFAULT_OUTPUT = 'benchmark_results.json'
+
+# 중앙값이 기준보다 25% 이상 느려지면 회귀
+DEFAULT_THRESHOLD = 0.25
+
+# 이보다 작은 차이(초)는 측정 잡음으로 보고 회귀로 판정하지 않음
+NOISE_FLOOR_SECONDS = 0.002
+
+
+@dataclass
+class Case:
+    """
+    벤치마크 항목 하나.
+
+    setup 의 반환값이 reset/run 에 전달됩니다. reset 은 매 반복 전에 시간
+    측정 없이 실행됩니다 (예: 추가 대상 파일 복원).
+    """
+    group: str
+    size: int
+    setup: Callable
+    run: Callable
+    reset: Optional[Callable] = None
+    threshold: Optional[float] = None
+    quick: bool = True
+
+    @property
+    def name(self):
+        return f"{self.group}[{self.size}]"
+
+
+def _per_vectorized_cases():
+    for rows in (10**3, 10**4, 10**5, 10**6, 10**7):
+        yield Case('per_vectorized', rows, lambda workdir, rows=rows: make_per_inputs(rows),
+                   lambda state: calculate_per_vectorized(*state), quick=rows <= 10**5)
+
+
+def _per_for_stocks_cases():
+    # 딕셔너리 리스트 경로는 1e6 행부터 입력만 수 GB 가 되므로 1e5 까지만 측정
+    for rows in (10**3, 10**4, 10**5):
+        yield Case('per_for_stocks', rows, lambda workdir, rows=rows: make_stocks(rows),
+                   calculate_per_for_stocks, quick=rows <= 10**4)
+
+
+def _export_cases():
+    for rows in (10**2, 10**3, 10**4):
+        yield Case('export_to_excel', rows,
+                   lambda workdir, rows=rows: (make_stocks(rows), workdir),
+                   lambda state: export_to_excel(state[0], 'export.xlsx', state[1]),
+                   quick=rows <= 10**3)
+
+
+def _append_setup(workdir, rows):
+    source = os.path.join(workdir, f'history_{rows}.xlsx')
+    make_history(rows).to_excel(source, index=False, engine='openpyxl')
+    records, summaries = make_batch(5)
+    return {'source': source, 'workdir': workdir, 'records': records, 'summaries': summaries}
+
+
+def _append_reset(state):
+    shutil.copy(state['source'], os.path.join(state['workdir'], 'tracker.xlsx'))
+
+
+def _append_one(state):
+    append_daily_record(state['records'][0], state['summaries'][0], 'tracker.xlsx', state['workdir'])
+
+
+def _append_many(state):
+    append_daily_records(state['records'], state['summaries'], 'tracker.xlsx', state['workdir'])
+
+
+def _append_cases():
+    for rows in (10, 10**2, 10**3, 10**4, 10**5):
+        setup = lambda workdir, rows=rows: _append_setup(workdir, rows)
+        yield Case('append_daily_record', rows, setup, _append_one, _append_reset, quick=rows <= 10**3)
+        yield Case('append_daily_records', rows, setup, _append_many, _append_reset, quick=rows <= 10**3)
+
+
+def _rss_cases():
+    target = datetime(2026, 1, 15).date()
+    for items in (10**3, 10**4, 10**5):
+        setup = lambda workdir, items=items: make_rss_feed(items)
+        yield Case('rss_parse', items, setup, lambda content: _parse_news_items(content, target, 5),
+                   quick=items <= 10**4)
+        yield Case('rss_scan', items, setup,
+                   lambda content, items=items: sum(1 for _ in _iter_feed_items(content, items)),
+                   quick=items <= 10**4)
+
+
+def _financials_table_cases():
+    # 페이지마다 시드를 달리해 같은 문자열만 반복 파싱하지 않도록 함
+    for pages in (10**2, 10**3):
+        setup = lambda workdir, pages=pages: [make_financials_page(seed=i) for i in range(pages)]
+        yield Case('financials_table', pages, setup,
+                   lambda htmls: [read_numeric_table(html) for html in htmls], quick=pages <= 10**2)
+
+
+def build_cases(quick=False, only=None):
+    """
+    실행할 벤치마크 항목 리스트를 만듭니다.
+
+    Args:
+        quick (bool): 작은 크기만 포함 (기본값: False)
+        only (list): 이 접두어로 시작하는 그룹만 포함 (기본값: 전체)
+
+    Returns:
+        list: Case 리스트
+    """
+    cases = [case for factory in (_per_vectorized_cases, _per_for_stocks_cases, _export_cases,
+                                  _append_cases, _rss_cases, _financials_table_cases) for case in factory()]
+    if quick:
+        cases = [case for case in cases if case.quick]
+    if only:
+        cases = [case for case in cases if any(case.group.startswith(prefix) for prefix in only)]
+    return cases
+
+
+def time_case(case, workdir, min_repeats=3, max_repeats=10, min_time=0.5):
+    """
+    항목을 반복 실행하여 시간을 측정합니다.
+
+    min_repeats 번은 반드시 실행하고, 누적 시간이 min_time 초가 될 때까지
+    최대 max_repeats 번까지 반복합니다.
+
+    Returns:
+        dict: {'median_s', 'min_s', 'repeats'}
+    """
+    state = case.setup(workdir)
+    times = []
+    while len(times) < min_repeats or (sum(times) < min_time and len(times) < max_repeats):
+        if case.reset is not None:
+            case.reset(state)
+        start = time.perf_counter()
+        case.run(state)
+        times.append(time.perf_counter() - start)
+    return {'median_s': statistics.median(times), 'min_s': min(times), 'repeats': len(times)}
+
+
+def environment():
+    """결과를 해석하는 데 필요한 실행 환경 정보를 반환합니다."""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=BENCHMARK_DIR,
+                                capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'commit': commit,
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'cpus': os.cpu_count(),
+    }
+
+
+def run_suite(cases, repeats=3):
+    """
+    항목들을 실행하고 결과를 반환합니다.
+
+    Returns:
+        dict: {'environment': {...}, 'results': {name: {'group', 'size', 'median_s', 'min_s', 'repeats'}}}
+    """
+    results = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        for case in cases:
+            timing = time_case(case, workdir, min_repeats=repeats)
+            results[case.name] = {'group': case.group, 'size': case.size, **timing}
+            if case.threshold is not None:
+                results[case.name]['threshold'] = case.threshold
+            print(f"  {case.name:<32} {timing['median_s'] * 1000:>10.2f} ms  (x{timing['repeats']})")
+    return {'environment': environment(), 'results': results}
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD, noise_floor=NOISE_FLOOR_SECONDS):
+    """
+    결과를 기준 결과와 비교합니다.
+
+    중앙값이 기준의 (1 + threshold) 배를 넘고 차이가 noise_floor 초 이상이면
+    회귀입니다. 항목에 저장된 threshold 가 있으면 그 값을 사용합니다.
+
+    Args:
+        results (dict): run_suite 결과의 'results'
+        baseline (dict): 기준 결과의 'results'
+        threshold (float): 허용 비율 (기본값: 0.25)
+        noise_floor (float): 무시할 절대 차이, 초 (기본값: 0.002)
+
+    Returns:
+        list: (name, 기준 초 또는 None, 현재 초, 비율 또는 None, 'ok'|'regression'|'faster'|'new') 리스트
+    """
+    rows = []
+    for name, current in results.items():
+        base = baseline.get(name)
+        if base is None:
+            rows.append((name, None, current['median_s'], None, 'new'))
+            continue
+
+        limit = current.get('threshold', base.get('threshold', threshold))
+        ratio = current['median_s'] / base['median_s'] if base['median_s'] > 0 else float('inf')
+        delta = current['median_s'] - base['median_s']
+        if ratio > 1 + limit and delta > noise_floor:
+            status = 'regression'
+        elif ratio < 1 / (1 + limit) and -delta > noise_floor:
+            status = 'faster'
+        else:
+            status = 'ok'
+        rows.append((name, base['median_s'], current['median_s'], ratio, status))
+    return rows
+
+
+def print_comparison(rows):
+    """compare 결과를 표로 출력합니다."""
+    print(f"\n{'benchmark':<32} {'baseline ms':>12} {'current ms':>12} {'ratio':>7}  status")
+    for name, base, current, ratio, status in rows:
+        base_text = f"{base * 1000:>12.2f}" if base is not None else f"{'-':>12}"
+        ratio_text = f"{ratio:>7.2f}" if ratio is not None else f"{'-':>7}"
+        marker = '❌ ' if status == 'regression' else ''
+        print(f"{name:<32} {base_text} {current * 1000:>12.2f} {ratio_text}  {marker}{status}")
+
+
+def load_results(path):
+    """JSON 결과 파일을 읽습니다."""
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_results(data, path):
+    """결과를 JSON 파일로 저장합니다."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+        f.write('\n')
+
+
+def main():
+    parser = argparse.ArgumentParser(description="finance_util 벤치마크 모음")
+    parser.add_argument("--quick", action="store_true", help="작은 크기만 실행 (CI 용)")
+    parser.add_argument("--only", nargs='+', default=None, help="이 접두어로 시작하는 그룹만 실행")
+    parser.add_argument("--repeats", type=int, default=3, help="항목별 최소 반복 횟수 (기본값: 3)")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help=f"결과 JSON 경로 (기본값: {DEFAULT_OUTPUT})")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="기준 결과 JSON 경로")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help=f"회귀 판정 비율 (기본값: {DEFAULT_THRESHOLD})")
+    parser.add_argument("--save-baseline", action="store_true", help="결과를 기준 결과로 저장")
+    parser.add_argument("--list", action="store_true", help="항목 이름만 출력")
+    args = parser.parse_args()
+
+    cases = build_cases(args.quick, args.only)
+    if args.list:
+        for case in cases:
+            print(case.name)
+        return 0
+
+    print(f"벤치마크 {len(cases)}개 실행 중...")
+    data = run_suite(cases, args.repeats)
+    save_results(data, args.output)
+    print(f"\n결과 저장: {args.output}")
+
+    if args.save_baseline:
+        if os.path.exists(args.baseline):
+            # 이번에 실행하지 않은 항목의 기준은 유지
+            previous = load_results(args.baseline)['results']
+            data = {**data, 'results': {**previous, **data['results']}}
+        save_results(data, args.baseline)
+        print(f"기준 결과 저장: {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"기준 결과가 없습니다: {args.baseline} (--save-baseline 으로 생성)")
+        return 0
+
+    baseline = load_results(args.baseline)
+    print(f"기준: {baseline['environment'].get('commit')} ({baseline['environment'].get('platform')})")
+    rows = compare(data['results'], baseline['results'], args.threshold)
+    print_comparison(rows)
+
+    regressions = [row[0] for row in rows if row[4] == 'regression']
+    if regressions:
+        print(f"\n❌ 성능 회귀 {len(regressions)}건: {', '.join(regressions)}")
+        return 1
+    print("\n✅ 성능 회귀 없음")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,11 +9,15 @@
 - 모터 토크 및 속도 응답
 """
 
+import argparse
+
 import numpy as np
 import matplotlib.pyplot as plt
 from dataclasses import dataclass
 from typing import Tuple, Optional
 
+import profiling
+
 
 @dataclass
 class BLDCMotorParams:
@@ -460,6 +464,16 @@ def print_motor_specs(params: BLDCMotorParams):
 
 def main():
     """메인 함수"""
+    parser = argparse.ArgumentParser(description="3상 BLDC 모터 시뮬레이션")
+    profiling.add_profile_arguments(parser, "bldc_motor_simulation")
+    args = parser.parse_args()
+
+    with profiling.profile_session(args):
+        return _run()
+
+
+def _run():
+    """시뮬레이션 실행, 결과 요약, 그래프 생성"""
     print("\n" + "=" * 60)
     print("    3상 BLDC 모터 시뮬레이션")
     print("    (3-Phase BLDC Motor Simulation)")
@@ -483,20 +497,22 @@ def main():
     # 시뮬레이터 생성 및 실행
     print("시뮬레이션 실행 중...")
     simulator = BLDCMotorSimulator(params)
-    results = simulator.simulate(
-        t_end=0.05,         # 50ms 시뮬레이션
-        dt=1e-6,            # 1us 시간 스텝
-        T_load=0.001        # 1mNm 부하
-    )
+    with profiling.stage("simulate"):
+        results = simulator.simulate(
+            t_end=0.05,         # 50ms 시뮬레이션
+            dt=1e-6,            # 1us 시간 스텝
+            T_load=0.001        # 1mNm 부하
+        )
 
     # 결과 요약
-    final_rpm = results['rpm'][-1]
-    max_current = max(
-        max(abs(results['i_a'])),
-        max(abs(results['i_b'])),
-        max(abs(results['i_c']))
-    )
-    avg_torque = np.mean(results['torque'][-1000:])
+    with profiling.stage("summary"):
+        final_rpm = results['rpm'][-1]
+        max_current = max(
+            max(abs(results['i_a'])),
+            max(abs(results['i_b'])),
+            max(abs(results['i_c']))
+        )
+        avg_torque = np.mean(results['torque'][-1000:])
 
     print("\n시뮬레이션 완료!")
     print("-" * 40)
@@ -507,9 +523,10 @@ def main():
 
     # 결과 시각화
     print("\n그래프를 생성합니다...")
-    plot_simulation_results(results, save_path='bldc_simulation_full.png')
-    plot_steady_state(results, start_time=0.04, duration=0.008,
-                      save_path='bldc_simulation_steady.png')
+    with profiling.stage("plot"):
+        plot_simulation_results(results, save_path='bldc_simulation_full.png')
+        plot_steady_state(results, start_time=0.04, duration=0.008,
+                          save_path='bldc_simulation_steady.png')
 
     return results
 
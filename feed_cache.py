@@ -0,0 +1,161 @@
+"""
+Local cache for news RSS feeds.
+
+Stores each feed body with its ETag/Last-Modified validators, so unchanged
+feeds can be revalidated with a conditional GET (304, no body), and keeps a
+table of every news item seen, keyed by link, so items can be deduplicated
+across runs.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+
+import metrics
+from ohlcv_cache import default_cache_path
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+class FeedCache:
+    """SQLite-backed feed body and news item store. Thread-safe."""
+
+    def __init__(self, path=None):
+        """
+        Args:
+            path (str): SQLite file path (default: feeds.sqlite in the finance_util cache directory)
+        """
+        if path is None:
+            path = default_cache_path('feeds.sqlite')
+
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory, exist_ok=True)
+
+        self.path = path
+        self.not_modified = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS feeds ("
+            " url TEXT PRIMARY KEY,"
+            " etag TEXT, last_modified TEXT,"
+            " body BLOB NOT NULL,"
+            " fetched_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS news_items ("
+            " link TEXT PRIMARY KEY,"
+            " symbol TEXT, title TEXT, publisher TEXT, published TEXT,"
+            " first_seen REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def conditional_headers(self, url):
+        """
+        Return If-None-Match / If-Modified-Since headers for a cached feed.
+
+        Args:
+            url (str): Full feed URL including the query string
+
+        Returns:
+            dict: Validator headers (empty if the feed is not cached)
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT etag, last_modified FROM feeds WHERE url = ?", (url,)).fetchone()
+        headers = {}
+        if row is not None:
+            if row[0]:
+                headers['If-None-Match'] = row[0]
+            if row[1]:
+                headers['If-Modified-Since'] = row[1]
+        return headers
+
+    def body(self, url):
+        """
+        Return the cached feed body for url after a 304 response.
+
+        Returns:
+            bytes or None: Cached body, or None if the feed is not cached
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT body FROM feeds WHERE url = ?", (url,)).fetchone()
+            if row is None:
+                return None
+            self.not_modified += 1
+            metrics.inc('cache_requests_total', cache='feed', result='hit')
+            self._conn.execute("UPDATE feeds SET fetched_at = ? WHERE url = ?", (time.time(), url))
+            self._conn.commit()
+            return row[0]
+
+    def store(self, url, body, etag=None, last_modified=None):
+        """
+        Store a freshly downloaded feed body and its validators.
+
+        Args:
+            url (str): Full feed URL including the query string
+            body (bytes): Feed document
+            etag (str): ETag response header
+            last_modified (str): Last-Modified response header
+        """
+        metrics.inc('cache_requests_total', cache='feed', result='miss')
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO feeds VALUES (?, ?, ?, ?, ?)",
+                (url, etag, last_modified, body, time.time())
+            )
+            self._conn.commit()
+
+    def is_known(self, link):
+        """Return True if a news item with this link was recorded by an earlier call."""
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM news_items WHERE link = ?", (link,)).fetchone() is not None
+
+    def record_items(self, symbol, items):
+        """
+        Remember news items by link (items already known keep their first_seen time).
+
+        Args:
+            symbol (str): Stock ticker symbol the items were fetched for
+            items (list): News item dicts (see finance_util.fetch_stock_news)
+        """
+        now = time.time()
+        rows = [(item['link'], symbol, item['title'], item['publisher'], item['published'], now)
+                for item in items]
+        with self._lock:
+            self._conn.executemany("INSERT OR IGNORE INTO news_items VALUES (?, ?, ?, ?, ?, ?)", rows)
+            self._conn.commit()
+
+    def close(self):
+        """Close the underlying SQLite connection."""
+        with self._lock:
+            self._conn.close()
+
+
+def get_default_feed_cache():
+    """
+    Return the process-wide feed cache used by finance_util news fetchers.
+
+    Returns:
+        FeedCache: Shared cache instance (created on first use)
+    """
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = FeedCache()
+        return _default_cache
+
+
+def set_default_feed_cache(cache):
+    """
+    Replace the process-wide feed cache.
+
+    Args:
+        cache (FeedCache): New shared cache, or None to recreate it on next use
+    """
+    global _default_cache
+    with _default_cache_lock:
+        _default_cache = cache
@@ -0,0 +1,68 @@
+"""
+Finance utility module for calculating financial ratios and tracking daily stock data.
+
+The public names are loaded lazily from submodules on first access, so a
+script only pays for the dependencies of the functions it uses:
+
+    - per: calculate_per and the PER error codes (standard library only)
+    - per_vectorized: calculate_per_vectorized, calculate_per_for_stocks (NumPy, pandas)
+    - excel: export_to_excel and the tracker workbook writers (pandas)
+    - transport: the shared HTTP session (requests)
+    - prices: daily and intraday chart fetchers (NumPy, requests)
+    - history: fetch_stock_history (pandas)
+    - news: news fetchers and fetch_price_and_news_async (requests)
+"""
+
+import importlib
+
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    'PER_OK': 'per',
+    'PER_ERROR_NOT_NUMERIC': 'per',
+    'PER_ERROR_NON_POSITIVE_EPS': 'per',
+    'PER_ERROR_NEGATIVE_PRICE': 'per',
+    'PER_ERROR_MESSAGES': 'per',
+    'calculate_per': 'per',
+    'calculate_per_vectorized': 'per_vectorized',
+    'calculate_per_for_stocks': 'per_vectorized',
+    'export_to_excel': 'excel',
+    'TRACKER_RECORD_KEYS': 'excel',
+    'append_daily_record': 'excel',
+    'append_daily_records': 'excel',
+    'HTTP_POOL_SIZE': 'transport',
+    'get_http_session': 'transport',
+    'YAHOO_CHART_URL': 'prices',
+    'CHART_HEADERS': 'prices',
+    'CHART_FIELDS': 'prices',
+    'fetch_daily_stock_data': 'prices',
+    'fetch_daily_stock_data_async': 'prices',
+    'fetch_daily_stock_data_many': 'prices',
+    'INTRADAY_INTERVALS': 'prices',
+    'fetch_intraday_bars': 'prices',
+    'HISTORY_CHUNK_DAYS': 'history',
+    'HISTORY_DEFAULT_CHUNK_DAYS': 'history',
+    'fetch_stock_history': 'history',
+    'GOOGLE_NEWS_RSS_URL': 'news',
+    'NEWS_HEADERS': 'news',
+    'fetch_stock_news': 'news',
+    'fetch_stock_news_async': 'news',
+    'fetch_stock_news_many': 'news',
+    'fetch_price_and_news_async': 'news',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'{__name__}.{module}'), name)
+    # Cache so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -0,0 +1,33 @@
+"""
+Example usage: python -m finance_util
+"""
+
+from finance_util import calculate_per, calculate_per_for_stocks, export_to_excel
+
+
+# Example usage for single stock
+price = 50000
+earnings_per_share = 2500
+
+per = calculate_per(price, earnings_per_share)
+print(f"Stock Price: {price}")
+print(f"EPS: {earnings_per_share}")
+print(f"PER: {per:.2f}")
+
+# Example usage for multiple stocks
+print("\n=== Multiple Stocks Analysis ===")
+stocks = [
+    {'name': 'Samsung Electronics', 'price': 70000, 'eps': 3500},
+    {'name': 'SK Hynix', 'price': 120000, 'eps': 8000},
+    {'name': 'NAVER', 'price': 250000, 'eps': 12500},
+    {'name': 'Kakao', 'price': 90000, 'eps': 4500},
+    {'name': 'Hyundai Motor', 'price': 180000, 'eps': 15000}
+]
+
+df = calculate_per_for_stocks(stocks)
+print(df)
+
+# Export to Excel
+print("\n=== Exporting to Excel ===")
+output_file = export_to_excel(stocks)
+print(f"Excel file created: {output_file}")
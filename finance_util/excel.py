@@ -0,0 +1,152 @@
+"""
+Excel export of PER tables and of the daily tracker workbook.
+"""
+
+import os
+
+import pandas as pd
+
+import metrics
+from finance_util.per_vectorized import calculate_per_for_stocks
+
+
+def export_to_excel(stocks_data, filename='stock_report.xlsx', output_dir=None):
+    """
+    Calculate PER for multiple stocks and export to Excel file.
+
+    Args:
+        stocks_data (list): List of dictionaries containing stock information.
+                           Each dictionary should have 'name', 'price', and 'eps' keys.
+        filename (str): Output Excel filename (default: 'stock_report.xlsx')
+        output_dir (str): Output directory path (default: current directory)
+
+    Returns:
+        str: Path to the created Excel file
+
+    Raises:
+        ValueError: If stocks_data is empty or has invalid format
+    """
+    df = calculate_per_for_stocks(stocks_data)
+
+    # Create output directory if it doesn't exist
+    if output_dir and not os.path.exists(output_dir):
+        os.makedirs(output_dir)
+
+    # Combine directory and filename
+    if output_dir:
+        filepath = os.path.join(output_dir, filename)
+    else:
+        filepath = filename
+
+    with metrics.timer('excel_write_seconds', writer='export_to_excel'):
+        df.to_excel(filepath, index=False, engine='openpyxl')
+    return filepath
+
+
+TRACKER_RECORD_KEYS = ['date', 'open', 'close', 'high', 'low', 'volume', 'change', 'change_pct', 'prev_close']
+
+
+def _tracker_rows(records, news_summaries):
+    """Validate stock_data dicts and build tracker rows with the Korean workbook columns."""
+    for stock_data in records:
+        if not stock_data:
+            raise ValueError("stock_data cannot be empty")
+        for key in TRACKER_RECORD_KEYS:
+            if key not in stock_data:
+                raise ValueError(f"stock_data must contain '{key}' key")
+
+    return pd.DataFrame({
+        '날짜': [r['date'] for r in records],
+        '전일종가': [r['prev_close'] for r in records],
+        '시가': [r['open'] for r in records],
+        '종가': [r['close'] for r in records],
+        '최고가': [r['high'] for r in records],
+        '최저가': [r['low'] for r in records],
+        '거래량': [r['volume'] for r in records],
+        '변동가격': [r['change'] for r in records],
+        '변동률(%)': [r['change_pct'] for r in records],
+        '뉴스/이유': list(news_summaries)
+    })
+
+
+def append_daily_record(stock_data, news_summary, filename='nvda_daily_tracker.xlsx', output_dir=None):
+    """
+    Append daily stock record to Excel file, creating it if it doesn't exist.
+
+    Args:
+        stock_data (dict): Dictionary containing stock data (from fetch_daily_stock_data)
+        news_summary (str): Summary of news/reasons for the day's price movement
+        filename (str): Output Excel filename (default: 'nvda_daily_tracker.xlsx')
+        output_dir (str): Output directory path (default: current directory)
+
+    Returns:
+        str: Path to the Excel file
+
+    Raises:
+        ValueError: If stock_data is invalid
+    """
+    if not stock_data:
+        raise ValueError("stock_data cannot be empty")
+
+    return append_daily_records([stock_data], [news_summary], filename, output_dir)
+
+
+def append_daily_records(records, news_summaries, filename='nvda_daily_tracker.xlsx', output_dir=None):
+    """
+    Merge a batch of daily stock records into an Excel file in one read and one write.
+
+    The result is the same as calling append_daily_record for each record in
+    order: a date already in the file is replaced, a new date is added, a
+    date repeated within the batch keeps its last record, and rows are sorted
+    most recent first.
+
+    Args:
+        records (list): Stock data dicts (from fetch_daily_stock_data or fetch_stock_history rows)
+        news_summaries (list): News summary strings, one per record
+        filename (str): Output Excel filename (default: 'nvda_daily_tracker.xlsx')
+        output_dir (str): Output directory path (default: current directory)
+
+    Returns:
+        str: Path to the Excel file
+
+    Raises:
+        ValueError: If records is empty, the lengths differ, or a record is invalid
+    """
+    records = list(records)
+    news_summaries = list(news_summaries)
+    if not records:
+        raise ValueError("records cannot be empty")
+    if len(records) != len(news_summaries):
+        raise ValueError(
+            f"records and news_summaries must have the same length ({len(records)} != {len(news_summaries)})"
+        )
+
+    new_rows = _tracker_rows(records, news_summaries)
+    # fetch_stock_history rows carry Timestamps; the workbook stores 'YYYY-MM-DD' strings
+    new_rows['날짜'] = pd.to_datetime(new_rows['날짜']).dt.strftime('%Y-%m-%d')
+    new_rows = new_rows.drop_duplicates('날짜', keep='last')
+
+    # Create output directory if it doesn't exist
+    if output_dir and not os.path.exists(output_dir):
+        os.makedirs(output_dir)
+
+    # Combine directory and filename
+    filepath = os.path.join(output_dir, filename) if output_dir else filename
+
+    if os.path.exists(filepath):
+        existing_df = pd.read_excel(filepath, engine='openpyxl')
+        # Replace existing dates with the new rows, keep every other existing row
+        kept = existing_df[~existing_df['날짜'].isin(new_rows['날짜'])]
+        df = pd.concat([kept, new_rows], ignore_index=True) if len(kept) else new_rows
+    else:
+        df = new_rows
+
+    # Sort by date (most recent first)
+    df['날짜'] = pd.to_datetime(df['날짜'])
+    df = df.sort_values('날짜', ascending=False, kind='stable')
+    df['날짜'] = df['날짜'].dt.strftime('%Y-%m-%d')
+
+    # Save to Excel
+    with metrics.timer('excel_write_seconds', writer='append_daily_records'):
+        df.to_excel(filepath, index=False, engine='openpyxl')
+    return filepath
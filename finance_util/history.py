@@ -0,0 +1,139 @@
+"""
+Multi-year daily history from the Yahoo chart endpoint, fetched in chunks.
+"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+from finance_util.prices import _chart_columns, _fetch_chart_result, _invalid_bars, _round_cents
+from finance_util.transport import _errors_as_value_error, _parse_date
+from ohlcv_cache import get_default_cache
+
+
+# Longest period1..period2 span (days) requested per chart call for each interval.
+# Yahoo rejects longer intraday ranges; daily and longer bars are chunked by decade.
+HISTORY_CHUNK_DAYS = {
+    '1m': 7,
+    '2m': 60, '5m': 60, '15m': 60, '30m': 60, '90m': 60,
+    '60m': 730, '1h': 730,
+}
+HISTORY_DEFAULT_CHUNK_DAYS = 3650
+
+
+def fetch_stock_history(symbol, start, end=None, interval='1d', session=None, use_cache=True):
+    """
+    Fetch OHLCV history for a date range using as few chart requests as possible.
+
+    The whole range is requested in one chart call (split into chunks of
+    HISTORY_CHUNK_DAYS for intraday intervals), and prev_close/change/change_pct
+    are computed over the whole range at once. Bars with missing open, close,
+    high or low prices are dropped with a warning. Daily bars are also written
+    to the local OHLCV cache, so later fetch_daily_stock_data calls for those
+    dates need no network request.
+
+    Args:
+        symbol (str): Stock ticker symbol (e.g., 'NVDA')
+        start (str or datetime): First date of the range (inclusive)
+                                Format: 'YYYY-MM-DD' or datetime object
+        end (str or datetime): Last date of the range (inclusive, default: today)
+        interval (str): Bar interval accepted by the chart API (default: '1d')
+        session (requests.Session): HTTP session to use (default: shared session)
+        use_cache (bool): Store daily bars in the local OHLCV cache (default: True)
+
+    Returns:
+        pandas.DataFrame: One row per bar, oldest first, with columns
+                          date (datetime64, exchange local time), open, high, low,
+                          close, prev_close, change, change_pct (float64) and
+                          volume (int64). Prices are rounded to 2 decimals like
+                          fetch_daily_stock_data.
+
+    Raises:
+        ValueError: If symbol or dates are invalid or data cannot be fetched
+    """
+    if not symbol:
+        raise ValueError("Symbol cannot be empty")
+
+    start_date = _parse_date(start)
+    end_date = _parse_date(end)
+    if start_date.date() > end_date.date():
+        raise ValueError("start must be on or before end")
+
+    columns = ['date', 'open', 'high', 'low', 'close', 'volume', 'prev_close', 'change', 'change_pct']
+
+    with _errors_as_value_error(symbol):
+        # Start a week early so the first bar in range has a real previous close
+        range_start = datetime.combine(start_date.date(), datetime.min.time()) - timedelta(days=7)
+        range_end = datetime.combine(end_date.date(), datetime.min.time()) + timedelta(days=1)
+        chunk = timedelta(days=HISTORY_CHUNK_DAYS.get(interval, HISTORY_DEFAULT_CHUNK_DAYS))
+
+        results = []
+        chunk_start = range_start
+        while chunk_start < range_end:
+            chunk_end = min(chunk_start + chunk, range_end)
+            params = {
+                'period1': int(chunk_start.timestamp()),
+                'period2': int(chunk_end.timestamp()),
+                'interval': interval,
+                'includePrePost': 'false'
+            }
+            try:
+                results.append(_fetch_chart_result(symbol, params, session))
+            except ValueError as e:
+                # An empty chunk (e.g. a holiday-only week) is not an error for a range
+                if 'No trading data' not in str(e):
+                    raise
+            chunk_start = chunk_end
+
+        if not results:
+            raise ValueError(f"No trading data available for {symbol}")
+
+        values = _chart_columns(results)
+        dates = values['time']
+        if interval.endswith(('d', 'wk', 'mo')):
+            dates = dates.astype('datetime64[D]')
+        invalid = _invalid_bars(values)
+
+        # Previous close from the raw series; fall back to open like fetch_daily_stock_data
+        prev_close = np.empty_like(values['close'])
+        prev_close[0] = np.nan
+        prev_close[1:] = values['close'][:-1]
+        prev_close = np.where(np.isnan(prev_close), values['open'], prev_close)
+
+        change = values['close'] - prev_close
+        with np.errstate(divide='ignore', invalid='ignore'):
+            change_pct = np.where(prev_close > 0, change / prev_close * 100, 0.0)
+
+        df = pd.DataFrame({
+            'date': dates.astype('datetime64[ns]'),
+            'open': _round_cents(values['open']),
+            'high': _round_cents(values['high']),
+            'low': _round_cents(values['low']),
+            'close': _round_cents(values['close']),
+            'volume': np.nan_to_num(values['volume']).astype(np.int64),
+            'prev_close': _round_cents(prev_close),
+            'change': _round_cents(change),
+            'change_pct': _round_cents(change_pct),
+        }, columns=columns)
+
+        # Column-wise version of the per-day price checks
+        if invalid.any():
+            skipped = ', '.join(df.loc[invalid, 'date'].dt.strftime('%Y-%m-%d'))
+            print(f"⚠️  Skipping {int(invalid.sum())} bar(s) with missing or inconsistent price data "
+                  f"for {symbol}: {skipped}")
+            df = df[~invalid]
+
+        in_range = ((df['date'] >= pd.Timestamp(start_date.date()))
+                    & (df['date'] < pd.Timestamp(end_date.date()) + pd.Timedelta(days=1)))
+        df = df[in_range].reset_index(drop=True)
+
+        if df.empty:
+            raise ValueError(f"No trading data available for {symbol} between "
+                             f"{start_date.strftime('%Y-%m-%d')} and {end_date.strftime('%Y-%m-%d')}")
+
+    if use_cache and interval == '1d':
+        records = df.assign(date=df['date'].dt.strftime('%Y-%m-%d')).to_dict('records')
+        get_default_cache().put_many(symbol, [(record['date'], record) for record in records])
+
+    return df
@@ -0,0 +1,389 @@
+"""
+Stock news from the Google News RSS search feed.
+"""
+
+import asyncio
+import io
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from xml.etree import ElementTree as ET
+
+import requests
+
+import metrics
+import profiling
+from feed_cache import get_default_feed_cache
+from finance_util.prices import fetch_daily_stock_data_async
+from finance_util.transport import _get_with_retries, _get_with_retries_async, _parse_date, get_http_session
+from http_retry import get_scheduler
+from symbol_directory import load_symbol_directory
+
+
+# FINANCE_UTIL_NEWS_URL points the fetchers at a stand-in server (see stub_server.py)
+GOOGLE_NEWS_RSS_URL = os.environ.get('FINANCE_UTIL_NEWS_URL', "https://news.google.com/rss/search")
+
+NEWS_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36',
+    'Accept': 'application/xml,text/xml,application/rss+xml',
+    'Accept-Language': 'en-US,en;q=0.9'
+}
+
+
+def _news_query(symbols):
+    """
+    Google News search query for one or more symbols.
+
+    A single symbol searches for '<company> stock'; several symbols are
+    combined into one OR query, e.g. '("NVIDIA" OR "Apple") stock'.
+    """
+    directory = load_symbol_directory()
+    terms = [directory.search_term(symbol) for symbol in symbols]
+    if len(terms) == 1:
+        return f'{terms[0]} stock'
+    return '(' + ' OR '.join(f'"{term}"' for term in terms) + ') stock'
+
+
+def _news_search_params(query):
+    """Google News RSS query parameters for a search query."""
+    return {
+        'q': query,
+        'hl': 'en-US',
+        'gl': 'US',
+        'ceid': 'US:en'
+    }
+
+
+def _news_feed_url(query):
+    """Full Google News RSS URL for a search query (used as the feed cache key)."""
+    return requests.Request('GET', GOOGLE_NEWS_RSS_URL, params=_news_search_params(query)).prepare().url
+
+
+def _feed_body(feed_cache, url, response):
+    """Return the feed body for a response, using the cached body on 304 Not Modified."""
+    if response.status_code == 304:
+        body = feed_cache.body(url)
+        if body is not None:
+            return body
+    feed_cache.store(url, response.content, response.headers.get('ETag'), response.headers.get('Last-Modified'))
+    return response.content
+
+
+def _download_news_feed(query, session=None):
+    """
+    Download the news feed for a search query with a conditional GET.
+
+    Returns:
+        bytes: RSS document (the cached copy when the server answers 304)
+
+    Raises:
+        requests.exceptions.RequestException: If the request fails after all retries
+    """
+    feed_cache = get_default_feed_cache()
+    url = _news_feed_url(query)
+    headers = {**NEWS_HEADERS, **feed_cache.conditional_headers(url)}
+    with profiling.stage('news'):
+        response = _get_with_retries(url, None, headers, session, verbose=False)
+    return _feed_body(feed_cache, url, response)
+
+
+async def _download_news_feed_async(query, session=None):
+    """Async version of _download_news_feed."""
+    feed_cache = get_default_feed_cache()
+    url = _news_feed_url(query)
+    headers = {**NEWS_HEADERS, **feed_cache.conditional_headers(url)}
+    with profiling.stage('news'):
+        response = await _get_with_retries_async(url, None, headers, session, verbose=False)
+    return _feed_body(feed_cache, url, response)
+
+
+def _iter_feed_items(content, limit):
+    """
+    Yield up to limit <item> elements from an RSS document, parsing incrementally.
+
+    Parsing stops as soon as the caller stops iterating, so the rest of the
+    document is never turned into elements.
+    """
+    count = 0
+    for _, elem in ET.iterparse(io.BytesIO(content), events=('end',)):
+        if elem.tag != 'item':
+            continue
+        yield elem
+        elem.clear()
+        count += 1
+        if count >= limit:
+            return
+
+
+def _parse_news_items(content, target_date, max_results, exclude=None):
+    """
+    Extract up to max_results items published within 3 days of target_date from an RSS feed.
+
+    Only the first max_results * 2 items of the feed are considered, and
+    parsing stops as soon as max_results matching items have been found.
+    Items with a link already returned are skipped.
+
+    Args:
+        content (bytes): RSS XML document
+        target_date (datetime.date): Date to match publication dates against
+        max_results (int): Maximum number of news items to return
+        exclude (callable): Optional predicate; items whose link it accepts are skipped
+
+    Returns:
+        list: News item dicts (see fetch_stock_news)
+    """
+    with metrics.timer('parse_seconds', kind='news'):
+        news_items = []
+        links = set()
+        for item in _iter_feed_items(content, max_results * 2):
+            try:
+                title = item.find('title').text
+                link = item.find('link').text
+                pub_date_str = item.find('pubDate').text
+
+                # Parse publication date (RFC 822 format)
+                pub_date = parsedate_to_datetime(pub_date_str)
+
+                # Extract publisher from source tag if available
+                source = item.find('source')
+                publisher = source.text if source is not None else 'Unknown'
+
+                if link in links or (exclude is not None and exclude(link)):
+                    continue
+
+                # Filter by date (within 3 days of target)
+                if abs((pub_date.date() - target_date).days) <= 3:
+                    links.add(link)
+                    news_items.append({
+                        'title': title,
+                        'publisher': publisher,
+                        'link': link,
+                        'published': pub_date.strftime('%Y-%m-%d %H:%M:%S')
+                    })
+
+                if len(news_items) >= max_results:
+                    break
+            except (AttributeError, ValueError):
+                continue
+
+    return news_items
+
+
+def _news_items_from_feed(symbol, content, target_date, max_results, new_only):
+    """Parse a feed, optionally dropping items seen in earlier runs, and remember the result."""
+    feed_cache = get_default_feed_cache()
+    with profiling.stage('news'):
+        news_items = _parse_news_items(content, target_date, max_results,
+                                       exclude=feed_cache.is_known if new_only else None)
+        feed_cache.record_items(symbol, news_items)
+    return news_items
+
+
+def fetch_stock_news(symbol, date=None, max_results=5, new_only=False):
+    """
+    Fetch news for a given stock symbol using Google News RSS.
+
+    The feed is revalidated with ETag/Last-Modified against a local feed cache
+    (see feed_cache.get_default_feed_cache), so an unchanged feed costs a 304.
+    Returned items are remembered by link across runs.
+
+    Args:
+        symbol (str): Stock ticker symbol (e.g., 'NVDA')
+        date (str or datetime): Date to fetch news for (default: today)
+                               Format: 'YYYY-MM-DD' or datetime object
+        max_results (int): Maximum number of news items to return (default: 5)
+        new_only (bool): Skip items returned by earlier calls (default: False)
+
+    Returns:
+        list: List of dictionaries containing news items with keys:
+              - title: News headline
+              - publisher: News source
+              - link: URL to the news article
+              - published: Publication timestamp
+              An empty list is returned if the news cannot be fetched.
+
+    Raises:
+        ValueError: If symbol is empty
+    """
+    if not symbol:
+        raise ValueError("Symbol cannot be empty")
+
+    try:
+        target_date = _parse_date(date).date()
+        content = _download_news_feed(_news_query([symbol]))
+        return _news_items_from_feed(symbol, content, target_date, max_results, new_only)
+
+    except requests.exceptions.RequestException:
+        # If news fetch fails, return empty list instead of raising error
+        print(f"Warning: Could not fetch news for {symbol} after {get_scheduler().max_retries} retries")
+        return []
+    except Exception as e:
+        print(f"Warning: Error fetching news for {symbol}: {str(e)}")
+        return []
+
+
+async def fetch_stock_news_async(symbol, date=None, max_results=5, new_only=False):
+    """
+    Async version of fetch_stock_news (same arguments and return value).
+    """
+    if not symbol:
+        raise ValueError("Symbol cannot be empty")
+
+    try:
+        target_date = _parse_date(date).date()
+        content = await _download_news_feed_async(_news_query([symbol]))
+        return _news_items_from_feed(symbol, content, target_date, max_results, new_only)
+
+    except requests.exceptions.RequestException:
+        print(f"Warning: Could not fetch news for {symbol} after {get_scheduler().max_retries} retries")
+        return []
+    except Exception as e:
+        print(f"Warning: Error fetching news for {symbol}: {str(e)}")
+        return []
+
+
+def _news_batches(symbols, batch_size):
+    """Group symbols into OR-query batches; symbols missing from the directory are queried alone."""
+    directory = load_symbol_directory()
+    known = [symbol for symbol in symbols if symbol in directory]
+    batches = [known[i:i + batch_size] for i in range(0, len(known), batch_size)]
+    batches.extend([symbol] for symbol in symbols if symbol not in directory)
+    return batches
+
+
+def _fetch_news_batch(batch, target_date, max_results, new_only, session=None):
+    """
+    Download one (possibly combined) news feed and split its items per symbol.
+
+    Items of a combined feed are assigned to every symbol of the batch whose
+    company name, alias or ticker appears in the headline; items that mention
+    none of them are dropped.
+
+    Returns:
+        dict: symbol -> list of news items (see fetch_stock_news)
+    """
+    content = _download_news_feed(_news_query(batch), session)
+    if len(batch) == 1:
+        return {batch[0]: _news_items_from_feed(batch[0], content, target_date, max_results, new_only)}
+
+    feed_cache = get_default_feed_cache()
+    directory = load_symbol_directory()
+    items = _parse_news_items(content, target_date, max_results * len(batch),
+                              exclude=feed_cache.is_known if new_only else None)
+
+    split = {symbol: [] for symbol in batch}
+    for item in items:
+        mentioned = directory.match(item['title'], batch)
+        for symbol in batch:
+            if symbol.upper() in mentioned and len(split[symbol]) < max_results:
+                split[symbol].append(item)
+
+    for symbol, news_items in split.items():
+        feed_cache.record_items(symbol, news_items)
+    return split
+
+
+def fetch_stock_news_many(symbols, date=None, max_results=5, batch_size=5, max_workers=4, new_only=False):
+    """
+    Fetch news for several symbols with combined Google News queries.
+
+    Symbols found in the symbol directory (see symbol_directory.load_symbol_directory)
+    are grouped batch_size at a time into one OR query, e.g. '("NVIDIA" OR "Apple") stock',
+    and the returned items are split back out per symbol by matching company
+    names in the headlines. Symbols missing from the directory are queried on
+    their own. The queries run concurrently on a bounded thread pool.
+
+    Args:
+        symbols (list): Stock ticker symbols (e.g., ['NVDA', 'AAPL'])
+        date (str or datetime): Date to fetch news for (default: today)
+                               Format: 'YYYY-MM-DD' or datetime object
+        max_results (int): Maximum number of news items per symbol (default: 5)
+        batch_size (int): Maximum number of companies per query (default: 5)
+        max_workers (int): Maximum number of concurrent requests (default: 4)
+        new_only (bool): Skip items returned by earlier calls (default: False)
+
+    Returns:
+        dict: symbol -> list of news items (see fetch_stock_news), in input order.
+              Symbols whose feed could not be fetched map to an empty list.
+
+    Raises:
+        ValueError: If symbols is empty, or batch_size or max_workers is less than 1
+    """
+    if not symbols:
+        raise ValueError("symbols cannot be empty")
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+
+    symbols = list(dict.fromkeys(symbols))
+    target_date = _parse_date(date).date()
+    batches = _news_batches(symbols, batch_size)
+    session = get_http_session()
+    results = {}
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(batches))) as executor:
+        futures = {
+            executor.submit(_fetch_news_batch, batch, target_date, max_results, new_only, session): batch
+            for batch in batches
+        }
+        for future in as_completed(futures):
+            batch = futures[future]
+            try:
+                results.update(future.result())
+            except requests.exceptions.RequestException:
+                print(f"Warning: Could not fetch news for {', '.join(batch)} "
+                      f"after {get_scheduler().max_retries} retries")
+            except Exception as e:
+                print(f"Warning: Error fetching news for {', '.join(batch)}: {str(e)}")
+
+    return {symbol: results.get(symbol, []) for symbol in symbols}
+
+
+async def fetch_price_and_news_async(symbol, date=None, max_results=5, new_only=False):
+    """
+    Fetch daily stock data and news for one symbol concurrently.
+
+    The price request and the news feed download run at the same time; the
+    news items are then filtered against the trading date the price resolved
+    to, exactly as fetch_stock_news(symbol, stock_data['date']) would.
+
+    Args:
+        symbol (str): Stock ticker symbol (e.g., 'NVDA')
+        date (str or datetime): Date to fetch data for (default: today)
+        max_results (int): Maximum number of news items to return (default: 5)
+        new_only (bool): Skip news items returned by earlier calls (default: False)
+
+    Returns:
+        tuple: (stock_data, news_items) in the fetch_daily_stock_data and
+               fetch_stock_news formats
+
+    Raises:
+        ValueError: If the stock data cannot be fetched (news failures yield [])
+    """
+    async def download_feed():
+        try:
+            return await _download_news_feed_async(_news_query([symbol]))
+        except requests.exceptions.RequestException:
+            print(f"Warning: Could not fetch news for {symbol} after {get_scheduler().max_retries} retries")
+            return None
+
+    stock_data, feed = await asyncio.gather(
+        fetch_daily_stock_data_async(symbol, date), download_feed(), return_exceptions=True
+    )
+    if isinstance(stock_data, BaseException):
+        raise stock_data
+    if isinstance(feed, BaseException):
+        print(f"Warning: Error fetching news for {symbol}: {str(feed)}")
+        feed = None
+
+    news_items = []
+    if feed is not None:
+        try:
+            trading_date = datetime.strptime(stock_data['date'], '%Y-%m-%d').date()
+            news_items = _news_items_from_feed(symbol, feed, trading_date, max_results, new_only)
+        except Exception as e:
+            print(f"Warning: Error fetching news for {symbol}: {str(e)}")
+
+    return stock_data, news_items
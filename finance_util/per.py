@@ -0,0 +1,45 @@
+"""
+Scalar PER (Price to Earnings Ratio) calculation and its error codes.
+
+Pure Python so that importing it does not load NumPy or pandas.
+"""
+
+
+# Error codes reported in the 'PER Error' column by calculate_per_vectorized
+PER_OK = 0
+PER_ERROR_NOT_NUMERIC = 1
+PER_ERROR_NON_POSITIVE_EPS = 2
+PER_ERROR_NEGATIVE_PRICE = 3
+
+PER_ERROR_MESSAGES = {
+    PER_ERROR_NOT_NUMERIC: "Stock price and EPS must be numeric values",
+    PER_ERROR_NON_POSITIVE_EPS: "EPS must be greater than zero",
+    PER_ERROR_NEGATIVE_PRICE: "Stock price cannot be negative",
+}
+
+
+def calculate_per(stock_price, eps):
+    """
+    Calculate PER (Price to Earnings Ratio).
+
+    Args:
+        stock_price (float): Current stock price
+        eps (float): Earnings Per Share
+
+    Returns:
+        float: PER value (stock_price / eps)
+
+    Raises:
+        ValueError: If eps is zero or negative
+        TypeError: If inputs are not numeric
+    """
+    if not isinstance(stock_price, (int, float)) or not isinstance(eps, (int, float)):
+        raise TypeError(PER_ERROR_MESSAGES[PER_ERROR_NOT_NUMERIC])
+
+    if eps <= 0:
+        raise ValueError(PER_ERROR_MESSAGES[PER_ERROR_NON_POSITIVE_EPS])
+
+    if stock_price < 0:
+        raise ValueError(PER_ERROR_MESSAGES[PER_ERROR_NEGATIVE_PRICE])
+
+    return stock_price / eps
@@ -0,0 +1,162 @@
+"""
+Vectorized PER calculation over many stocks.
+"""
+
+import numpy as np
+import pandas as pd
+
+from finance_util.per import (
+    PER_ERROR_MESSAGES,
+    PER_ERROR_NEGATIVE_PRICE,
+    PER_ERROR_NON_POSITIVE_EPS,
+    PER_ERROR_NOT_NUMERIC,
+    PER_OK,
+)
+
+
+def _as_float_array(values):
+    """
+    Convert price/EPS values to a float64 array plus a mask of numeric entries.
+
+    Numeric dtypes are converted in one pass. Object arrays (e.g. values taken
+    from a list of dicts) are checked element by element with the same
+    isinstance rule as calculate_per, so non-numeric entries are flagged
+    instead of raising.
+    """
+    if isinstance(values, (pd.Series, pd.Index)):
+        values = values.to_numpy()
+    arr = np.asarray(values)
+    if arr.ndim != 1:
+        raise ValueError("Price and EPS must be one-dimensional")
+
+    if arr.dtype.kind in 'biuf':
+        return arr.astype(np.float64, copy=False), np.ones(len(arr), dtype=bool)
+
+    numeric = np.zeros(len(arr), dtype=bool)
+    if arr.dtype == object:
+        numeric = np.fromiter((isinstance(v, (int, float)) for v in arr), dtype=bool, count=len(arr))
+
+    out = np.full(len(arr), np.nan)
+    out[numeric] = arr[numeric].astype(np.float64)
+    return out, numeric
+
+
+def _round_builtin(values, decimals):
+    """
+    Round a float array exactly like the builtin round(value, decimals), vectorized.
+
+    np.round scales by 10**decimals before rounding and can land one unit off
+    the builtin near a tie (24132.24 / 387.2 -> 62.32 vs 62.33). Away from a
+    tie both agree, so only values whose scaled fraction is within rounding
+    error of .5 go through the builtin.
+    """
+    out = np.round(values, decimals)
+    with np.errstate(invalid='ignore', over='ignore'):
+        scaled = values * 10.0 ** decimals
+        near_tie = np.abs(np.abs(scaled - np.trunc(scaled)) - 0.5) <= 1e-9 * np.maximum(1.0, np.abs(scaled))
+    ties = np.flatnonzero(near_tie)
+    out[ties] = [round(value, decimals) for value in values[ties].tolist()]
+    return out
+
+
+def calculate_per_vectorized(prices, eps=None, price_col='price', eps_col='eps', decimals=None):
+    """
+    Calculate PER for many stocks in a single vectorized pass.
+
+    Args:
+        prices (array-like, pandas.Series or pandas.DataFrame): Stock prices, or a
+                DataFrame holding both the price and EPS columns
+        eps (array-like or pandas.Series): Earnings Per Share (omit when prices is a DataFrame)
+        price_col (str): Price column name when prices is a DataFrame (default: 'price')
+        eps_col (str): EPS column name when prices is a DataFrame (default: 'eps')
+        decimals (int): Round PER to this many decimals with the builtin round(),
+                        so results match round(calculate_per(price, eps), decimals)
+                        exactly (default: no rounding)
+
+    Returns:
+        pandas.DataFrame: DataFrame with two columns, index aligned with the input:
+                          - PER: float64 PER value, NaN where the row is invalid
+                          - PER Error: int8 error code (PER_OK or one of PER_ERROR_*,
+                            see PER_ERROR_MESSAGES)
+
+    Raises:
+        ValueError: If the inputs are missing or have different lengths
+    """
+    index = None
+    if isinstance(prices, pd.DataFrame):
+        if eps is not None:
+            raise ValueError("eps must be omitted when prices is a DataFrame")
+        if price_col not in prices.columns or eps_col not in prices.columns:
+            raise ValueError(f"DataFrame must have '{price_col}' and '{eps_col}' columns")
+        index = prices.index
+        prices, eps = prices[price_col], prices[eps_col]
+    elif eps is None:
+        raise ValueError("eps is required unless prices is a DataFrame")
+    elif isinstance(prices, pd.Series):
+        index = prices.index
+    elif isinstance(eps, pd.Series):
+        index = eps.index
+
+    price_arr, price_ok = _as_float_array(prices)
+    eps_arr, eps_ok = _as_float_array(eps)
+    if len(price_arr) != len(eps_arr):
+        raise ValueError("Price and EPS must have the same length")
+
+    # Same precedence as calculate_per: type check, then EPS, then price
+    codes = np.full(len(price_arr), PER_OK, dtype=np.int8)
+    codes[price_arr < 0] = PER_ERROR_NEGATIVE_PRICE
+    codes[eps_arr <= 0] = PER_ERROR_NON_POSITIVE_EPS
+    codes[~(price_ok & eps_ok)] = PER_ERROR_NOT_NUMERIC
+
+    per = np.full(len(price_arr), np.nan)
+    np.divide(price_arr, eps_arr, out=per, where=codes == PER_OK)
+    if decimals is not None:
+        per = _round_builtin(per, decimals)
+
+    return pd.DataFrame({'PER': per, 'PER Error': codes}, index=index)
+
+
+def calculate_per_for_stocks(stocks_data):
+    """
+    Calculate PER for multiple stocks.
+
+    Args:
+        stocks_data (list): List of dictionaries containing stock information.
+                           Each dictionary should have 'name', 'price', and 'eps' keys.
+                           Example: [{'name': 'Samsung', 'price': 50000, 'eps': 2500}]
+
+    Returns:
+        pandas.DataFrame: DataFrame with stock name, price, EPS, and calculated PER
+
+    Raises:
+        ValueError: If stocks_data is empty or has invalid format
+    """
+    if not stocks_data:
+        raise ValueError("stocks_data cannot be empty")
+
+    for stock in stocks_data:
+        if not isinstance(stock, dict):
+            raise ValueError("Each stock must be a dictionary")
+
+        if 'name' not in stock or 'price' not in stock or 'eps' not in stock:
+            raise ValueError("Each stock must have 'name', 'price', and 'eps' keys")
+
+    count = len(stocks_data)
+    prices = np.fromiter((stock['price'] for stock in stocks_data), dtype=object, count=count)
+    eps = np.fromiter((stock['eps'] for stock in stocks_data), dtype=object, count=count)
+    result = calculate_per_vectorized(prices, eps, decimals=2)
+
+    # Keep the report format: invalid rows show the error message in the PER column
+    per = result['PER']
+    codes = result['PER Error'].to_numpy()
+    if (codes != PER_OK).any():
+        per = per.astype(object)
+        for code, message in PER_ERROR_MESSAGES.items():
+            per[codes == code] = f'Error: {message}'
+
+    return pd.DataFrame({
+        'Stock Name': [stock['name'] for stock in stocks_data],
+        'Price': list(prices),
+        'EPS': list(eps),
+        'PER': per.to_numpy()
+    })
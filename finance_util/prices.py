@@ -0,0 +1,445 @@
+"""
+Daily and intraday prices from the Yahoo chart endpoint.
+
+Chart payloads are parsed column-wise with NumPy; pandas is not needed on
+this path.
+"""
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+import numpy as np
+import requests
+
+import metrics
+import profiling
+from finance_util.transport import (
+    _errors_as_value_error,
+    _get_with_retries,
+    _get_with_retries_async,
+    _parse_date,
+    get_http_session,
+)
+from http_retry import get_scheduler
+from ohlcv_cache import get_default_cache
+
+
+# FINANCE_UTIL_CHART_URL points the fetchers at a stand-in server (see stub_server.py)
+YAHOO_CHART_URL = os.environ.get('FINANCE_UTIL_CHART_URL', "https://query1.finance.yahoo.com/v8/finance/chart/{symbol}")
+
+CHART_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36',
+    'Accept': 'application/json',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Connection': 'keep-alive',
+    'Cache-Control': 'no-cache'
+}
+
+
+def _validate_chart_payload(symbol, data):
+    """
+    Check a Yahoo chart API payload and return its first result.
+
+    Returns:
+        dict: data['chart']['result'][0] with timestamp and OHLCV quote fields present
+
+    Raises:
+        ValueError: If the payload is empty or malformed
+    """
+    if 'chart' not in data or 'result' not in data['chart'] or not data['chart']['result']:
+        raise ValueError(f"No data available for {symbol}")
+
+    result = data['chart']['result'][0]
+
+    # Validate required structure
+    if 'timestamp' not in result:
+        raise ValueError(f"Invalid data structure for {symbol}: missing timestamp")
+    if 'indicators' not in result or 'quote' not in result['indicators'] or not result['indicators']['quote']:
+        raise ValueError(f"Invalid data structure for {symbol}: missing quote data")
+
+    if not result['timestamp']:
+        raise ValueError(f"No trading data available for {symbol}")
+
+    # Validate quote data has all required fields
+    quotes = result['indicators']['quote'][0]
+    required_fields = ['open', 'close', 'high', 'low', 'volume']
+    for field in required_fields:
+        if field not in quotes:
+            raise ValueError(f"Invalid data structure for {symbol}: missing {field} in quote data")
+
+    return result
+
+
+def _chart_result(symbol, response):
+    """Decode and validate a chart response, timing it as parse_seconds{kind="chart"}."""
+    with metrics.timer('parse_seconds', kind='chart'), profiling.stage('parse'):
+        return _validate_chart_payload(symbol, response.json())
+
+
+def _fetch_chart_result(symbol, params, session=None):
+    """
+    Request the Yahoo chart API with retries and return the validated chart result.
+
+    Args:
+        symbol (str): Stock ticker symbol
+        params (dict): Query parameters (period1, period2, interval, ...)
+        session (requests.Session): HTTP session to use (default: shared session)
+
+    Returns:
+        dict: data['chart']['result'][0] (see _validate_chart_payload)
+
+    Raises:
+        ValueError: If the request fails after all retries or the payload is malformed
+    """
+    try:
+        with profiling.stage('fetch'):
+            response = _get_with_retries(YAHOO_CHART_URL.format(symbol=symbol), params, CHART_HEADERS, session)
+    except requests.exceptions.RequestException as e:
+        raise ValueError(f"Network error fetching data for {symbol} after {get_scheduler().max_retries} retries: {str(e)}")
+
+    return _chart_result(symbol, response)
+
+
+async def _fetch_chart_result_async(symbol, params, session=None):
+    """Async version of _fetch_chart_result."""
+    try:
+        with profiling.stage('fetch'):
+            response = await _get_with_retries_async(YAHOO_CHART_URL.format(symbol=symbol), params,
+                                                     CHART_HEADERS, session)
+    except requests.exceptions.RequestException as e:
+        raise ValueError(f"Network error fetching data for {symbol} after {get_scheduler().max_retries} retries: {str(e)}")
+
+    return _chart_result(symbol, response)
+
+
+def _daily_chart_params(target_date):
+    """Chart query for the week up to target_date, so the previous close is included."""
+    return {
+        'period1': int((target_date - timedelta(days=7)).timestamp()),
+        'period2': int((target_date + timedelta(days=1)).timestamp()),
+        'interval': '1d',
+        'includePrePost': 'false'
+    }
+
+
+CHART_FIELDS = ('open', 'high', 'low', 'close', 'volume')
+
+# Granularity of UTC offset lookups in _exchange_local_time
+_OFFSET_SLOT_SECONDS = 900
+
+
+def _exchange_local_time(timestamps, meta):
+    """
+    Convert epoch seconds to exchange local time (datetime64[s]).
+
+    Uses meta['exchangeTimezoneName'] so daylight saving changes inside a
+    range are honoured, and falls back to the fixed meta['gmtoffset'].
+    """
+    timezone_name = meta.get('exchangeTimezoneName')
+    if timezone_name:
+        try:
+            zone = ZoneInfo(timezone_name)
+        except (ZoneInfoNotFoundError, ValueError):
+            # Unknown zone name; the offset below is still right outside DST changes
+            zone = None
+        if zone is not None:
+            # Offsets only change on quarter-hour boundaries, so look up one per slot
+            slots, inverse = np.unique(timestamps // _OFFSET_SLOT_SECONDS, return_inverse=True)
+            offsets = np.array([
+                datetime.fromtimestamp(int(slot) * _OFFSET_SLOT_SECONDS, timezone.utc).astimezone(zone)
+                .utcoffset().total_seconds() for slot in slots
+            ], dtype=np.int64)
+            return (timestamps + offsets[inverse]).astype('datetime64[s]')
+    return (timestamps + int(meta.get('gmtoffset') or 0)).astype('datetime64[s]')
+
+
+def _chart_columns(results):
+    """
+    Turn one or more chart results into NumPy columns in one pass.
+
+    Timestamps are deduplicated and sorted (range chunks can overlap at the
+    edges) and converted to exchange local time with the timezone from the
+    last result's meta. Missing quote values become NaN.
+
+    Args:
+        results (list): Chart results (see _validate_chart_payload)
+
+    Returns:
+        dict: 'timestamp' (int64 epoch seconds), 'time' (datetime64[s], exchange
+              local time) plus float64 arrays for open, high, low, close and volume
+    """
+    timestamps = np.concatenate([np.asarray(r['timestamp'], dtype=np.int64) for r in results])
+    timestamps, order = np.unique(timestamps, return_index=True)
+
+    columns = {
+        field: np.concatenate([
+            np.asarray(r['indicators']['quote'][0][field], dtype=np.float64) for r in results
+        ])[order]
+        for field in CHART_FIELDS
+    }
+    columns['timestamp'] = timestamps
+    columns['time'] = _exchange_local_time(timestamps, results[-1].get('meta') or {})
+    return columns
+
+
+def _invalid_bars(columns):
+    """Vectorized OHLC sanity check: True for bars with a missing price or high below low."""
+    prices = np.column_stack([columns[field] for field in ('open', 'high', 'low', 'close')])
+    return np.isnan(prices).any(axis=1) | (columns['high'] < columns['low'])
+
+
+def _round_cents(values):
+    """
+    Round a float array to 2 decimals with the builtin round(), like _daily_record_from_chart.
+
+    np.round scales by 100 before rounding and can land one cent off the
+    builtin (202.695 -> 202.70 instead of 202.69), so history rows and cached
+    records would disagree with a per-day fetch of the same bar.
+    """
+    return np.array([round(value, 2) for value in values.tolist()], dtype=np.float64)
+
+
+def _daily_record_from_chart(symbol, result, target_date):
+    """
+    Pick the bar for target_date (or the closest trading day before it) from a chart result.
+
+    Bars are dated in the exchange's timezone, so the trading day does not
+    depend on the machine's local timezone.
+
+    Returns:
+        dict: Daily stock data in fetch_daily_stock_data format
+
+    Raises:
+        ValueError: If no usable bar exists on or before target_date
+    """
+    columns = _chart_columns([result])
+    days = columns['time'].astype('datetime64[D]')
+    invalid = _invalid_bars(columns)
+
+    # Most recent trading day on or before target_date
+    target_idx = int(np.searchsorted(days, np.datetime64(target_date.date()), side='right')) - 1
+    if target_idx < 0:
+        raise ValueError(f"No trading data available on or before {target_date.strftime('%Y-%m-%d')}")
+
+    closest_date = str(days[target_idx])
+    open_price, high_price, low_price, close_price, volume = (
+        float(columns[field][target_idx]) for field in CHART_FIELDS
+    )
+
+    if invalid[target_idx]:
+        for field, value in (('open', open_price), ('close', close_price),
+                             ('high', high_price), ('low', low_price)):
+            if np.isnan(value):
+                raise ValueError(f"Missing {field} price data for {symbol} on {closest_date}")
+        raise ValueError(f"Invalid price data for {symbol} on {closest_date}: "
+                         f"high {high_price} is below low {low_price}")
+
+    # Previous close; fall back to the open price if it is not available
+    prev_close_price = float(columns['close'][target_idx - 1]) if target_idx > 0 else np.nan
+    if np.isnan(prev_close_price):
+        prev_close_price = open_price
+
+    # Calculate changes
+    change = close_price - prev_close_price
+    change_pct = (change / prev_close_price * 100) if prev_close_price > 0 else 0
+
+    return {
+        'date': closest_date,
+        'open': round(open_price, 2),
+        'close': round(close_price, 2),
+        'high': round(high_price, 2),
+        'low': round(low_price, 2),
+        'volume': 0 if np.isnan(volume) else int(volume),
+        'change': round(change, 2),
+        'change_pct': round(change_pct, 2),
+        'prev_close': round(prev_close_price, 2)
+    }
+
+
+def fetch_daily_stock_data(symbol, date=None, session=None, use_cache=True, refresh=False):
+    """
+    Fetch daily stock data for a given symbol using Yahoo Finance API.
+
+    Results are kept in the local OHLCV cache (see ohlcv_cache.get_default_cache):
+    settled days are served without a network call, and today's record is
+    reused for a short TTL.
+
+    Args:
+        symbol (str): Stock ticker symbol (e.g., 'NVDA')
+        date (str or datetime): Date to fetch data for (default: today)
+                               Format: 'YYYY-MM-DD' or datetime object
+        session (requests.Session): HTTP session to use (default: shared session)
+        use_cache (bool): Read and update the local OHLCV cache (default: True)
+        refresh (bool): Skip the cache lookup and re-fetch, updating the cache (default: False)
+
+    Returns:
+        dict: Dictionary containing daily stock data with keys:
+              - date: Trading date
+              - open: Opening price
+              - close: Closing price
+              - high: Highest price
+              - low: Lowest price
+              - volume: Trading volume
+              - change: Price change (close - prev_close)
+              - change_pct: Percentage change
+              - prev_close: Previous day's closing price
+
+    Raises:
+        ValueError: If symbol is invalid or data cannot be fetched
+    """
+    if not symbol:
+        raise ValueError("Symbol cannot be empty")
+
+    target_date = _parse_date(date)
+    cache_key = target_date.strftime('%Y-%m-%d')
+
+    cache = get_default_cache() if use_cache else None
+    if cache is not None and not refresh:
+        cached = cache.get(symbol, cache_key)
+        if cached is not None:
+            return cached
+
+    with _errors_as_value_error(symbol):
+        result = _fetch_chart_result(symbol, _daily_chart_params(target_date), session)
+        record = _daily_record_from_chart(symbol, result, target_date)
+
+    if cache is not None:
+        cache.put(symbol, cache_key, record)
+
+    return record
+
+
+async def fetch_daily_stock_data_async(symbol, date=None, session=None, use_cache=True, refresh=False):
+    """
+    Async version of fetch_daily_stock_data.
+
+    The HTTP request runs in a worker thread and retries back off with
+    asyncio.sleep, so many symbols can be fetched concurrently on one event loop.
+    Arguments, return value and errors are the same as fetch_daily_stock_data.
+    """
+    if not symbol:
+        raise ValueError("Symbol cannot be empty")
+
+    target_date = _parse_date(date)
+    cache_key = target_date.strftime('%Y-%m-%d')
+
+    cache = get_default_cache() if use_cache else None
+    if cache is not None and not refresh:
+        cached = cache.get(symbol, cache_key)
+        if cached is not None:
+            return cached
+
+    with _errors_as_value_error(symbol):
+        result = await _fetch_chart_result_async(symbol, _daily_chart_params(target_date), session)
+        record = _daily_record_from_chart(symbol, result, target_date)
+
+    if cache is not None:
+        cache.put(symbol, cache_key, record)
+
+    return record
+
+
+def fetch_daily_stock_data_many(symbols, date=None, max_workers=8):
+    """
+    Fetch daily stock data for several symbols concurrently.
+
+    Requests run on a bounded thread pool over the shared keep-alive session
+    (see get_http_session). A failure for one symbol is recorded in the errors
+    dict and does not abort the rest of the batch.
+
+    Args:
+        symbols (list): Stock ticker symbols (e.g., ['NVDA', 'AAPL'])
+        date (str or datetime): Date to fetch data for (default: today)
+                               Format: 'YYYY-MM-DD' or datetime object
+        max_workers (int): Maximum number of concurrent requests (default: 8)
+
+    Returns:
+        tuple: (results, errors), both keyed by symbol in input order
+               - results (dict): symbol -> stock data dict (see fetch_daily_stock_data)
+               - errors (dict): symbol -> error message for symbols that failed
+
+    Raises:
+        ValueError: If symbols is empty or max_workers is less than 1
+    """
+    if not symbols:
+        raise ValueError("symbols cannot be empty")
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+
+    symbols = list(dict.fromkeys(symbols))
+    session = get_http_session()
+    results = {}
+    errors = {}
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(symbols))) as executor:
+        futures = {
+            executor.submit(fetch_daily_stock_data, symbol, date, session): symbol
+            for symbol in symbols
+        }
+        for future in as_completed(futures):
+            symbol = futures[future]
+            try:
+                results[symbol] = future.result()
+            except Exception as e:
+                errors[symbol] = str(e)
+
+    return (
+        {symbol: results[symbol] for symbol in symbols if symbol in results},
+        {symbol: errors[symbol] for symbol in symbols if symbol in errors},
+    )
+
+
+INTRADAY_INTERVALS = ('1m', '2m', '5m', '15m', '30m', '60m', '90m')
+
+
+def fetch_intraday_bars(symbol, since=None, interval='1m', session=None):
+    """
+    Fetch intraday bars newer than a timestamp as NumPy columns.
+
+    The bar starting at since is included, because the most recent bar keeps
+    changing until its interval has passed. Bars with missing or inconsistent
+    prices (common for illiquid minutes) are dropped.
+
+    Args:
+        symbol (str): Stock ticker symbol (e.g., 'NVDA')
+        since (int): Epoch seconds of the last bar already seen (default: the latest trading day)
+        interval (str): One of INTRADAY_INTERVALS (default: '1m')
+        session (requests.Session): HTTP session to use (default: shared session)
+
+    Returns:
+        dict: 'timestamp' (int64), 'time' (datetime64[s], exchange local time) and
+              float64 open, high, low, close and volume arrays, oldest first
+
+    Raises:
+        ValueError: If symbol or interval is invalid or data cannot be fetched
+    """
+    if not symbol:
+        raise ValueError("Symbol cannot be empty")
+    if interval not in INTRADAY_INTERVALS:
+        raise ValueError(f"interval must be one of {INTRADAY_INTERVALS}")
+
+    params = {'interval': interval, 'includePrePost': 'false'}
+    if since is None:
+        params['range'] = '1d'
+    else:
+        params['period1'] = int(since)
+        params['period2'] = int(time.time()) + 60
+
+    with _errors_as_value_error(symbol):
+        try:
+            result = _fetch_chart_result(symbol, params, session)
+        except ValueError as e:
+            # A poll that finds no new bars yet is not an error
+            if since is None or not ('No trading data' in str(e) or 'missing timestamp' in str(e)):
+                raise
+            result = {'timestamp': [], 'indicators': {'quote': [{field: [] for field in CHART_FIELDS}]}}
+
+        columns = _chart_columns([result])
+        keep = ~_invalid_bars(columns)
+        if since is not None:
+            keep &= columns['timestamp'] >= int(since)
+        return {name: values[keep] for name, values in columns.items()}
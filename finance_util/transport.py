@@ -0,0 +1,97 @@
+"""
+Shared HTTP session and retrying GET helpers used by every fetcher.
+"""
+
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from http_retry import get_scheduler
+
+
+# Maximum number of keep-alive connections kept per host by the shared session
+HTTP_POOL_SIZE = 32
+
+_http_session = None
+_http_session_lock = threading.Lock()
+
+
+def get_http_session():
+    """
+    Return the process-wide requests.Session shared by all fetchers.
+
+    The session keeps up to HTTP_POOL_SIZE keep-alive connections per host, so
+    repeated and concurrent requests reuse TCP/TLS connections instead of
+    opening a new one per call. It is safe to share between worker threads.
+
+    Returns:
+        requests.Session: Shared HTTP session
+    """
+    global _http_session
+    with _http_session_lock:
+        if _http_session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            _http_session = session
+        return _http_session
+
+
+def _parse_date(date):
+    """Convert None / 'YYYY-MM-DD' / datetime to a datetime (None means now)."""
+    if date is None:
+        return datetime.now()
+    elif isinstance(date, str):
+        return datetime.strptime(date, '%Y-%m-%d')
+    elif isinstance(date, datetime):
+        return date
+    else:
+        raise ValueError("Date must be a string (YYYY-MM-DD) or datetime object")
+
+
+@contextmanager
+def _errors_as_value_error(symbol):
+    """Convert parsing and unexpected errors raised while fetching symbol to ValueError."""
+    try:
+        yield
+    except (KeyError, IndexError, TypeError) as e:
+        raise ValueError(f"Error parsing data for {symbol}: {str(e)}")
+    except ValueError:
+        raise  # Re-raise ValueError as is
+    except Exception as e:
+        raise ValueError(f"Unexpected error fetching data for {symbol}: {str(e)}")
+
+
+def _get_with_retries(url, params, headers, session=None, verbose=True):
+    """
+    GET url over the shared session through the process-wide retry scheduler
+    (per-host rate limit, jittered backoff, Retry-After, global retry budget).
+
+    Returns:
+        requests.Response: Successful response
+
+    Raises:
+        requests.exceptions.RequestException: Non-retryable error or the last error
+                                              once retries are exhausted
+    """
+    if session is None:
+        session = get_http_session()
+    return get_scheduler().request(session, 'GET', url, verbose=verbose,
+                                   params=params, headers=headers, timeout=15)
+
+
+async def _get_with_retries_async(url, params, headers, session=None, verbose=True):
+    """
+    Async version of _get_with_retries.
+
+    The blocking request runs in a worker thread and waits use asyncio.sleep,
+    so other coroutines keep running while this one backs off.
+    """
+    if session is None:
+        session = get_http_session()
+    return await get_scheduler().request_async(session, 'GET', url, verbose=verbose,
+                                               params=params, headers=headers, timeout=15)
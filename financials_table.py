@@ -0,0 +1,197 @@
+"""
+Fast extraction of stockanalysis.com financial statement tables.
+
+read_table pulls the first <table> out of a statement page with lxml's
+HTML parser. The markup of that table is cut out of the page first, so the
+scripts, payloads and navigation around it are never parsed, and plain
+etree elements skip lxml.html's per-element class lookup. Cells come back as the strings
+shown on the site ("57,006", "62.49%", "-").
+
+to_numeric turns such a table into float columns in one vectorized pass:
+
+- thousands separators and currency signs are dropped ("57,006" -> 57006.0)
+- percentages become fractions ("62.49%" -> 0.6249)
+- K/M/B/T suffixes are scaled ("1.2B" -> 1.2e9)
+- parenthesised values are negative ("(1,234)" -> -1234.0)
+- dashes, "n/a", "Upgrade" and anything else non-numeric become NaN
+
+Statement values on stockanalysis.com are already in millions (see the note
+above each table); to_numeric does not rescale unsuffixed numbers.
+"""
+
+import re
+
+import numpy as np
+import pandas as pd
+from lxml import etree
+
+
+# Multiplier per unit suffix ('' = plain number)
+UNIT_SCALE = {'': 1.0, 'K': 1e3, 'M': 1e6, 'B': 1e9, 'T': 1e12, '%': 0.01}
+
+_TABLE_START = re.compile(r'<table\b', re.IGNORECASE)
+_TABLE_END = re.compile(r'</table\s*>', re.IGNORECASE)
+# One line per cell once separators and blanks are removed: (opening parenthesis, sign,
+# digits, unit) for numbers, empty groups for anything else
+_CELL = re.compile(r'^(\()?([+\-\u2212])?(\d+(?:\.\d*)?|\.\d+)([KMBT%]?)\)?$|^.*$',
+                   re.IGNORECASE | re.MULTILINE)
+_NOISE = re.compile(r'[,$\s]')
+
+
+def _cell_text(element):
+    """Text of a cell with each text node stripped, like BeautifulSoup's get_text(strip=True)."""
+    if len(element) == 0:
+        return (element.text or '').strip()
+    return ''.join(part.strip() for part in element.itertext())
+
+
+def table_markup(html):
+    """
+    Return the markup of the first <table> of a page, from <table to </table>.
+
+    Args:
+        html (str): Page HTML
+
+    Returns:
+        str or None: The table's markup, or None if the page has no table or
+                     the table cannot be cut out on its own (nested tables,
+                     missing end tag)
+    """
+    start = _TABLE_START.search(html)
+    if start is None:
+        return None
+    end = _TABLE_END.search(html, start.end())
+    if end is None or len(_TABLE_START.findall(html, start.start(), end.end())) != 1:
+        return None
+    return html[start.start():end.end()]
+
+
+def _first_table(html):
+    """
+    Return the first <table> element of a page.
+
+    Only the table's own markup is parsed (see table_markup); pages where
+    it cannot be cut out fall back to parsing the whole document.
+
+    Raises:
+        ValueError: If the page has no table
+    """
+    markup = table_markup(html)
+    root = etree.HTML(markup if markup is not None else html)
+    table = root.find('.//table') if root is not None else None
+    if table is None:
+        raise ValueError("no <table> in page")
+    return table
+
+
+def _extract(html):
+    """
+    Return (columns, rows) of the first table: header names and the cell text of each data row.
+
+    Raises:
+        ValueError: If the page has no table or the table has no data rows
+    """
+    table = _first_table(html)
+
+    headers = []
+    header_rows = table.xpath('thead/tr')
+    if header_rows:
+        headers = [_cell_text(th) for th in header_rows[-1].iterchildren('th')]
+
+    rows = []
+    for tr in table.xpath('tbody/tr'):
+        cells = [_cell_text(td) for td in tr.iterchildren('td')]
+        if cells:
+            rows.append(cells)
+    if not rows:
+        raise ValueError("table has no data rows")
+
+    num_cols = len(rows[0])
+    if headers and len(headers) != num_cols:
+        print(f"⚠️  Header has {len(headers)} columns but rows have {num_cols}, adjusting...")
+        if len(headers) > num_cols:
+            headers = headers[:num_cols]
+        else:
+            headers = headers + [f"Col_{i}" for i in range(len(headers), num_cols)]
+
+    return (headers if headers else list(range(num_cols))), rows
+
+
+def _parse_numbers(cells):
+    """Convert a flat list of cell strings to a float array (see the module docstring)."""
+    if not cells:
+        return np.empty(0)
+    # Both regexes run once over the whole table (one line per cell) instead of once per cell
+    text = _NOISE.sub('', '\0'.join(cells)).replace('\0', '\n')
+    parts = _CELL.findall(text)
+    if len(parts) != len(cells):
+        raise ValueError("cell values must not contain NUL characters")
+    paren, sign, digits, unit = np.array(parts, dtype=object).reshape(-1, 4).T
+
+    values = np.where(digits == '', 'nan', digits).astype(float)
+    values *= np.array([UNIT_SCALE[u.upper()] for u in unit])
+    negative = (paren == '(') ^ ((sign == '-') | (sign == '\u2212'))
+    values[negative] = -values[negative]
+    return values
+
+
+def read_table(html):
+    """
+    Extract the first table of a statement page as a DataFrame of strings.
+
+    Column names come from the last header row (earlier rows may be group
+    headers) and the first column becomes the index. If the header and the
+    data rows disagree on the column count, the header is trimmed or padded
+    with Col_<n> names.
+
+    Args:
+        html (str): Page HTML
+
+    Returns:
+        pd.DataFrame: Table cells as strings, indexed by line item
+
+    Raises:
+        ValueError: If the page has no table or the table has no data rows
+    """
+    columns, rows = _extract(html)
+    index = pd.Index([row[0] for row in rows], name=columns[0])
+    return pd.DataFrame([row[1:] for row in rows], index=index, columns=columns[1:])
+
+
+def to_numeric(df):
+    """
+    Convert a table of displayed values to float columns (see the module docstring).
+
+    Args:
+        df (pd.DataFrame): Table from read_table (any cell type is accepted)
+
+    Returns:
+        pd.DataFrame: Same index and columns, float64 values
+    """
+    values = _parse_numbers(df.to_numpy(dtype=str).ravel().tolist())
+    return pd.DataFrame(values.reshape(df.shape), index=df.index, columns=df.columns)
+
+
+def read_numeric_table(html):
+    """
+    Extract the first table of a statement page as float columns.
+
+    Same result as to_numeric(read_table(html)), without building the
+    intermediate table of strings.
+
+    Args:
+        html (str): Page HTML
+
+    Returns:
+        pd.DataFrame: Table values as float64, indexed by line item
+
+    Raises:
+        ValueError: If the page has no table or the table has no data rows
+    """
+    columns, rows = _extract(html)
+    width = len(columns) - 1
+    cells = [cell for row in rows for cell in (row[1:] + [''] * (width - len(row) + 1))]
+    if len(cells) != width * len(rows):
+        raise ValueError("table rows are wider than its header")
+    index = pd.Index([row[0] for row in rows], name=columns[0])
+    return pd.DataFrame(_parse_numbers(cells).reshape(len(rows), width), index=index, columns=columns[1:])
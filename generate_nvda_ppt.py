@@ -4,9 +4,10 @@ NVDA 재무 데이터 PPT 생성기
 NVIDIA 분기별 재무 데이터를 표와 차트가 포함된 PPT로 생성합니다.
 
 사용법:
-    python generate_nvda_ppt.py
+    python generate_nvda_ppt.py [--output 파일명] [--profile [PSTATS]] [--profile-trace TRACE_JSON]
 """
 
+import argparse
 import os
 from pptx import Presentation
 from pptx.util import Inches, Pt, Emu
@@ -19,6 +20,8 @@ matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import numpy as np
 
+import profiling
+
 # ── NVDA 최근 분기별 재무 데이터 (단위: 백만 달러, EPS는 달러) ──
 QUARTERS = [
     "Q1 2024", "Q2 2024", "Q3 2024", "Q4 2024",
@@ -382,32 +385,51 @@ def generate_ppt(output_path="nvda_financial_report.pptx"):
     print("NVDA 재무 보고서 PPT 생성 중...")
 
     print("  [1/7] 타이틀 페이지...")
-    slide_title_page(prs)
+    with profiling.stage("title"):
+        slide_title_page(prs)
 
     print("  [2/7] KPI 요약...")
-    slide_kpi_summary(prs)
+    with profiling.stage("kpi"):
+        slide_kpi_summary(prs)
 
     print("  [3/7] Income Statement 테이블...")
-    slide_income_table(prs)
+    with profiling.stage("income_table"):
+        slide_income_table(prs)
 
     print("  [4/7] Revenue vs Net Income 차트...")
-    slide_revenue_chart(prs)
+    with profiling.stage("revenue_chart"):
+        slide_revenue_chart(prs)
 
     print("  [5/7] Profitability Margins 차트...")
-    slide_margin_chart(prs)
+    with profiling.stage("margin_chart"):
+        slide_margin_chart(prs)
 
     print("  [6/7] Revenue & EPS 차트...")
-    slide_eps_chart(prs)
+    with profiling.stage("eps_chart"):
+        slide_eps_chart(prs)
 
     print("  [7/7] YoY Growth & Closing...")
-    slide_yoy_growth(prs)
-    slide_closing(prs)
+    with profiling.stage("yoy_closing"):
+        slide_yoy_growth(prs)
+        slide_closing(prs)
 
-    prs.save(output_path)
+    with profiling.stage("save"):
+        prs.save(output_path)
     print(f"\nPPT 저장 완료: {output_path}")
     print(f"총 {len(prs.slides)}장 슬라이드")
     return output_path
 
 
+def main():
+    parser = argparse.ArgumentParser(description="NVDA 재무 보고서 PPT 생성기")
+    parser.add_argument("--output", default="nvda_financial_report.pptx",
+                        help="출력 PPT 파일 (기본값: nvda_financial_report.pptx)")
+    profiling.add_profile_arguments(parser, "generate_nvda_ppt")
+    args = parser.parse_args()
+
+    with profiling.profile_session(args):
+        generate_ppt(args.output)
+
+
 if __name__ == "__main__":
-    generate_ppt()
+    main()
@@ -0,0 +1,340 @@
+"""
+Process-wide rate limiting and retry scheduling for outbound requests.
+
+All fetchers (Yahoo chart, Google News RSS, the stockanalysis.com scraper) go
+through one RetryScheduler, which provides:
+
+- per-host token buckets, so concurrent workers share one request rate per host
+- decorrelated jitter between retries, so workers do not retry in lockstep
+- Retry-After handling: a 429/503 with Retry-After pauses the whole host
+- a global retry budget, so retries stay a bounded fraction of all requests
+"""
+
+import asyncio
+import random
+import threading
+import time
+from collections import deque
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+import requests
+
+import metrics
+
+
+# Status codes worth retrying; anything else (e.g. 404) fails immediately
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+# (requests per second, burst) per host; other hosts use DEFAULT_HOST_RATE
+HOST_RATES = {
+    'query1.finance.yahoo.com': (5.0, 10),
+    'news.google.com': (2.0, 5),
+    'stockanalysis.com': (1.0, 2),
+}
+DEFAULT_HOST_RATE = (5.0, 10)
+
+_default_scheduler = None
+_default_scheduler_lock = threading.Lock()
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket that hands out waiting times instead of sleeping.
+
+    reserve() takes a token and returns how long the caller must wait before
+    using it, so the same bucket serves both threads and coroutines.
+    """
+
+    def __init__(self, rate, capacity, clock=time.monotonic):
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._tokens = float(capacity)
+        self._updated = clock()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """Take one token; return the seconds to wait before sending."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = max(0.0, -self._tokens / self.rate)
+            return max(wait, self._blocked_until - now)
+
+    def block(self, seconds):
+        """Pause every user of this bucket for at least seconds (e.g. after Retry-After)."""
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, self._clock() + seconds)
+
+
+class RetryBudget:
+    """
+    Global cap on retries: over a sliding window, retries may not exceed
+    min_retries plus ratio times the number of first attempts.
+    """
+
+    def __init__(self, ratio=0.2, min_retries=10, window=60.0, clock=time.monotonic):
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.window = window
+        self._clock = clock
+        self._requests = deque()
+        self._retries = deque()
+        self._lock = threading.Lock()
+
+    def _trim(self, now):
+        for events in (self._requests, self._retries):
+            while events and now - events[0] > self.window:
+                events.popleft()
+
+    def record_request(self):
+        """Record a first attempt."""
+        with self._lock:
+            now = self._clock()
+            self._trim(now)
+            self._requests.append(now)
+
+    def try_spend(self):
+        """Take one retry from the budget; return False if none is left."""
+        with self._lock:
+            now = self._clock()
+            self._trim(now)
+            if len(self._retries) >= self.min_retries + self.ratio * len(self._requests):
+                return False
+            self._retries.append(now)
+            return True
+
+
+def parse_retry_after(value, now=None):
+    """
+    Parse a Retry-After header (delay in seconds or an HTTP date).
+
+    Returns:
+        float or None: Seconds to wait, or None if the header is missing or invalid
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at - (time.time() if now is None else now))
+
+
+class RetryScheduler:
+    """
+    Rate-limited, jittered retry loop shared by all outbound fetches.
+
+    Args:
+        max_retries (int): Retries after the first attempt (default: 4)
+        base_delay (float): Minimum delay between attempts in seconds (default: 2)
+        max_delay (float): Maximum jittered delay in seconds (default: 30)
+        max_retry_after (float): Upper bound for honoured Retry-After values (default: 60)
+        host_rates (dict): host -> (requests per second, burst) (default: HOST_RATES)
+        budget (RetryBudget): Global retry budget (default: RetryBudget())
+        sleep (callable): Blocking sleep function (default: time.sleep)
+    """
+
+    def __init__(self, max_retries=4, base_delay=2.0, max_delay=30.0, max_retry_after=60.0,
+                 host_rates=None, budget=None, sleep=time.sleep):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_retry_after = max_retry_after
+        self.host_rates = dict(HOST_RATES if host_rates is None else host_rates)
+        self.budget = budget if budget is not None else RetryBudget()
+        self._sleep = sleep
+        self._buckets = {}
+        self._buckets_lock = threading.Lock()
+
+    def bucket(self, host):
+        """Return the token bucket for host, creating it on first use."""
+        with self._buckets_lock:
+            if host not in self._buckets:
+                rate, burst = self.host_rates.get(host, DEFAULT_HOST_RATE)
+                self._buckets[host] = TokenBucket(rate, burst)
+            return self._buckets[host]
+
+    def next_delay(self, previous):
+        """Decorrelated jitter: uniform between base_delay and 3x the previous delay, capped."""
+        return min(self.max_delay, random.uniform(self.base_delay, max(self.base_delay, previous * 3)))
+
+    def _retry_delay(self, host, error, previous):
+        """
+        Decide whether error is retryable and how long to wait.
+
+        Returns:
+            float or None: Delay in seconds, or None if the error must not be retried
+        """
+        delay = self.next_delay(previous)
+        response = getattr(error, 'response', None)
+        if isinstance(error, requests.exceptions.HTTPError) and response is not None:
+            if response.status_code not in RETRYABLE_STATUS:
+                return None
+            retry_after = parse_retry_after(response.headers.get('Retry-After'))
+            if retry_after is not None:
+                retry_after = min(retry_after, self.max_retry_after)
+                # Every worker talking to this host waits, not just this one
+                self.bucket(host).block(retry_after)
+                delay = max(delay, retry_after)
+        return delay
+
+    def _log_retry(self, verbose, attempt, delay, error):
+        if verbose:
+            print(f"⚠️  Network error on attempt {attempt}: {type(error).__name__}")
+            print(f"⏳ Retry {attempt}/{self.max_retries} after {delay:.1f}s...")
+
+    def _send(self, session, method, url, host, **kwargs):
+        """Send one request, recording its latency, status and size while metrics are enabled."""
+        if not metrics.enabled():
+            return session.request(method, url, **kwargs)
+
+        start = time.perf_counter()
+        try:
+            response = session.request(method, url, **kwargs)
+        except requests.exceptions.RequestException as e:
+            metrics.inc('http_requests_total', host=host, status=type(e).__name__)
+            raise
+        finally:
+            metrics.observe('http_request_seconds', time.perf_counter() - start, host=host)
+        metrics.inc('http_requests_total', host=host, status=response.status_code)
+        metrics.inc('http_response_bytes_total', len(response.content), host=host)
+        return response
+
+    def request(self, session, method, url, verbose=True, **kwargs):
+        """
+        Send an HTTP request with rate limiting and retries.
+
+        Args:
+            session (requests.Session): Session to send the request with
+            method (str): HTTP method (e.g. 'GET')
+            url (str): Request URL
+            verbose (bool): Print retry progress (default: True)
+            **kwargs: Passed to session.request (params, headers, timeout, ...)
+
+        Returns:
+            requests.Response: Successful (2xx/3xx) response
+
+        Raises:
+            requests.exceptions.RequestException: Non-retryable error, or the last
+                error once retries or the retry budget are exhausted
+        """
+        host = urlparse(url).hostname or ''
+        bucket = self.bucket(host)
+        self.budget.record_request()
+        delay = self.base_delay
+
+        for attempt in range(self.max_retries + 1):
+            wait = bucket.reserve()
+            if wait > 0:
+                self._sleep(wait)
+            try:
+                response = self._send(session, method, url, host, **kwargs)
+                response.raise_for_status()
+                return response
+            except requests.exceptions.RequestException as e:
+                delay = self._retry_delay(host, e, delay)
+                if delay is None or attempt >= self.max_retries or not self.budget.try_spend():
+                    raise
+                metrics.inc('http_retries_total', host=host)
+                self._log_retry(verbose, attempt + 1, delay, e)
+                self._sleep(delay)
+
+    async def request_async(self, session, method, url, verbose=True, **kwargs):
+        """
+        Async version of request: the request runs in a worker thread and all
+        waits use asyncio.sleep. Same arguments, return value and errors.
+        """
+        host = urlparse(url).hostname or ''
+        bucket = self.bucket(host)
+        self.budget.record_request()
+        delay = self.base_delay
+
+        for attempt in range(self.max_retries + 1):
+            wait = bucket.reserve()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            try:
+                response = await asyncio.to_thread(self._send, session, method, url, host, **kwargs)
+                response.raise_for_status()
+                return response
+            except requests.exceptions.RequestException as e:
+                delay = self._retry_delay(host, e, delay)
+                if delay is None or attempt >= self.max_retries or not self.budget.try_spend():
+                    raise
+                metrics.inc('http_retries_total', host=host)
+                self._log_retry(verbose, attempt + 1, delay, e)
+                await asyncio.sleep(delay)
+
+    def call(self, host, func, *args, retry_on=(Exception,), verbose=True, **kwargs):
+        """
+        Call func under host's rate limit, retrying on retry_on exceptions.
+
+        Used for non-requests traffic such as Selenium page loads.
+
+        Args:
+            host (str): Host whose token bucket to use (e.g. 'stockanalysis.com')
+            func (callable): Function to call
+            *args: Positional arguments for func
+            retry_on (tuple): Exception types that trigger a retry (default: all)
+            verbose (bool): Print retry progress (default: True)
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Whatever func returns
+
+        Raises:
+            The last exception once retries or the retry budget are exhausted
+        """
+        bucket = self.bucket(host)
+        self.budget.record_request()
+        delay = self.base_delay
+
+        for attempt in range(self.max_retries + 1):
+            wait = bucket.reserve()
+            if wait > 0:
+                self._sleep(wait)
+            try:
+                with metrics.timer('http_request_seconds', host=host):
+                    return func(*args, **kwargs)
+            except retry_on as e:
+                delay = self.next_delay(delay)
+                if attempt >= self.max_retries or not self.budget.try_spend():
+                    raise
+                metrics.inc('http_retries_total', host=host)
+                self._log_retry(verbose, attempt + 1, delay, e)
+                self._sleep(delay)
+
+
+def get_scheduler():
+    """
+    Return the process-wide RetryScheduler used by all fetchers.
+
+    Returns:
+        RetryScheduler: Shared scheduler (created on first use)
+    """
+    global _default_scheduler
+    with _default_scheduler_lock:
+        if _default_scheduler is None:
+            _default_scheduler = RetryScheduler()
+        return _default_scheduler
+
+
+def set_scheduler(scheduler):
+    """
+    Replace the process-wide scheduler (e.g. with shorter delays in tests).
+
+    Args:
+        scheduler (RetryScheduler): New shared scheduler, or None to recreate the default
+    """
+    global _default_scheduler
+    with _default_scheduler_lock:
+        _default_scheduler = scheduler
@@ -0,0 +1,184 @@
+"""
+Technical indicators over the daily tracker history.
+
+IndicatorState keeps a small, fixed amount of running state per symbol
+(the last few closes and returns, EMA, Wilder averages, running peak), so
+adding a day costs the same however long the history is. compute_indicators
+recomputes the same values for a whole history at once and is used to
+validate the incremental path and to rebuild it after out-of-order writes;
+it imports NumPy and pandas on first use.
+"""
+
+import math
+from collections import deque
+
+
+SMA_WINDOW = 20
+EMA_SPAN = 20
+VOLATILITY_WINDOW = 20
+ATR_PERIOD = 14
+RSI_PERIOD = 14
+
+INDICATOR_FIELDS = ['sma_20', 'ema_20', 'volatility_20', 'atr_14', 'drawdown_pct', 'rsi_14']
+
+
+def _nan_to_none(value):
+    return None if value is None or math.isnan(value) else value
+
+
+class IndicatorState:
+    """
+    Running indicator state for one symbol.
+
+    Indicators (NaN until enough days have been seen):
+        - sma_20: simple moving average of close
+        - ema_20: exponential moving average of close (alpha = 2 / 21, seeded with the first close)
+        - volatility_20: sample standard deviation of change_pct over 20 days
+        - atr_14: Wilder average true range (seeded with the mean of the first 14 true ranges)
+        - drawdown_pct: close relative to the highest close so far, in percent
+        - rsi_14: Wilder relative strength index of the daily change
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.closes = deque(maxlen=SMA_WINDOW)
+        self.returns = deque(maxlen=VOLATILITY_WINDOW)
+        self.ema = math.nan
+        self.peak = math.nan
+        self.tr_seed = 0.0
+        self.atr = math.nan
+        self.gain_seed = 0.0
+        self.loss_seed = 0.0
+        self.avg_gain = math.nan
+        self.avg_loss = math.nan
+
+    def update(self, record):
+        """
+        Add one day and return the indicator values for it.
+
+        Args:
+            record (dict): Day in fetch_daily_stock_data format (high, low, close,
+                           prev_close, change and change_pct are used)
+
+        Returns:
+            dict: INDICATOR_FIELDS -> float (NaN while warming up)
+        """
+        high, low, close = float(record['high']), float(record['low']), float(record['close'])
+        prev_close, change = float(record['prev_close']), float(record['change'])
+        self.count += 1
+
+        self.closes.append(close)
+        self.returns.append(float(record['change_pct']))
+
+        alpha = 2 / (EMA_SPAN + 1)
+        self.ema = close if self.count == 1 else alpha * close + (1 - alpha) * self.ema
+        self.peak = close if self.count == 1 else max(self.peak, close)
+
+        true_range = max(high - low, abs(high - prev_close), abs(low - prev_close))
+        self.atr = self._wilder(self.atr, true_range, 'tr_seed', ATR_PERIOD)
+        self.avg_gain = self._wilder(self.avg_gain, max(change, 0.0), 'gain_seed', RSI_PERIOD)
+        self.avg_loss = self._wilder(self.avg_loss, max(-change, 0.0), 'loss_seed', RSI_PERIOD)
+
+        return self.values()
+
+    def _wilder(self, average, value, seed_attr, period):
+        """Wilder smoothing seeded with the simple mean of the first period values."""
+        if self.count < period:
+            setattr(self, seed_attr, getattr(self, seed_attr) + value)
+            return math.nan
+        if self.count == period:
+            return (getattr(self, seed_attr) + value) / period
+        return (average * (period - 1) + value) / period
+
+    def values(self):
+        """Return the indicator values for the most recent day."""
+        sma = sum(self.closes) / SMA_WINDOW if len(self.closes) == SMA_WINDOW else math.nan
+
+        volatility = math.nan
+        if len(self.returns) == VOLATILITY_WINDOW:
+            mean = sum(self.returns) / VOLATILITY_WINDOW
+            volatility = math.sqrt(sum((r - mean) ** 2 for r in self.returns) / (VOLATILITY_WINDOW - 1))
+
+        rsi = math.nan
+        if not math.isnan(self.avg_loss):
+            rsi = 100.0 if self.avg_loss == 0 else 100 - 100 / (1 + self.avg_gain / self.avg_loss)
+
+        drawdown = (self.closes[-1] / self.peak - 1) * 100 if self.count else math.nan
+
+        return {
+            'sma_20': sma,
+            'ema_20': self.ema,
+            'volatility_20': volatility,
+            'atr_14': self.atr,
+            'drawdown_pct': drawdown,
+            'rsi_14': rsi,
+        }
+
+    def to_dict(self):
+        """Return the state as a JSON-serializable dict."""
+        return {
+            'count': self.count,
+            'closes': list(self.closes),
+            'returns': list(self.returns),
+            **{name: _nan_to_none(getattr(self, name)) for name in
+               ('ema', 'peak', 'tr_seed', 'atr', 'gain_seed', 'loss_seed', 'avg_gain', 'avg_loss')},
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Rebuild a state saved with to_dict."""
+        state = cls()
+        state.count = data['count']
+        state.closes.extend(data['closes'])
+        state.returns.extend(data['returns'])
+        for name in ('ema', 'peak', 'tr_seed', 'atr', 'gain_seed', 'loss_seed', 'avg_gain', 'avg_loss'):
+            value = data[name]
+            setattr(state, name, math.nan if value is None else value)
+        return state
+
+
+def _wilder_series(values, period):
+    """Vectorized Wilder smoothing seeded with the mean of the first period values."""
+    import numpy as np
+    import pandas as pd
+
+    seeded = pd.Series(np.nan, index=values.index)
+    if len(values) >= period:
+        seeded.iloc[period - 1] = values.iloc[:period].mean()
+        seeded.iloc[period:] = values.iloc[period:]
+    return seeded.ewm(alpha=1 / period, adjust=False).mean()
+
+
+def compute_indicators(history):
+    """
+    Recompute every indicator for a whole history at once.
+
+    Args:
+        history (pd.DataFrame): Days oldest first with columns high, low, close,
+                                prev_close, change and change_pct
+
+    Returns:
+        pd.DataFrame: INDICATOR_FIELDS columns aligned with history
+    """
+    import pandas as pd
+
+    close = history['close'].astype(float)
+    high = history['high'].astype(float)
+    low = history['low'].astype(float)
+    prev_close = history['prev_close'].astype(float)
+    change = history['change'].astype(float)
+
+    true_range = pd.concat([high - low, (high - prev_close).abs(), (low - prev_close).abs()], axis=1).max(axis=1)
+    avg_gain = _wilder_series(change.clip(lower=0), RSI_PERIOD)
+    avg_loss = _wilder_series((-change).clip(lower=0), RSI_PERIOD)
+    rsi = 100 - 100 / (1 + avg_gain / avg_loss)
+    rsi = rsi.where(avg_loss != 0, 100.0).where(avg_loss.notna())
+
+    return pd.DataFrame({
+        'sma_20': close.rolling(SMA_WINDOW).mean(),
+        'ema_20': close.ewm(span=EMA_SPAN, adjust=False).mean(),
+        'volatility_20': history['change_pct'].astype(float).rolling(VOLATILITY_WINDOW).std(),
+        'atr_14': _wilder_series(true_range, ATR_PERIOD),
+        'drawdown_pct': (close / close.cummax() - 1) * 100,
+        'rsi_14': rsi,
+    }, index=history.index)
@@ -0,0 +1,234 @@
+"""
+Intraday bar streaming on top of the Yahoo chart endpoint.
+
+IntradayPoller asks only for bars at or after the last one it has seen and
+keeps them in an IntradayBuffer: preallocated NumPy arrays used as a ring,
+so memory stays fixed however long the poller runs. Session VWAP, high, low
+and volume are updated incrementally as bars arrive.
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+
+from finance_util import INTRADAY_INTERVALS, fetch_intraday_bars, get_http_session
+
+
+DEFAULT_CAPACITY = 1024
+
+BAR_FIELDS = ('open', 'high', 'low', 'close', 'volume')
+
+# Seconds per bar for each intraday interval
+INTERVAL_SECONDS = {interval: int(interval[:-1]) * 60 for interval in INTRADAY_INTERVALS}
+
+
+class IntradayBuffer:
+    """
+    Fixed-size ring buffer of intraday bars with running session statistics.
+
+    Bars must arrive in time order. A bar with the same timestamp as the
+    newest one replaces it in place (the still-forming bar), and its previous
+    contribution to VWAP and volume is taken back out. The statistics cover
+    every bar pushed since the last reset, including bars that have since
+    been overwritten in the ring.
+
+    Args:
+        capacity (int): Number of bars kept (default: 1024)
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+
+        self.capacity = capacity
+        self.timestamps = np.zeros(capacity, dtype=np.int64)
+        self.times = np.zeros(capacity, dtype='datetime64[s]')
+        self.values = {field: np.zeros(capacity, dtype=np.float64) for field in BAR_FIELDS}
+        self.reset()
+
+    def reset(self):
+        """Drop all bars and statistics (e.g. at the start of a new session)."""
+        self._newest = -1
+        self._size = 0
+        self._pv = 0.0
+        self.volume = 0.0
+        self.high = np.nan
+        self.low = np.nan
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def last_timestamp(self):
+        """Epoch seconds of the newest bar, or None if the buffer is empty."""
+        if not self._size:
+            return None
+        return int(self.timestamps[self._newest])
+
+    @property
+    def last_time(self):
+        """Exchange local time of the newest bar, or None if the buffer is empty."""
+        if not self._size:
+            return None
+        return self.times[self._newest]
+
+    @property
+    def vwap(self):
+        """Volume-weighted average of the typical price (high + low + close) / 3."""
+        return self._pv / self.volume if self.volume > 0 else np.nan
+
+    def _contribution(self, index):
+        """Typical price times volume of the bar at ring index."""
+        v = self.values
+        return (v['high'][index] + v['low'][index] + v['close'][index]) / 3 * v['volume'][index]
+
+    def push(self, timestamp, bar_time, open_price, high, low, close, volume):
+        """
+        Add a bar, or replace the newest bar if it has the same timestamp.
+
+        Bars older than the newest one are ignored.
+
+        Returns:
+            bool: True if the bar was stored
+        """
+        last = self.last_timestamp
+        if last is not None and timestamp < last:
+            return False
+
+        if last is not None and timestamp == last:
+            index = self._newest
+            self._pv -= self._contribution(index)
+            self.volume -= self.values['volume'][index]
+        else:
+            # Overwrites the oldest bar once the ring is full
+            index = self._newest = (self._newest + 1) % self.capacity
+            self._size = min(self._size + 1, self.capacity)
+
+        self.timestamps[index] = timestamp
+        self.times[index] = bar_time
+        for field, value in zip(BAR_FIELDS, (open_price, high, low, close, volume)):
+            self.values[field][index] = value
+
+        self._pv += self._contribution(index)
+        self.volume += volume
+        # A forming bar's high only rises and its low only falls, so max/min stay exact
+        self.high = high if np.isnan(self.high) else max(self.high, high)
+        self.low = low if np.isnan(self.low) else min(self.low, low)
+        return True
+
+    def extend(self, columns):
+        """
+        Push every bar of a fetch_intraday_bars result.
+
+        Returns:
+            int: Number of bars stored (new or replaced)
+        """
+        stored = 0
+        for i in range(len(columns['timestamp'])):
+            stored += self.push(int(columns['timestamp'][i]), columns['time'][i],
+                                *(float(columns[field][i]) for field in BAR_FIELDS))
+        return stored
+
+    def _order(self):
+        """Ring indices of the stored bars, oldest first."""
+        oldest = self._newest - self._size + 1
+        return np.arange(oldest, oldest + self._size) % self.capacity
+
+    def bars(self):
+        """
+        Return the stored bars, oldest first.
+
+        Returns:
+            pd.DataFrame: Columns time (exchange local time), open, high, low, close, volume
+        """
+        order = self._order()
+        return pd.DataFrame({
+            'time': self.times[order].astype('datetime64[ns]'),
+            **{field: self.values[field][order] for field in BAR_FIELDS},
+        })
+
+    def stats(self):
+        """
+        Return the running session statistics.
+
+        Returns:
+            dict: {'vwap', 'high', 'low', 'volume', 'bars'}
+        """
+        return {
+            'vwap': round(self.vwap, 4) if self.volume > 0 else None,
+            'high': None if np.isnan(self.high) else self.high,
+            'low': None if np.isnan(self.low) else self.low,
+            'volume': int(self.volume),
+            'bars': self._size,
+        }
+
+
+class IntradayPoller:
+    """
+    Poll the chart endpoint for new intraday bars of one symbol.
+
+    Args:
+        symbol (str): Stock ticker symbol (e.g., 'NVDA')
+        interval (str): One of INTRADAY_INTERVALS (default: '1m')
+        capacity (int): Ring buffer size in bars (default: 1024)
+        session (requests.Session): HTTP session to use (default: shared session)
+    """
+
+    def __init__(self, symbol, interval='1m', capacity=DEFAULT_CAPACITY, session=None):
+        if not symbol:
+            raise ValueError("Symbol cannot be empty")
+        if interval not in INTERVAL_SECONDS:
+            raise ValueError(f"interval must be one of {INTRADAY_INTERVALS}")
+
+        self.symbol = symbol
+        self.interval = interval
+        self.buffer = IntradayBuffer(capacity)
+        self.session = session if session is not None else get_http_session()
+
+    def poll(self):
+        """
+        Fetch bars at or after the newest stored bar and add them to the buffer.
+
+        Running statistics restart when the first bar of a new trading day arrives.
+
+        Returns:
+            int: Number of bars stored (new or replaced)
+
+        Raises:
+            ValueError: If the data cannot be fetched
+        """
+        columns = fetch_intraday_bars(self.symbol, self.buffer.last_timestamp, self.interval, self.session)
+
+        days = columns['time'].astype('datetime64[D]')
+        if len(days) and len(self.buffer):
+            last_day = self.buffer.last_time.astype('datetime64[D]')
+            if days[-1] > last_day:
+                # New session: start over with today's bars only
+                self.buffer.reset()
+                new_session = days > last_day
+                columns = {name: values[new_session] for name, values in columns.items()}
+
+        return self.buffer.extend(columns)
+
+    def run(self, polls=None, every=None, on_update=None, sleep=time.sleep):
+        """
+        Poll repeatedly.
+
+        Args:
+            polls (int): Number of polls (default: until interrupted)
+            every (float): Seconds between polls (default: the bar interval)
+            on_update (callable): Called with the poller after each poll that stored bars
+            sleep (callable): Sleep function (default: time.sleep)
+        """
+        every = INTERVAL_SECONDS[self.interval] if every is None else every
+        count = 0
+        while polls is None or count < polls:
+            try:
+                if self.poll() and on_update is not None:
+                    on_update(self)
+            except ValueError as e:
+                print(f"⚠️  Intraday poll failed for {self.symbol}: {str(e)}")
+            count += 1
+            if polls is None or count < polls:
+                sleep(every)
@@ -0,0 +1,319 @@
+"""
+Lightweight in-process metrics: counters and latency histograms.
+
+Fetchers, caches and writers report through the module-level functions inc,
+observe and timer. Metrics are disabled by default; each of those functions
+then returns after a single None check, so instrumented code paths cost
+next to nothing. Enable a registry with enable() (or set
+$FINANCE_UTIL_METRICS to a file path, which also dumps it at exit) and
+write it out with dump() as Prometheus text or JSON.
+
+Metric names:
+
+- http_requests_total{host,status}: responses by status code (or error type)
+- http_request_seconds{host}: time per HTTP request or page load (histogram)
+- http_response_bytes_total{host}: response body bytes
+- http_retries_total{host}: retries scheduled by RetryScheduler
+- cache_requests_total{cache,result}: OHLCV, feed and scrape cache hits and misses
+  (the scrape cache also counts result=fresh for views served without fetching)
+- parse_seconds{kind}: chart JSON, news RSS and financials HTML parsing
+- excel_write_seconds{writer}: Excel workbook writes
+- tracker_symbol_seconds{result}: fetch time per tracked symbol
+- scrape_pages_total{path}: financials pages scraped over plain HTTP or Selenium
+- driver_pool_events_total{event}: Chrome driver starts, recycles and crashes
+"""
+
+import atexit
+import json
+import os
+import threading
+import time
+from contextlib import nullcontext
+
+# Upper bounds (seconds) of the latency histogram buckets, Prometheus-style
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+_registry = None
+_registry_lock = threading.Lock()
+_NULL_TIMER = nullcontext()
+
+
+def _label_key(labels):
+    """Return a hashable, order-independent key for a label dict."""
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+def _format_labels(key, extra=()):
+    """Format a label key as Prometheus {name="value",...} (empty string if no labels)."""
+    pairs = list(key) + list(extra)
+    if not pairs:
+        return ''
+    escaped = (value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for _, value in pairs)
+    return '{' + ','.join(f'{name}="{value}"' for (name, _), value in zip(pairs, escaped)) + '}'
+
+
+def _format_number(value):
+    """Format a sample value the way Prometheus does (integers without a decimal point)."""
+    if value == float('inf'):
+        return '+Inf'
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class Histogram:
+    """Fixed-bucket histogram of observed values (per-bucket counts, sum and count)."""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        index = len(self.buckets)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                index = i
+                break
+        self.counts[index] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self):
+        """Return [(upper bound, cumulative count)] including the +Inf bucket."""
+        total = 0
+        result = []
+        for bound, count in zip(self.buckets + (float('inf'),), self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+
+class _Timer:
+    """Context manager that observes the elapsed time of its block in a histogram."""
+
+    __slots__ = ('_registry', '_name', '_labels', '_start')
+
+    def __init__(self, registry, name, labels):
+        self._registry = registry
+        self._name = name
+        self._labels = labels
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._registry.observe(self._name, time.perf_counter() - self._start, **self._labels)
+        return False
+
+
+class MetricsRegistry:
+    """
+    Thread-safe collection of labelled counters and histograms.
+
+    Args:
+        buckets (tuple): Histogram bucket upper bounds in seconds (default: DEFAULT_BUCKETS)
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._counters = {}
+        self._histograms = {}
+        self._lock = threading.Lock()
+
+    def inc(self, name, value=1, **labels):
+        """Add value to the counter name{labels}."""
+        key = (name, _label_key(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name, value, **labels):
+        """Record value (usually seconds) in the histogram name{labels}."""
+        key = (name, _label_key(labels))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram(self.buckets)
+            histogram.observe(value)
+
+    def timer(self, name, **labels):
+        """Return a context manager that observes the duration of its block."""
+        return _Timer(self, name, labels)
+
+    def counter(self, name, **labels):
+        """Return the current value of a counter (0 if it was never incremented)."""
+        with self._lock:
+            return self._counters.get((name, _label_key(labels)), 0)
+
+    def histogram(self, name, **labels):
+        """Return the Histogram for name{labels}, or None if nothing was observed."""
+        with self._lock:
+            return self._histograms.get((name, _label_key(labels)))
+
+    def reset(self):
+        """Drop all recorded values."""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def snapshot(self):
+        """
+        Return all metrics as plain data.
+
+        Returns:
+            dict: {'counters': [{'name', 'labels', 'value'}],
+                   'histograms': [{'name', 'labels', 'count', 'sum', 'buckets'}]}
+                  where buckets maps each upper bound (as a string) to its cumulative count
+        """
+        with self._lock:
+            counters = [
+                {'name': name, 'labels': dict(key), 'value': value}
+                for (name, key), value in sorted(self._counters.items())
+            ]
+            histograms = [
+                {'name': name, 'labels': dict(key), 'count': h.count, 'sum': h.sum,
+                 'buckets': {_format_number(bound): count for bound, count in h.cumulative()}}
+                for (name, key), h in sorted(self._histograms.items(), key=lambda item: item[0])
+            ]
+        return {'counters': counters, 'histograms': histograms}
+
+    def to_json(self, indent=2):
+        """Return snapshot() as a JSON document."""
+        return json.dumps(self.snapshot(), indent=indent, ensure_ascii=False)
+
+    def to_prometheus(self):
+        """Return all metrics in the Prometheus text exposition format."""
+        with self._lock:
+            counters = sorted(self._counters.items())
+            histograms = sorted(self._histograms.items(), key=lambda item: item[0])
+
+        lines = []
+        typed = set()
+        for (name, key), value in counters:
+            if name not in typed:
+                lines.append(f'# TYPE {name} counter')
+                typed.add(name)
+            lines.append(f'{name}{_format_labels(key)} {_format_number(value)}')
+        for (name, key), h in histograms:
+            if name not in typed:
+                lines.append(f'# TYPE {name} histogram')
+                typed.add(name)
+            for bound, count in h.cumulative():
+                lines.append(f'{name}_bucket{_format_labels(key, [("le", _format_number(bound))])} {count}')
+            lines.append(f'{name}_sum{_format_labels(key)} {_format_number(h.sum)}')
+            lines.append(f'{name}_count{_format_labels(key)} {h.count}')
+        return '\n'.join(lines) + '\n'
+
+    def dump(self, path):
+        """
+        Write the metrics to path: Prometheus text for .prom/.txt files, JSON otherwise.
+
+        Returns:
+            str: path
+        """
+        text = self.to_prometheus() if path.endswith(('.prom', '.txt')) else self.to_json()
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        return path
+
+
+def get_registry():
+    """
+    Return the active registry.
+
+    Returns:
+        MetricsRegistry or None: None while metrics are disabled
+    """
+    return _registry
+
+
+def set_registry(registry):
+    """
+    Replace the active registry.
+
+    Args:
+        registry (MetricsRegistry): New registry, or None to disable metrics
+    """
+    global _registry
+    with _registry_lock:
+        _registry = registry
+
+
+def enable(registry=None):
+    """
+    Enable metrics, keeping the active registry if there already is one.
+
+    Args:
+        registry (MetricsRegistry): Registry to install (default: a new MetricsRegistry)
+
+    Returns:
+        MetricsRegistry: The active registry
+    """
+    global _registry
+    with _registry_lock:
+        if registry is not None or _registry is None:
+            _registry = registry if registry is not None else MetricsRegistry()
+        return _registry
+
+
+def disable():
+    """Disable metrics; instrumented code goes back to its no-op fast path."""
+    set_registry(None)
+
+
+def enabled():
+    """Return True if a registry is active."""
+    return _registry is not None
+
+
+def inc(name, value=1, **labels):
+    """Increment a counter on the active registry (no-op while disabled)."""
+    registry = _registry
+    if registry is not None:
+        registry.inc(name, value, **labels)
+
+
+def observe(name, value, **labels):
+    """Record a histogram value on the active registry (no-op while disabled)."""
+    registry = _registry
+    if registry is not None:
+        registry.observe(name, value, **labels)
+
+
+def timer(name, **labels):
+    """
+    Time a block into the histogram name{labels}.
+
+    Returns a shared no-op context manager while metrics are disabled.
+    """
+    registry = _registry
+    if registry is None:
+        return _NULL_TIMER
+    return _Timer(registry, name, labels)
+
+
+def dump(path):
+    """
+    Write the active registry to path (see MetricsRegistry.dump).
+
+    Returns:
+        str or None: path, or None if metrics are disabled
+    """
+    registry = _registry
+    if registry is None:
+        return None
+    return registry.dump(path)
+
+
+def _enable_from_environment():
+    """Enable metrics and dump them at exit if $FINANCE_UTIL_METRICS names an output file."""
+    path = os.environ.get('FINANCE_UTIL_METRICS')
+    if path:
+        enable()
+        atexit.register(dump, path)
+
+
+_enable_from_environment()
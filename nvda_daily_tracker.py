@@ -2,13 +2,31 @@
 """
 NVIDIA Daily Stock Tracker
 
-이 스크립트는 NVIDIA(NVDA)의 일일 주가 변동과 이유를 추적합니다.
-매일 실행하여 주가 데이터와 뉴스를 수집하고 Excel 파일에 저장합니다.
+이 스크립트는 NVIDIA(NVDA) 또는 관심 종목들의 일일 주가 변동과 이유를 추적합니다.
+매일 실행하여 주가 데이터와 뉴스를 수집하고 SQLite 저장소(daily_tracker.sqlite)에
+기록한 뒤, 실행이 끝나면 Excel 파일로 내보냅니다.
+
+사용법:
+    python nvda_daily_tracker.py [날짜] [출력 디렉토리]
+    python nvda_daily_tracker.py --watchlist watchlist.txt --workbook watchlist_tracker.xlsx
+    python nvda_daily_tracker.py 2026-01-15 ./data --symbols NVDA AAPL
 """
 
+import argparse
+import asyncio
+import os
 import sys
+import time
 from datetime import datetime
-from finance_util import fetch_daily_stock_data, fetch_stock_news, append_daily_record
+import metrics
+import profiling
+from finance_util import fetch_price_and_news_async
+from ohlcv_cache import get_default_cache
+from tracker_store import TrackerStore, store_path
+
+
+# 동시에 가져올 최대 종목 수 (종목당 주가/뉴스 요청 2개, 공유 HTTP 세션 연결 수 32개)
+MAX_CONCURRENCY = 16
 
 
 def format_news_summary(news_items):
@@ -33,25 +51,80 @@ def format_news_summary(news_items):
     return " | ".join(summary_parts)
 
 
-def track_nvda_daily(date=None, output_dir=None):
+def tracker_filename(symbol):
+    """종목별 Excel 파일명을 반환합니다 (예: NVDA -> nvda_daily_tracker.xlsx)."""
+    return f"{symbol.lower()}_daily_tracker.xlsx"
+
+
+def open_tracker_store(output_dir=None):
     """
-    NVIDIA의 일일 주가를 추적하고 기록합니다.
+    출력 디렉토리의 추적 저장소를 엽니다.
 
     Args:
+        output_dir (str): 출력 디렉토리 경로 (None이면 현재 디렉토리)
+
+    Returns:
+        TrackerStore: 추적 저장소
+    """
+    return TrackerStore(store_path(output_dir))
+
+
+def migrate_workbook(store, symbol, output_dir=None):
+    """
+    저장소에 아직 기록이 없는 종목의 기존 Excel 파일을 저장소로 옮깁니다 (최초 1회).
+
+    Args:
+        store (TrackerStore): 추적 저장소
+        symbol (str): 주식 티커
+        output_dir (str): 출력 디렉토리 경로 (None이면 현재 디렉토리)
+
+    Returns:
+        int: 가져온 행 수
+    """
+    filename = tracker_filename(symbol)
+    filepath = os.path.join(output_dir, filename) if output_dir else filename
+    if store.count(symbol) or not os.path.exists(filepath):
+        return 0
+
+    imported = store.import_excel(symbol, filepath)
+    print(f"📥 [{symbol}] 기존 Excel 기록 {imported}건을 저장소로 가져왔습니다.")
+    return imported
+
+
+async def track_symbol_async(symbol, date=None, output_dir=None, store=None):
+    """
+    한 종목의 주가와 뉴스를 동시에 가져와 저장소에 기록합니다.
+
+    store를 지정하지 않으면 출력 디렉토리의 저장소를 열고, 기록 후 바로
+    Excel 파일로 내보냅니다. store를 지정하면 Excel 내보내기는 호출자가
+    배치 끝에 한 번 수행합니다 (track_symbols_async 참고).
+
+    Args:
+        symbol (str): 주식 티커 (예: 'NVDA')
         date (str): 추적할 날짜 (YYYY-MM-DD 형식, None이면 오늘)
         output_dir (str): 출력 디렉토리 경로 (None이면 현재 디렉토리)
+        store (TrackerStore): 공유 추적 저장소 (None이면 새로 열고 닫음)
 
     Returns:
         dict: 추적 결과 정보
     """
-    symbol = 'NVDA'
+    if store is None:
+        store = open_tracker_store(output_dir)
+        try:
+            result = await track_symbol_async(symbol, date, output_dir, store)
+            if result['success']:
+                with profiling.stage('write'):
+                    await asyncio.to_thread(store.export_excel, symbol, tracker_filename(symbol), output_dir)
+            return result
+        finally:
+            store.close()
 
     try:
-        # 1. 주가 데이터 가져오기
-        print(f"📊 NVIDIA(NVDA) 주가 데이터를 가져오는 중...")
-        stock_data = fetch_daily_stock_data(symbol, date)
+        # 1. 주가 데이터와 뉴스를 동시에 가져오기
+        print(f"📊 {symbol} 주가 데이터와 뉴스를 가져오는 중...")
+        stock_data, news_items = await fetch_price_and_news_async(symbol, date)
 
-        print(f"\n날짜: {stock_data['date']}")
+        print(f"\n[{symbol}] 날짜: {stock_data['date']}")
         print(f"전일 종가: ${stock_data['prev_close']}")
         print(f"시가: ${stock_data['open']}")
         print(f"종가: ${stock_data['close']}")
@@ -60,10 +133,7 @@ def track_nvda_daily(date=None, output_dir=None):
         print(f"거래량: {stock_data['volume']:,}")
         print(f"변동: ${stock_data['change']} ({stock_data['change_pct']}%)")
 
-        # 2. 뉴스 가져오기
-        print(f"\n📰 뉴스를 가져오는 중...")
-        news_items = fetch_stock_news(symbol, stock_data['date'])
-
+        # 2. 뉴스 출력
         if news_items:
             print(f"\n총 {len(news_items)}개의 뉴스를 찾았습니다:")
             for i, news in enumerate(news_items, 1):
@@ -76,11 +146,15 @@ def track_nvda_daily(date=None, output_dir=None):
         # 3. 뉴스 요약
         news_summary = format_news_summary(news_items)
 
-        # 4. Excel에 기록 추가
-        print(f"\n💾 Excel 파일에 기록을 저장하는 중...")
-        filepath = append_daily_record(stock_data, news_summary, output_dir=output_dir)
+        # 4. 저장소에 기록 (같은 날짜는 덮어쓰기, 디스크 쓰기는 이벤트 루프를 막지 않도록 스레드에서 실행)
+        print(f"\n💾 [{symbol}] 저장소에 기록을 저장하는 중...")
+        with profiling.stage('write'):
+            await asyncio.to_thread(migrate_workbook, store, symbol, output_dir)
+            await asyncio.to_thread(store.upsert, symbol, stock_data, news_summary)
+        filename = tracker_filename(symbol)
+        filepath = os.path.join(output_dir, filename) if output_dir else filename
 
-        print(f"\n✅ 성공적으로 기록되었습니다!")
+        print(f"\n✅ [{symbol}] 성공적으로 기록되었습니다!")
         print(f"파일 위치: {filepath}")
 
         return {
@@ -93,39 +167,223 @@ def track_nvda_daily(date=None, output_dir=None):
         }
 
     except Exception as e:
-        print(f"\n❌ 오류 발생: {str(e)}", file=sys.stderr)
+        print(f"\n❌ [{symbol}] 오류 발생: {str(e)}", file=sys.stderr)
         return {
             'success': False,
             'error': str(e)
         }
 
 
+def load_watchlist(path):
+    """
+    관심 종목 파일을 읽습니다.
+
+    한 줄에 하나 이상의 티커를 쉼표나 공백으로 구분해 적고, '#' 뒤는 주석으로
+    무시합니다. 중복된 티커는 처음 나온 것만 남깁니다.
+
+    Args:
+        path (str): 관심 종목 파일 경로
+
+    Returns:
+        list: 티커 리스트 (파일 순서)
+
+    Raises:
+        ValueError: 파일에 티커가 없는 경우
+    """
+    symbols = []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            symbols.extend(line.split('#', 1)[0].replace(',', ' ').split())
+
+    symbols = list(dict.fromkeys(symbol.upper() for symbol in symbols))
+    if not symbols:
+        raise ValueError(f"No symbols found in watchlist {path}")
+    return symbols
+
+
+async def _fetch_symbol(symbol, date, semaphore):
+    """한 종목을 가져와 (stock_data, news_items, 소요 시간, 오류) 를 반환합니다."""
+    async with semaphore:
+        start = time.perf_counter()
+        try:
+            stock_data, news_items = await fetch_price_and_news_async(symbol, date)
+        except Exception as e:
+            latency = time.perf_counter() - start
+            metrics.observe('tracker_symbol_seconds', latency, result='error')
+            return None, None, latency, str(e)
+        latency = time.perf_counter() - start
+        metrics.observe('tracker_symbol_seconds', latency, result='ok')
+        return stock_data, news_items, latency, None
+
+
+async def track_symbols_async(symbols, date=None, output_dir=None, workbook=None,
+                              max_concurrency=MAX_CONCURRENCY):
+    """
+    여러 종목을 하나의 이벤트 루프에서 동시에 추적합니다.
+
+    모든 종목을 동시에 가져온 뒤 결과를 저장소에 한 번의 트랜잭션으로
+    기록합니다. 그다음 workbook을 지정하면 종목별 시트가 있는 Excel 파일
+    하나를, 지정하지 않으면 성공한 종목마다 Excel 파일을 내보냅니다.
+
+    Args:
+        symbols (list): 주식 티커 리스트
+        date (str): 추적할 날짜 (YYYY-MM-DD 형식, None이면 오늘)
+        output_dir (str): 출력 디렉토리 경로 (None이면 현재 디렉토리)
+        workbook (str): 종목별 시트로 내보낼 Excel 파일명 (None이면 종목별 파일)
+        max_concurrency (int): 동시에 가져올 최대 종목 수 (기본값: 16)
+
+    Returns:
+        dict: 종목별 추적 결과 정보 (latency_s: 가져오기 소요 시간, 초)
+    """
+    symbols = list(dict.fromkeys(symbols))
+    semaphore = asyncio.Semaphore(max_concurrency)
+    fetched = await asyncio.gather(*(_fetch_symbol(symbol, date, semaphore) for symbol in symbols))
+
+    results = {}
+    entries = []
+    for symbol, (stock_data, news_items, latency, error) in zip(symbols, fetched):
+        if error is not None:
+            print(f"❌ [{symbol}] 오류 발생: {error}", file=sys.stderr)
+            results[symbol] = {'success': False, 'error': error, 'latency_s': round(latency, 3)}
+            continue
+
+        filename = workbook or tracker_filename(symbol)
+        entries.append((symbol, stock_data, format_news_summary(news_items)))
+        results[symbol] = {
+            'success': True,
+            'date': stock_data['date'],
+            'close': stock_data['close'],
+            'change_pct': stock_data['change_pct'],
+            'news_count': len(news_items),
+            'latency_s': round(latency, 3),
+            'filepath': os.path.join(output_dir, filename) if output_dir else filename,
+        }
+
+    succeeded = [symbol for symbol, _, _ in entries]
+    store = open_tracker_store(output_dir)
+    try:
+        def write():
+            with profiling.stage('write'):
+                for symbol in succeeded:
+                    migrate_workbook(store, symbol, output_dir)
+                if entries:
+                    store.upsert_symbols(entries)
+                if workbook and succeeded:
+                    store.export_workbook(succeeded, workbook, output_dir)
+                elif not workbook:
+                    for symbol in succeeded:
+                        store.export_excel(symbol, tracker_filename(symbol), output_dir)
+
+        # 디스크 쓰기는 이벤트 루프를 막지 않도록 스레드에서 한 번에 실행
+        await asyncio.to_thread(write)
+    finally:
+        store.close()
+    return results
+
+
+def print_summary(results):
+    """
+    종목별 성공 여부와 소요 시간을 표로 출력합니다.
+
+    Args:
+        results (dict): track_symbols_async 결과
+    """
+    print(f"{'종목':<10} {'결과':<4} {'소요(s)':>8} {'날짜':<10} {'종가':>10} {'변동률(%)':>9}")
+    for symbol, result in results.items():
+        if result['success']:
+            print(f"{symbol:<10} {'성공':<4} {result['latency_s']:>8.3f} {result['date']:<10} "
+                  f"{result['close']:>10} {result['change_pct']:>9}")
+        else:
+            print(f"{symbol:<10} {'실패':<4} {result['latency_s']:>8.3f} {result['error']}")
+
+    succeeded = sum(result['success'] for result in results.values())
+    latencies = sorted(result['latency_s'] for result in results.values())
+    if latencies:
+        print(f"\n성공 {succeeded}/{len(results)}개, 소요 시간 중앙값 {latencies[len(latencies) // 2]:.3f}s, "
+              f"최대 {latencies[-1]:.3f}s")
+
+
+async def track_nvda_daily_async(date=None, output_dir=None):
+    """
+    NVIDIA의 일일 주가를 추적하고 기록합니다 (비동기 버전).
+
+    Args:
+        date (str): 추적할 날짜 (YYYY-MM-DD 형식, None이면 오늘)
+        output_dir (str): 출력 디렉토리 경로 (None이면 현재 디렉토리)
+
+    Returns:
+        dict: 추적 결과 정보
+    """
+    return await track_symbol_async('NVDA', date, output_dir)
+
+
+def track_nvda_daily(date=None, output_dir=None):
+    """
+    NVIDIA의 일일 주가를 추적하고 기록합니다.
+
+    Args:
+        date (str): 추적할 날짜 (YYYY-MM-DD 형식, None이면 오늘)
+        output_dir (str): 출력 디렉토리 경로 (None이면 현재 디렉토리)
+
+    Returns:
+        dict: 추적 결과 정보
+    """
+    return asyncio.run(track_nvda_daily_async(date, output_dir))
+
+
 def main():
     """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description="일일 주가 추적기")
+    parser.add_argument("date", nargs='?', default=None, help="추적할 날짜 (YYYY-MM-DD, 기본값: 오늘)")
+    parser.add_argument("output_dir", nargs='?', default=None, help="출력 디렉토리 (기본값: 현재 디렉토리)")
+    symbols_group = parser.add_mutually_exclusive_group()
+    symbols_group.add_argument("--symbols", nargs='+', default=None, help="추적할 티커 (기본값: NVDA)")
+    symbols_group.add_argument("--watchlist", default=None, help="관심 종목 파일 (한 줄에 티커, '#' 주석)")
+    parser.add_argument("--workbook", default=None,
+                        help="종목별 시트가 있는 Excel 파일 하나로 내보내기 (기본값: 종목별 파일)")
+    parser.add_argument("--max-concurrency", type=int, default=MAX_CONCURRENCY,
+                        help=f"동시에 가져올 최대 종목 수 (기본값: {MAX_CONCURRENCY})")
+    parser.add_argument("--metrics", default=None,
+                        help="실행이 끝나면 지표를 저장할 파일 (.prom: Prometheus 텍스트, 그 외: JSON)")
+    profiling.add_profile_arguments(parser, "nvda_daily_tracker")
+    args = parser.parse_args()
+    if args.metrics:
+        metrics.enable()
+
+    try:
+        symbols = load_watchlist(args.watchlist) if args.watchlist else (args.symbols or ['NVDA'])
+    except (OSError, ValueError) as e:
+        print(f"❌ 관심 종목을 읽을 수 없습니다: {str(e)}", file=sys.stderr)
+        return 1
+
     print("=" * 60)
-    print("NVIDIA 일일 주가 추적기")
+    print("NVIDIA 일일 주가 추적기" if symbols == ['NVDA'] else f"일일 주가 추적기: {len(symbols)}개 종목")
     print("=" * 60)
 
-    # 명령행 인자 처리
-    date = None
-    output_dir = None
-
-    if len(sys.argv) > 1:
-        date = sys.argv[1]
-        print(f"\n지정된 날짜: {date}")
+    if args.date:
+        print(f"\n지정된 날짜: {args.date}")
     else:
         print(f"\n오늘 날짜로 추적합니다: {datetime.now().strftime('%Y-%m-%d')}")
-
-    if len(sys.argv) > 2:
-        output_dir = sys.argv[2]
-        print(f"출력 디렉토리: {output_dir}")
-
+    if args.output_dir:
+        print(f"출력 디렉토리: {args.output_dir}")
     print()
 
     # 추적 실행
-    result = track_nvda_daily(date, output_dir)
+    with profiling.profile_session(args):
+        if len(symbols) == 1 and not args.workbook:
+            results = {symbols[0]: asyncio.run(track_symbol_async(symbols[0], args.date, args.output_dir))}
+        else:
+            results = asyncio.run(track_symbols_async(symbols, args.date, args.output_dir, args.workbook,
+                                                      args.max_concurrency))
+            print()
+            print_summary(results)
+
+    cache_stats = get_default_cache().stats()
+    print(f"\n주가 캐시: 적중 {cache_stats['hits']}회 / 미스 {cache_stats['misses']}회")
+    if args.metrics:
+        print(f"지표 저장: {metrics.dump(args.metrics)}")
 
-    if result['success']:
+    if all(result['success'] for result in results.values()):
         print("\n" + "=" * 60)
         print("추적 완료!")
         print("=" * 60)
@@ -0,0 +1,231 @@
+"""
+Local on-disk cache of daily OHLCV records keyed by (symbol, date).
+
+Records for settled trading days never change, so once a day has fully ended
+its cached record is served without any network call. Records fetched while
+the day is still in progress expire after a short TTL.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+import metrics
+
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'finance_util')
+
+# Seconds a record fetched before its day has ended stays valid
+DEFAULT_TODAY_TTL = 15 * 60
+
+# Bump to drop rows written by older versions (1: history rows used np.round, a cent off
+# the per-day records)
+CACHE_VERSION = 1
+
+RECORD_FIELDS = ['date', 'open', 'close', 'high', 'low', 'volume', 'change', 'change_pct', 'prev_close']
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def default_cache_path(filename):
+    """
+    Return the path of a cache file in $FINANCE_UTIL_CACHE_DIR (or DEFAULT_CACHE_DIR).
+
+    Args:
+        filename (str): Cache file name (e.g. 'ohlcv.sqlite')
+
+    Returns:
+        str: Full path to the cache file
+    """
+    return os.path.join(os.environ.get('FINANCE_UTIL_CACHE_DIR', DEFAULT_CACHE_DIR), filename)
+
+
+def _settled_timestamp(date):
+    """
+    Return the epoch time after which the bar for date can no longer change.
+
+    Midnight UTC after the date is later than the close of the US and Asian
+    exchanges, so anything fetched after it is final.
+    """
+    day = datetime.strptime(date, '%Y-%m-%d').replace(tzinfo=timezone.utc)
+    return (day + timedelta(days=1)).timestamp()
+
+
+class OHLCVCache:
+    """
+    SQLite-backed cache of fetch_daily_stock_data records.
+
+    Records are stored under the requested date, so a weekend request that
+    resolves to Friday's bar is cached as well. Thread-safe.
+    """
+
+    def __init__(self, path=None, today_ttl=DEFAULT_TODAY_TTL):
+        """
+        Args:
+            path (str): SQLite file path (default: ohlcv.sqlite in DEFAULT_CACHE_DIR,
+                        or in $FINANCE_UTIL_CACHE_DIR when set)
+            today_ttl (int): Seconds an unsettled record stays valid (default: 900)
+        """
+        if path is None:
+            path = default_cache_path('ohlcv.sqlite')
+
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory, exist_ok=True)
+
+        self.path = path
+        self.today_ttl = today_ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS daily_bars ("
+            " symbol TEXT NOT NULL,"
+            " date TEXT NOT NULL,"
+            " bar_date TEXT NOT NULL,"
+            " open REAL, close REAL, high REAL, low REAL, volume INTEGER,"
+            " change REAL, change_pct REAL, prev_close REAL,"
+            " fetched_at REAL NOT NULL,"
+            " PRIMARY KEY (symbol, date))"
+        )
+        if self._conn.execute("PRAGMA user_version").fetchone()[0] < CACHE_VERSION:
+            self._conn.execute("DELETE FROM daily_bars")
+            self._conn.execute(f"PRAGMA user_version = {CACHE_VERSION}")
+        self._conn.commit()
+
+    def get(self, symbol, date):
+        """
+        Return the cached record for (symbol, date), or None on a miss.
+
+        Args:
+            symbol (str): Stock ticker symbol
+            date (str): Requested date (YYYY-MM-DD)
+
+        Returns:
+            dict or None: Record in fetch_daily_stock_data format
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT bar_date, open, close, high, low, volume, change, change_pct, prev_close, fetched_at"
+                " FROM daily_bars WHERE symbol = ? AND date = ?",
+                (symbol, date)
+            ).fetchone()
+
+            if row is not None:
+                fetched_at = row[-1]
+                settled = fetched_at >= _settled_timestamp(date)
+                if settled or time.time() - fetched_at <= self.today_ttl:
+                    self.hits += 1
+                    metrics.inc('cache_requests_total', cache='ohlcv', result='hit')
+                    return dict(zip(RECORD_FIELDS, row[:-1]))
+
+            self.misses += 1
+            metrics.inc('cache_requests_total', cache='ohlcv', result='miss')
+            return None
+
+    def put(self, symbol, date, record):
+        """
+        Store a record under the requested date.
+
+        Args:
+            symbol (str): Stock ticker symbol
+            date (str): Requested date (YYYY-MM-DD)
+            record (dict): Record in fetch_daily_stock_data format
+        """
+        self.put_many(symbol, [(date, record)])
+
+    def put_many(self, symbol, items, fetched_at=None):
+        """
+        Store several records in one transaction.
+
+        Args:
+            symbol (str): Stock ticker symbol
+            items (list): (requested date, record) pairs
+            fetched_at (float): Fetch time as epoch seconds (default: now)
+        """
+        fetched_at = time.time() if fetched_at is None else fetched_at
+        rows = [
+            (symbol, date, record['date'], record['open'], record['close'], record['high'],
+             record['low'], record['volume'], record['change'], record['change_pct'],
+             record['prev_close'], fetched_at)
+            for date, record in items
+        ]
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO daily_bars VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows
+            )
+            self._conn.commit()
+
+    def invalidate(self, symbol=None, date=None):
+        """
+        Remove cached records so the next fetch goes to the network.
+
+        Args:
+            symbol (str): Only remove this symbol (default: all symbols)
+            date (str): Only remove this requested date (default: all dates)
+
+        Returns:
+            int: Number of records removed
+        """
+        clauses, params = [], []
+        if symbol is not None:
+            clauses.append("symbol = ?")
+            params.append(symbol)
+        if date is not None:
+            clauses.append("date = ?")
+            params.append(date)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        with self._lock:
+            cursor = self._conn.execute(f"DELETE FROM daily_bars{where}", params)
+            self._conn.commit()
+            return cursor.rowcount
+
+    def stats(self):
+        """
+        Return hit/miss counters since creation or the last reset_stats().
+
+        Returns:
+            dict: {'hits': int, 'misses': int}
+        """
+        return {'hits': self.hits, 'misses': self.misses}
+
+    def reset_stats(self):
+        """Reset the hit/miss counters."""
+        self.hits = 0
+        self.misses = 0
+
+    def close(self):
+        """Close the underlying SQLite connection."""
+        with self._lock:
+            self._conn.close()
+
+
+def get_default_cache():
+    """
+    Return the process-wide cache used by finance_util fetchers.
+
+    Returns:
+        OHLCVCache: Shared cache instance (created on first use)
+    """
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = OHLCVCache()
+        return _default_cache
+
+
+def set_default_cache(cache):
+    """
+    Replace the process-wide cache (e.g. to point it at another file).
+
+    Args:
+        cache (OHLCVCache): New shared cache, or None to recreate it on next use
+    """
+    global _default_cache
+    with _default_cache_lock:
+        _default_cache = cache
@@ -0,0 +1,253 @@
+"""
+Shared --profile support for the command-line entry points.
+
+A Profiler collects three things while a script runs:
+
+- a cProfile dump (pstats format) of the whole run
+- per-stage wall time, CPU time and peak traced memory, for the blocks
+  marked with stage() (e.g. fetch -> parse -> news -> write)
+- optionally, a Chrome trace (chrome://tracing, Perfetto, speedscope) of
+  every stage call, one track per thread or asyncio task
+
+Library code marks its stages with the module-level stage(name), which
+returns a shared no-op context manager unless a profiler is active, so
+stage markers cost nothing in normal runs.
+
+Scripts wire it up with add_profile_arguments(parser, 'name') and
+`with profile_session(args):` around their main work.
+
+CPU time is process-wide and the peak memory counter is shared, so both are
+approximate for stages that overlap (nested stages, concurrent fetches in
+one event loop or thread pool). Wall times are exact per call. cProfile only
+sees the thread that started it; stages run in worker threads still appear
+in the stage table and the trace.
+"""
+
+import asyncio
+import cProfile
+import io
+import json
+import os
+import pstats
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+
+_profiler = None
+_NULL_STAGE = nullcontext()
+
+
+class _StageStats:
+    """Accumulated totals for one stage name."""
+
+    __slots__ = ('calls', 'wall', 'cpu', 'peak')
+
+    def __init__(self):
+        self.calls = 0
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.peak = 0
+
+
+class Profiler:
+    """
+    Collects cProfile data, per-stage timings and trace events for one run.
+
+    Args:
+        cprofile (bool): Run cProfile while active (default: True)
+        trace_memory (bool): Track peak memory per stage with tracemalloc (default: True)
+    """
+
+    def __init__(self, cprofile=True, trace_memory=True):
+        self.trace_memory = trace_memory
+        self.stages = {}
+        self.events = []
+        self._cprofile = cProfile.Profile() if cprofile else None
+        self._tracks = {}
+        self._lock = threading.Lock()
+        self._started_tracemalloc = False
+        self._origin = None
+        self._wall = None
+        self._cpu = None
+
+    def start(self):
+        """Start profiling and make this the active profiler for stage()."""
+        global _profiler
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        self._origin = time.perf_counter()
+        self._wall = self._origin
+        self._cpu = time.process_time()
+        if self._cprofile is not None:
+            self._cprofile.enable()
+        _profiler = self
+
+    def stop(self):
+        """Stop profiling and record the whole run as the 'total' stage."""
+        global _profiler
+        if self._cprofile is not None:
+            self._cprofile.disable()
+        _profiler = None
+        total = self.stages.setdefault('total', _StageStats())
+        total.calls = 1
+        total.wall = time.perf_counter() - self._wall
+        total.cpu = time.process_time() - self._cpu
+        if self.trace_memory and tracemalloc.is_tracing():
+            total.peak = max([total.peak] + [stats.peak for stats in self.stages.values()])
+            if self._started_tracemalloc:
+                tracemalloc.stop()
+                self._started_tracemalloc = False
+
+    def _track(self):
+        """Return the trace track id of the current asyncio task or thread."""
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+        if task is not None:
+            key, name = id(task), task.get_name()
+        else:
+            thread = threading.current_thread()
+            key, name = thread.ident, thread.name
+        with self._lock:
+            if key not in self._tracks:
+                self._tracks[key] = (len(self._tracks) + 1, name)
+            return self._tracks[key][0]
+
+    @contextmanager
+    def stage(self, name):
+        """Time a block as stage name (wall, CPU, peak memory and a trace event)."""
+        track = self._track()
+        if self.trace_memory and tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+        start_wall = time.perf_counter()
+        start_cpu = time.process_time()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - start_wall
+            cpu = time.process_time() - start_cpu
+            peak = tracemalloc.get_traced_memory()[1] if self.trace_memory and tracemalloc.is_tracing() else 0
+            with self._lock:
+                stats = self.stages.get(name)
+                if stats is None:
+                    stats = self.stages[name] = _StageStats()
+                stats.calls += 1
+                stats.wall += wall
+                stats.cpu += cpu
+                stats.peak = max(stats.peak, peak)
+                self.events.append({
+                    'name': name, 'ph': 'X', 'pid': os.getpid(), 'tid': track,
+                    'ts': round((start_wall - self._origin) * 1e6, 1), 'dur': round(wall * 1e6, 1),
+                    'args': {'cpu_ms': round(cpu * 1000, 3), 'peak_kb': round(peak / 1024, 1)},
+                })
+
+    def stage_table(self):
+        """Return the per-stage summary as a printable table (stages in first-seen order, total last)."""
+        names = [name for name in self.stages if name != 'total']
+        if 'total' in self.stages:
+            names.append('total')
+        lines = [f"{'stage':<16} {'calls':>6} {'wall s':>9} {'cpu s':>9} {'peak MB':>9}"]
+        for name in names:
+            stats = self.stages[name]
+            peak = f"{stats.peak / 1024 / 1024:>9.1f}" if self.trace_memory else f"{'-':>9}"
+            lines.append(f"{name:<16} {stats.calls:>6} {stats.wall:>9.3f} {stats.cpu:>9.3f} {peak}")
+        return '\n'.join(lines)
+
+    def top_functions(self, limit=15, sort='cumulative'):
+        """Return the cProfile report for the limit most expensive functions."""
+        if self._cprofile is None:
+            return ''
+        out = io.StringIO()
+        pstats.Stats(self._cprofile, stream=out).strip_dirs().sort_stats(sort).print_stats(limit)
+        return out.getvalue()
+
+    def dump_stats(self, path):
+        """Write the cProfile data to path (load with pstats or snakeviz)."""
+        self._cprofile.dump_stats(path)
+        return path
+
+    def write_trace(self, path):
+        """
+        Write the stage events as a Chrome trace JSON document.
+
+        Returns:
+            str: path
+        """
+        with self._lock:
+            metadata = [
+                {'name': 'thread_name', 'ph': 'M', 'pid': os.getpid(), 'tid': track, 'args': {'name': name}}
+                for track, name in self._tracks.values()
+            ]
+            events = metadata + list(self.events)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+        return path
+
+
+def get_profiler():
+    """Return the active Profiler, or None when not profiling."""
+    return _profiler
+
+
+def stage(name):
+    """
+    Mark a block as a profiling stage.
+
+    Returns a shared no-op context manager unless a profiler is active.
+    """
+    profiler = _profiler
+    if profiler is None:
+        return _NULL_STAGE
+    return profiler.stage(name)
+
+
+def add_profile_arguments(parser, name):
+    """
+    Add the shared --profile / --profile-trace options to an argparse parser.
+
+    Args:
+        parser (argparse.ArgumentParser): Parser of the entry point
+        name (str): Base name for the default pstats file (e.g. 'nvda_daily_tracker')
+    """
+    parser.add_argument("--profile", nargs='?', const=f"{name}.pstats", default=None, metavar="PSTATS",
+                        help=f"cProfile 결과를 저장하고 단계별 시간/메모리 표 출력 (기본 파일: {name}.pstats)")
+    parser.add_argument("--profile-trace", default=None, metavar="TRACE_JSON",
+                        help="단계별 Chrome trace JSON 저장 (chrome://tracing, Perfetto에서 열기)")
+
+
+@contextmanager
+def profile_session(args):
+    """
+    Profile the enclosed block if --profile or --profile-trace was given.
+
+    On exit prints the stage table and the top cProfile functions, and writes
+    the pstats dump and the Chrome trace.
+
+    Args:
+        args (argparse.Namespace): Parsed arguments with profile / profile_trace
+
+    Yields:
+        Profiler or None: The active profiler, or None when profiling is off
+    """
+    if not args.profile and not args.profile_trace:
+        yield None
+        return
+
+    profiler = Profiler(cprofile=bool(args.profile))
+    profiler.start()
+    try:
+        yield profiler
+    finally:
+        profiler.stop()
+        print("\n" + "=" * 60)
+        print("프로파일 (단계별)")
+        print("=" * 60)
+        print(profiler.stage_table())
+        if args.profile:
+            print("\n" + profiler.top_functions())
+            print(f"cProfile 저장: {profiler.dump_stats(args.profile)}")
+        if args.profile_trace:
+            print(f"Chrome trace 저장: {profiler.write_trace(args.profile_trace)}")
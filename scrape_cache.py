@@ -0,0 +1,295 @@
+"""
+Local cache of scraped financial statement tables.
+
+Parsed tables are stored content-addressed: under the SHA-256 of the
+statement table's markup (financials_table.table_markup, or the whole page
+if the table cannot be cut out), so the rest of the page (scripts, build
+ids, ads) does not count as a change. A second table maps each
+(ticker, statement, period) view to the hash of its latest page with the
+time it was last fetched and last changed.
+
+That gives the scraper three levels of reuse:
+
+- fresh(): a view fetched less than max_age seconds ago is served without
+  any network or browser work
+- parse(): a refetched page whose table hash is already stored is not parsed
+  again
+- output_current(): a view whose files were last written from the same
+  table, to the same path and in the same format (strings or numbers) does
+  not need its CSV/Excel files rewritten (record_output() after each write)
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+import pandas as pd
+
+import metrics
+from financials_table import table_markup
+from ohlcv_cache import default_cache_path
+
+
+def page_hash(html):
+    """
+    Return the content hash of a statement page.
+
+    Args:
+        html (str): Page HTML
+
+    Returns:
+        str: Hex SHA-256 of the page's table markup (of the whole page if it has no separable table)
+    """
+    markup = table_markup(html)
+    return hashlib.sha256((markup if markup is not None else html).encode('utf-8')).hexdigest()
+
+
+def _encode_table(df):
+    """Serialize a table of strings to JSON (index name, index, columns and cell values)."""
+    return json.dumps({
+        'index_name': df.index.name,
+        'index': df.index.tolist(),
+        'columns': df.columns.tolist(),
+        'data': df.astype(object).where(df.notna(), None).to_numpy().tolist(),
+    }, ensure_ascii=False)
+
+
+def _decode_table(text):
+    """Rebuild a table serialized by _encode_table."""
+    table = json.loads(text)
+    index = pd.Index(table['index'], name=table['index_name'])
+    return pd.DataFrame(table['data'], index=index, columns=table['columns'])
+
+
+class ScrapeCache:
+    """SQLite-backed store of parsed statement tables and per-view page hashes. Thread-safe."""
+
+    def __init__(self, path=None):
+        """
+        Args:
+            path (str): SQLite file path (default: scrape.sqlite in the finance_util cache directory)
+        """
+        if path is None:
+            path = default_cache_path('scrape.sqlite')
+
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory, exist_ok=True)
+
+        self.path = path
+        self.fresh_hits = 0
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS tables ("
+            " hash TEXT PRIMARY KEY,"
+            " body TEXT NOT NULL,"
+            " stored_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS pages ("
+            " ticker TEXT NOT NULL,"
+            " statement TEXT NOT NULL,"
+            " period TEXT NOT NULL,"
+            " hash TEXT NOT NULL,"
+            " fetched_at REAL NOT NULL,"
+            " changed_at REAL NOT NULL,"
+            " PRIMARY KEY (ticker, statement, period))"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS outputs ("
+            " ticker TEXT NOT NULL,"
+            " statement TEXT NOT NULL,"
+            " period TEXT NOT NULL,"
+            " hash TEXT NOT NULL,"
+            " base_name TEXT NOT NULL,"
+            " mode TEXT NOT NULL,"
+            " written_at REAL NOT NULL,"
+            " PRIMARY KEY (ticker, statement, period))"
+        )
+        self._conn.commit()
+
+    def entry(self, ticker, statement, period):
+        """
+        Return the stored state of a view.
+
+        Returns:
+            dict or None: {'hash', 'fetched_at', 'changed_at'}, or None if the view was never cached
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT hash, fetched_at, changed_at FROM pages WHERE ticker = ? AND statement = ? AND period = ?",
+                (ticker.upper(), statement, period)
+            ).fetchone()
+        return dict(zip(('hash', 'fetched_at', 'changed_at'), row)) if row is not None else None
+
+    def fresh(self, ticker, statement, period, max_age):
+        """
+        Return the cached table of a view fetched less than max_age seconds ago.
+
+        Args:
+            ticker (str): Stock ticker symbol
+            statement (str): Statement name (financials, balance-sheet, cash-flow-statement)
+            period (str): 'quarterly' or 'annual'
+            max_age (float): Freshness limit in seconds
+
+        Returns:
+            pd.DataFrame or None: Cached table, or None if the view is missing or stale
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT t.body, p.fetched_at FROM pages p JOIN tables t ON t.hash = p.hash"
+                " WHERE p.ticker = ? AND p.statement = ? AND p.period = ?",
+                (ticker.upper(), statement, period)
+            ).fetchone()
+            if row is None or time.time() - row[1] >= max_age:
+                return None
+            self.fresh_hits += 1
+        metrics.inc('cache_requests_total', cache='scrape', result='fresh')
+        return _decode_table(row[0])
+
+    def parse(self, ticker, statement, period, html, parser):
+        """
+        Return the table of a freshly fetched page, parsing it only if its content is new.
+
+        Records the page as the view's latest fetch; the view's changed_at
+        moves only when the content hash differs from the previous fetch.
+
+        Args:
+            ticker (str): Stock ticker symbol
+            statement (str): Statement name
+            period (str): 'quarterly' or 'annual'
+            html (str): Page HTML
+            parser (callable): html -> DataFrame of strings, called on a cache miss
+
+        Returns:
+            pd.DataFrame: Parsed or cached table
+
+        Raises:
+            Whatever parser raises for a page without a table (nothing is recorded)
+        """
+        digest = page_hash(html)
+        with self._lock:
+            row = self._conn.execute("SELECT body FROM tables WHERE hash = ?", (digest,)).fetchone()
+
+        if row is not None:
+            self.hits += 1
+            metrics.inc('cache_requests_total', cache='scrape', result='hit')
+            df = _decode_table(row[0])
+        else:
+            self.misses += 1
+            metrics.inc('cache_requests_total', cache='scrape', result='miss')
+            df = parser(html)
+
+        self._record(ticker.upper(), statement, period, digest, None if row is not None else _encode_table(df))
+        return df
+
+    def _record(self, ticker, statement, period, digest, body):
+        """Store a new table body (if given) and point the view at digest."""
+        now = time.time()
+        with self._lock:
+            if body is not None:
+                self._conn.execute("INSERT OR REPLACE INTO tables VALUES (?, ?, ?)", (digest, body, now))
+            previous = self._conn.execute(
+                "SELECT hash, changed_at FROM pages WHERE ticker = ? AND statement = ? AND period = ?",
+                (ticker, statement, period)
+            ).fetchone()
+            changed_at = previous[1] if previous is not None and previous[0] == digest else now
+            self._conn.execute("INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?, ?)",
+                               (ticker, statement, period, digest, now, changed_at))
+            if previous is not None and previous[0] != digest:
+                # Drop the replaced table unless another view still points at it
+                self._conn.execute(
+                    "DELETE FROM tables WHERE hash = ? AND NOT EXISTS (SELECT 1 FROM pages WHERE hash = ?)",
+                    (previous[0], previous[0])
+                )
+            self._conn.commit()
+
+    def changed_since(self, ticker, statement, period, since):
+        """
+        Return True if a view's table changed at or after since (or the view is not cached).
+
+        Args:
+            since (float): Epoch seconds, usually the start of the current run
+        """
+        entry = self.entry(ticker, statement, period)
+        return entry is None or entry['changed_at'] >= since
+
+    def record_output(self, ticker, statement, period, base_name, mode):
+        """
+        Remember that a view's current table was written to base_name in the given format.
+
+        Args:
+            ticker (str): Stock ticker symbol
+            statement (str): Statement name
+            period (str): 'quarterly' or 'annual'
+            base_name (str): Output path without extension
+            mode (str): Output format, e.g. 'text' or 'numeric'
+        """
+        entry = self.entry(ticker, statement, period)
+        if entry is None:
+            return
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO outputs VALUES (?, ?, ?, ?, ?, ?, ?)",
+                               (ticker.upper(), statement, period, entry['hash'], base_name, mode, time.time()))
+            self._conn.commit()
+
+    def output_current(self, ticker, statement, period, base_name, mode):
+        """
+        Return True if the last recorded write of a view matches its current table, path and format.
+
+        Args:
+            base_name (str): Output path without extension
+            mode (str): Output format, e.g. 'text' or 'numeric'
+        """
+        entry = self.entry(ticker, statement, period)
+        if entry is None:
+            return False
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT hash, base_name, mode FROM outputs WHERE ticker = ? AND statement = ? AND period = ?",
+                (ticker.upper(), statement, period)
+            ).fetchone()
+        return row is not None and tuple(row) == (entry['hash'], base_name, mode)
+
+    def invalidate(self, ticker=None):
+        """
+        Forget cached views so the next run fetches, parses and writes them again.
+
+        Args:
+            ticker (str): Only forget this ticker (default: everything)
+
+        Returns:
+            int: Number of views removed
+        """
+        with self._lock:
+            if ticker is None:
+                cursor = self._conn.execute("DELETE FROM pages")
+                self._conn.execute("DELETE FROM outputs")
+            else:
+                cursor = self._conn.execute("DELETE FROM pages WHERE ticker = ?", (ticker.upper(),))
+                self._conn.execute("DELETE FROM outputs WHERE ticker = ?", (ticker.upper(),))
+            self._conn.execute("DELETE FROM tables WHERE hash NOT IN (SELECT hash FROM pages)")
+            self._conn.commit()
+            return cursor.rowcount
+
+    def stats(self):
+        """
+        Return counters since creation.
+
+        Returns:
+            dict: {'fresh': views served without fetching,
+                   'hits': refetched pages whose table was already stored (not parsed),
+                   'misses': pages that had to be parsed}
+        """
+        return {'fresh': self.fresh_hits, 'hits': self.hits, 'misses': self.misses}
+
+    def close(self):
+        """Close the underlying SQLite connection."""
+        with self._lock:
+            self._conn.close()
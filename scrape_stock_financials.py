@@ -4,34 +4,77 @@ StockAnalysis.com 재무제표 데이터 스크래퍼
 stockanalysis.com에서 주식 재무제표(Income Statement) 테이블을 다운로드하여
 CSV 및 Excel 파일로 저장합니다.
 
+페이지는 먼저 일반 HTTP 요청으로 가져와 서버가 렌더링한 테이블을 바로
+파싱합니다. 요청이 차단되거나 테이블이 없을 때만 Chrome(Selenium)을 띄웁니다.
+
 사용법:
     python scrape_stock_financials.py                    # NVDA 분기별 (기본값)
     python scrape_stock_financials.py --ticker AAPL      # AAPL 분기별
     python scrape_stock_financials.py --period annual    # NVDA 연간
     python scrape_stock_financials.py --output my_data   # 출력 파일명 지정
     python scrape_stock_financials.py --visible          # Chrome 창 보이게 실행
+    python scrape_stock_financials.py --selenium         # HTTP 경로 없이 바로 Chrome 사용
+    python scrape_stock_financials.py --ticker NVDA AAPL MSFT --statement financials balance-sheet --drivers 3
+                                                         # 티커 x 재무제표 작업을 Chrome 3개 풀로 나눠 처리
+    python scrape_stock_financials.py --numeric          # 값을 숫자(float)로 변환해 저장 (12.5% -> 0.125)
+    python scrape_stock_financials.py --ticker NVDA AAPL --all --max-age 7d
+                                                         # 7일 안에 가져온 화면은 캐시 사용, 바뀐 화면만 저장
+    python scrape_stock_financials.py --ticker NVDA --all   # 재무제표 3종 x 분기/연간 6개 화면 (세션 하나)
 
 필수 패키지:
-    pip install selenium beautifulsoup4 pandas openpyxl
+    pip install selenium lxml pandas openpyxl
 
-Chrome/Chromium 브라우저 및 ChromeDriver가 설치되어 있어야 합니다.
+Selenium 경로를 쓰려면 Chrome/Chromium 브라우저 및 ChromeDriver가 설치되어 있어야 합니다.
     - ChromeDriver: https://chromedriver.chromium.org/downloads
     - 또는: pip install webdriver-manager
 """
 
 import argparse
+import os
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from urllib.parse import urlparse
 
-import pandas as pd
-from bs4 import BeautifulSoup
+import requests
 from selenium import webdriver
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
+import financials_table
+import metrics
+import profiling
+from scrape_cache import ScrapeCache
+from finance_util.transport import get_http_session
+from http_retry import get_scheduler
+
+
+# FINANCE_UTIL_STOCKANALYSIS_URL은 로컬 대역 서버를 가리킬 때 사용 (stub_server.py 참고)
+STOCKANALYSIS_URL = os.environ.get('FINANCE_UTIL_STOCKANALYSIS_URL', "https://stockanalysis.com")
+
+# HTTP 경로에서 브라우저처럼 보이도록 보내는 헤더
+PAGE_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+# Selenium 경로에서 테이블이 나타난 뒤 나머지 행이 렌더링되기를 기다리는 시간 (초)
+SELENIUM_SETTLE_SECONDS = 3
+
+STATEMENTS = ["financials", "balance-sheet", "cash-flow-statement"]
+PERIODS = ["quarterly", "annual"]
+
+# DriverPool 기본값: 동시에 띄울 Chrome 수, 드라이버 하나가 교체 전까지 여는 페이지 수
+DRIVER_POOL_SIZE = 2
+DRIVER_MAX_PAGES = 50
+
 
 def create_driver(headless=True):
     """Chrome WebDriver를 생성합니다."""
@@ -71,88 +114,507 @@ def create_driver(headless=True):
     return driver
 
 
+def _quit_driver(driver):
+    """드라이버를 종료합니다 (이미 죽은 드라이버의 종료 오류는 무시)."""
+    try:
+        driver.quit()
+    except Exception:
+        pass
+
+
+class DriverPool:
+    """
+    여러 작업자가 함께 쓰는 오래 유지되는 Chrome 드라이버 풀.
+
+    작업자는 driver()로 드라이버를 빌려 쓰고 반환합니다. 드라이버는 처음
+    필요할 때 만들어지고, max_pages 페이지를 연 뒤나 크래시(시간 초과가
+    아닌 WebDriverException) 뒤에는 종료되어 다음 대여 때 새로 만들어집니다.
+    페이지 수는 반환할 때 확인하므로, 한 번 대여에 여러 페이지를 여는
+    경우(scrape_ticker_views) 그 세션이 끝난 뒤 교체됩니다. 스레드 안전합니다.
+
+    Args:
+        size (int): 동시에 유지할 최대 드라이버 수 (기본값: 2)
+        max_pages (int): 드라이버를 교체하기 전까지 열 페이지 수 (기본값: 50)
+        headless (bool): 창 없이 실행 (기본값: True)
+        factory (callable): factory(headless=...)로 드라이버 생성 (기본값: create_driver)
+
+    Raises:
+        ValueError: size 또는 max_pages가 1보다 작은 경우
+    """
+
+    def __init__(self, size=DRIVER_POOL_SIZE, max_pages=DRIVER_MAX_PAGES, headless=True, factory=None):
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        if max_pages < 1:
+            raise ValueError("max_pages must be at least 1")
+        self.size = size
+        self.max_pages = max_pages
+        self.headless = headless
+        self._factory = factory
+        self._slots = threading.Semaphore(size)
+        self._lock = threading.Lock()
+        self._idle = []
+        self._pages = {}
+        self._closed = False
+        self.started = 0
+        self.recycled = 0
+
+    def acquire(self):
+        """
+        드라이버를 빌립니다 (모든 드라이버가 사용 중이면 반환될 때까지 대기).
+
+        Raises:
+            RuntimeError: 풀이 닫혔거나 Chrome WebDriver를 시작할 수 없는 경우
+        """
+        self._slots.acquire()
+        with self._lock:
+            if self._closed:
+                self._slots.release()
+                raise RuntimeError("DriverPool is closed")
+            if self._idle:
+                return self._idle.pop()
+
+        try:
+            with profiling.stage("driver_start"):
+                # create_driver는 실패 시 종료(sys.exit)하므로 작업자 스레드에서는 예외로 바꿈
+                driver = (self._factory or create_driver)(headless=self.headless)
+        except SystemExit:
+            self._slots.release()
+            raise RuntimeError("Chrome WebDriver를 시작할 수 없습니다.")
+        except BaseException:
+            self._slots.release()
+            raise
+
+        with self._lock:
+            self._pages[id(driver)] = 0
+            self.started += 1
+        metrics.inc("driver_pool_events_total", event="start")
+        return driver
+
+    def release(self, driver, pages=1, broken=False):
+        """
+        빌린 드라이버를 반환합니다.
+
+        Args:
+            driver: acquire로 빌린 드라이버
+            pages (int): 이번 대여 동안 연 페이지 수 (기본값: 1)
+            broken (bool): 드라이버가 크래시한 경우 True (바로 교체)
+        """
+        event = None
+        with self._lock:
+            count = self._pages.get(id(driver), 0) + pages
+            retire = broken or self._closed or count >= self.max_pages
+            if retire:
+                self._pages.pop(id(driver), None)
+                if broken or not self._closed:
+                    event = "crash" if broken else "recycle"
+                    self.recycled += 1
+            else:
+                self._pages[id(driver)] = count
+                self._idle.append(driver)
+        if retire:
+            _quit_driver(driver)
+        if event:
+            metrics.inc("driver_pool_events_total", event=event)
+        self._slots.release()
+
+    @contextmanager
+    def driver(self, pages=1):
+        """
+        with 블록 동안 드라이버를 빌립니다.
+
+        블록에서 시간 초과가 아닌 WebDriverException이 발생하면 드라이버를
+        크래시한 것으로 보고 교체합니다.
+
+        Args:
+            pages (int): 블록에서 열 페이지 수 (기본값: 1)
+        """
+        driver = self.acquire()
+        broken = False
+        try:
+            yield driver
+        except WebDriverException as e:
+            broken = not isinstance(e, TimeoutException)
+            raise
+        finally:
+            self.release(driver, pages, broken)
+
+    def close(self):
+        """쉬고 있는 드라이버를 모두 종료합니다 (사용 중인 드라이버는 반환될 때 종료)."""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            for driver in idle:
+                self._pages.pop(id(driver), None)
+        for driver in idle:
+            _quit_driver(driver)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
 def build_url(ticker, period="quarterly", statement="financials"):
     """StockAnalysis URL을 생성합니다."""
-    base = f"https://stockanalysis.com/stocks/{ticker.lower()}/{statement}/"
+    base = f"{STOCKANALYSIS_URL}/stocks/{ticker.lower()}/{statement}/"
     if period == "quarterly":
         base += "?p=quarterly"
     return base
 
 
-def scrape_financials(ticker="NVDA", period="quarterly", statement="financials",
-                      headless=True):
-    """StockAnalysis.com에서 재무제표 테이블을 스크래핑합니다."""
-    url = build_url(ticker, period, statement)
-    print(f"URL: {url}")
-    print(f"데이터를 가져오는 중... (headless={headless})")
+def parse_financials_table(html, numeric=False):
+    """
+    재무제표 페이지 HTML에서 첫 번째 테이블을 DataFrame으로 변환합니다.
 
-    driver = create_driver(headless=headless)
+    lxml로 테이블 부분만 잘라 파싱합니다 (financials_table.read_table).
 
-    try:
-        driver.get(url)
-        print(f"페이지 로딩 중... (최대 30초 대기)")
+    Args:
+        html (str): 페이지 HTML
+        numeric (bool): 값을 float로 변환 (천 단위 구분자, %, B/M 접미사,
+                        괄호 음수, '-' 처리; 기본값: False = 화면에 보이는 문자열)
 
-        # 테이블이 로드될 때까지 대기
+    Returns:
+        pd.DataFrame: 첫 번째 열(항목명)을 인덱스로 하는 재무제표 테이블
+
+    Raises:
+        RuntimeError: 테이블이 없거나 데이터 행이 없는 경우
+    """
+    with metrics.timer("parse_seconds", kind="financials"):
+        try:
+            df = financials_table.read_table(html)
+        except ValueError as e:
+            raise RuntimeError(f"페이지에서 재무제표 테이블을 찾을 수 없습니다 ({e}).")
+        return financials_table.to_numeric(df) if numeric else df
+
+
+def fetch_financials_http(url, parse=parse_financials_table):
+    """
+    재무제표 페이지를 일반 HTTP 요청으로 가져와 테이블을 파싱합니다.
+
+    요청은 공유 세션과 호스트별 속도 제한/재시도 스케줄러를 사용합니다.
+
+    Args:
+        url (str): build_url로 만든 페이지 URL
+        parse (callable): HTML -> DataFrame 파서 (기본값: parse_financials_table)
+
+    Returns:
+        pd.DataFrame: parse_financials_table 결과
+
+    Raises:
+        requests.exceptions.RequestException: 요청이 차단되거나 재시도 후에도 실패한 경우
+        RuntimeError: 응답 HTML에 테이블이 없는 경우 (스크립트로 렌더링되는 페이지)
+    """
+    with profiling.stage("page_load"):
+        response = get_scheduler().request(get_http_session(), "GET", url, verbose=False,
+                                           headers=PAGE_HEADERS, timeout=15)
+    with profiling.stage("parse"):
+        return parse(response.text)
+
+
+def _render_financials(driver, url, parse=parse_financials_table):
+    """열려 있는 드라이버로 페이지를 불러와 테이블이 나타나면 파싱합니다."""
+    # 페이지 요청도 다른 fetcher와 같은 호스트별 속도 제한/재시도 정책을 따름
+    with profiling.stage("page_load"):
+        get_scheduler().call(urlparse(url).hostname, driver.get, url,
+                             retry_on=(WebDriverException,))
+    print(f"페이지 로딩 중... (최대 30초 대기)")
+
+    # 테이블이 로드될 때까지 대기
+    with profiling.stage("wait"):
         WebDriverWait(driver, 30).until(
             EC.presence_of_element_located((By.CSS_SELECTOR, "table"))
         )
-        time.sleep(3)
-
-        soup = BeautifulSoup(driver.page_source, "html.parser")
-        table = soup.find("table")
-
-        if not table:
-            raise RuntimeError("페이지에서 테이블을 찾을 수 없습니다.")
-
-        # 헤더 추출 - thead의 마지막 tr만 사용 (상위 행은 그룹 헤더일 수 있음)
-        headers = []
-        thead = table.find("thead")
-        if thead:
-            header_rows = thead.find_all("tr")
-            if header_rows:
-                last_header_row = header_rows[-1]
-                for th in last_header_row.find_all("th"):
-                    headers.append(th.get_text(strip=True))
-
-        # 데이터 행 추출
-        rows = []
-        tbody = table.find("tbody")
-        if tbody:
-            for tr in tbody.find_all("tr"):
-                cells = [td.get_text(strip=True) for td in tr.find_all("td")]
-                if cells:
-                    rows.append(cells)
-
-        if not rows:
-            raise RuntimeError("테이블에 데이터가 없습니다.")
-
-        # 헤더와 데이터 열 수가 맞지 않으면 데이터 기준으로 조정
-        num_cols = len(rows[0])
-        if headers and len(headers) != num_cols:
-            print(f"  헤더({len(headers)}개)와 데이터({num_cols}개) 열 수 불일치, 조정 중...")
-            if len(headers) > num_cols:
-                headers = headers[:num_cols]
-            else:
-                headers = headers + [f"Col_{i}" for i in range(len(headers), num_cols)]
+        time.sleep(SELENIUM_SETTLE_SECONDS)
+
+    with profiling.stage("parse"):
+        return parse(driver.page_source)
+
 
-        df = pd.DataFrame(rows, columns=headers if headers else None)
+def fetch_financials_selenium(url, headless=True, pool=None, parse=parse_financials_table):
+    """
+    Chrome(Selenium)으로 재무제표 페이지를 렌더링한 뒤 테이블을 파싱합니다.
 
-        if not df.empty and len(df.columns) > 0:
-            df = df.set_index(df.columns[0])
+    Args:
+        url (str): build_url로 만든 페이지 URL
+        headless (bool): 창 없이 실행 (기본값: True, pool을 쓰면 무시)
+        pool (DriverPool): 드라이버를 빌려 쓸 풀 (None이면 새 드라이버를 띄우고 종료)
+        parse (callable): HTML -> DataFrame 파서 (기본값: parse_financials_table)
 
-        print(f"성공: {len(df)} 행 x {len(df.columns)} 열 데이터를 가져왔습니다.")
-        return df
+    Returns:
+        pd.DataFrame: parse_financials_table 결과
+    """
+    if pool is not None:
+        with pool.driver() as driver:
+            return _render_financials(driver, url, parse)
 
+    with profiling.stage("driver_start"):
+        driver = create_driver(headless=headless)
+    try:
+        return _render_financials(driver, url, parse)
     finally:
         driver.quit()
 
 
-def save_data(df, output_name, ticker, period):
+def _view_parser(ticker, statement, period, cache):
+    """cache가 있으면 내용이 같은 페이지는 다시 파싱하지 않는 파서를 반환합니다."""
+    if cache is None:
+        return parse_financials_table
+    return lambda html: cache.parse(ticker, statement, period, html, parse_financials_table)
+
+
+def scrape_financials(ticker="NVDA", period="quarterly", statement="financials",
+                      headless=True, use_http=True, pool=None, cache=None, max_age=None):
+    """
+    StockAnalysis.com에서 재무제표 테이블을 스크래핑합니다.
+
+    먼저 HTTP 요청으로 가져오고, 실패하면(차단, 테이블 없음) Selenium으로
+    다시 시도합니다. cache를 주면 테이블 내용이 이전과 같은 페이지는 다시
+    파싱하지 않고, max_age 안에 가져온 화면은 요청 없이 캐시에서 반환합니다.
+
+    Args:
+        ticker (str): 주식 티커 심볼
+        period (str): 'quarterly' 또는 'annual'
+        statement (str): 재무제표 종류 (financials, balance-sheet, cash-flow-statement)
+        headless (bool): Selenium 경로에서 창 없이 실행 (기본값: True)
+        use_http (bool): HTTP 경로를 먼저 시도 (기본값: True, False면 바로 Selenium)
+        pool (DriverPool): Selenium 경로에서 빌려 쓸 드라이버 풀 (None이면 드라이버를 새로 띄움)
+        cache (ScrapeCache): 파싱된 테이블 캐시 (기본값: None = 캐시 없음)
+        max_age (float): 이 시간(초) 안에 가져온 화면은 캐시에서 반환 (기본값: None = 항상 다시 확인)
+
+    Returns:
+        pd.DataFrame: 첫 번째 열(항목명)을 인덱스로 하는 재무제표 테이블
+    """
+    url = build_url(ticker, period, statement)
+    print(f"URL: {url}")
+
+    if cache is not None and max_age is not None:
+        df = cache.fresh(ticker, statement, period, max_age)
+        if df is not None:
+            print(f"캐시 사용: {len(df)} 행 x {len(df.columns)} 열 (최근 {_format_age(max_age)} 안에 가져옴)")
+            return df
+
+    parse = _view_parser(ticker, statement, period, cache)
+    df = None
+    if use_http:
+        print("데이터를 가져오는 중... (HTTP)")
+        try:
+            df = fetch_financials_http(url, parse)
+            metrics.inc("scrape_pages_total", path="http")
+        except (requests.exceptions.RequestException, RuntimeError) as e:
+            print(f"  HTTP 경로 실패 ({type(e).__name__}: {e}), Chrome으로 다시 시도합니다.")
+
+    if df is None:
+        print(f"데이터를 가져오는 중... (Chrome, headless={headless})")
+        df = fetch_financials_selenium(url, headless, pool, parse)
+        metrics.inc("scrape_pages_total", path="selenium")
+
+    print(f"성공: {len(df)} 행 x {len(df.columns)} 열 데이터를 가져왔습니다.")
+    return df
+
+
+def _scrape_views_selenium(ticker, views, headless, pool, cache=None):
+    """
+    한 브라우저 세션으로 여러 화면을 차례로 불러옵니다 (콜드 스타트 1회 + 웜 이동).
+
+    Returns:
+        tuple: (results, errors), (statement, period) 키
+    """
+    results = {}
+    errors = {}
+    if pool is not None:
+        driver = pool.acquire()
+    else:
+        try:
+            with profiling.stage("driver_start"):
+                driver = create_driver(headless=headless)
+        except SystemExit:
+            raise RuntimeError("Chrome WebDriver를 시작할 수 없습니다.")
+
+    pages = 0
+    crashed = False
+    try:
+        for statement, period in views:
+            if crashed:
+                errors[(statement, period)] = "Chrome 드라이버가 중단되었습니다."
+                continue
+            pages += 1
+            try:
+                results[(statement, period)] = _render_financials(
+                    driver, build_url(ticker, period, statement), _view_parser(ticker, statement, period, cache))
+                metrics.inc("scrape_pages_total", path="selenium")
+            except (TimeoutException, RuntimeError) as e:
+                errors[(statement, period)] = str(e) or type(e).__name__
+            except WebDriverException as e:
+                errors[(statement, period)] = str(e) or type(e).__name__
+                crashed = True
+    finally:
+        if pool is not None:
+            pool.release(driver, pages, broken=crashed)
+        else:
+            driver.quit()
+    return results, errors
+
+
+def scrape_ticker_views(ticker, views, headless=True, use_http=True, pool=None, cache=None, max_age=None):
+    """
+    한 티커의 여러 화면((statement, period))을 한 세션으로 스크래핑합니다.
+
+    모든 화면을 먼저 공유 HTTP 세션(keep-alive 연결, 쿠키)으로 가져오고,
+    실패한 화면만 브라우저 하나로 차례로 불러옵니다. 브라우저는 티커당
+    한 번만 시작되고 나머지 화면은 캐시와 쿠키가 남아 있는 상태로 이동합니다.
+    cache/max_age는 scrape_financials와 같습니다.
+
+    Args:
+        ticker (str): 주식 티커 심볼
+        views (list): (statement, period) 튜플 리스트
+        headless (bool): Selenium 경로에서 창 없이 실행 (기본값: True)
+        use_http (bool): HTTP 경로를 먼저 시도 (기본값: True)
+        pool (DriverPool): Selenium 경로에서 빌려 쓸 드라이버 풀 (None이면 드라이버를 새로 띄움)
+        cache (ScrapeCache): 파싱된 테이블 캐시 (기본값: None = 캐시 없음)
+        max_age (float): 이 시간(초) 안에 가져온 화면은 캐시에서 반환 (기본값: None = 항상 다시 확인)
+
+    Returns:
+        tuple: (results, errors), 둘 다 입력 순서의 (statement, period) 키
+               - results (dict): 화면 -> DataFrame
+               - errors (dict): 화면 -> 오류 메시지
+    """
+    views = list(dict.fromkeys(views))
+    results = {}
+    pending = views
+    if cache is not None and max_age is not None:
+        for statement, period in views:
+            df = cache.fresh(ticker, statement, period, max_age)
+            if df is not None:
+                results[(statement, period)] = df
+        pending = [view for view in views if view not in results]
+
+    if use_http:
+        views_to_fetch, pending = pending, []
+        for statement, period in views_to_fetch:
+            try:
+                results[(statement, period)] = fetch_financials_http(
+                    build_url(ticker, period, statement), _view_parser(ticker, statement, period, cache))
+                metrics.inc("scrape_pages_total", path="http")
+            except (requests.exceptions.RequestException, RuntimeError) as e:
+                print(f"  [{ticker} {statement} ({period})] HTTP 경로 실패 ({type(e).__name__}), Chrome으로 다시 시도합니다.")
+                pending.append((statement, period))
+
+    errors = {}
+    if pending:
+        try:
+            browser_results, errors = _scrape_views_selenium(ticker, pending, headless, pool, cache)
+            results.update(browser_results)
+        except RuntimeError as e:
+            # 브라우저를 시작할 수 없어도 HTTP로 가져온 화면은 그대로 반환
+            errors = {view: str(e) for view in pending}
+
+    return (
+        {view: results[view] for view in views if view in results},
+        {view: errors[view] for view in views if view in errors},
+    )
+
+
+def scrape_ticker_all(ticker, headless=True, use_http=True, pool=None, cache=None, max_age=None):
+    """
+    한 티커의 재무제표 3종 x 분기/연간 6개 화면을 한 세션으로 스크래핑합니다.
+
+    Args:
+        ticker (str): 주식 티커 심볼
+        headless (bool): Selenium 경로에서 창 없이 실행 (기본값: True)
+        use_http (bool): HTTP 경로를 먼저 시도 (기본값: True)
+        pool (DriverPool): Selenium 경로에서 빌려 쓸 드라이버 풀 (None이면 드라이버를 새로 띄움)
+        cache (ScrapeCache): 파싱된 테이블 캐시 (기본값: None = 캐시 없음)
+        max_age (float): 이 시간(초) 안에 가져온 화면은 캐시에서 반환 (기본값: None = 항상 다시 확인)
+
+    Returns:
+        dict: (statement, period) -> DataFrame (STATEMENTS x PERIODS 순서)
+
+    Raises:
+        RuntimeError: 한 화면이라도 가져오지 못한 경우
+    """
+    views = [(statement, period) for statement in STATEMENTS for period in PERIODS]
+    results, errors = scrape_ticker_views(ticker, views, headless, use_http, pool, cache, max_age)
+    if errors:
+        failed = ", ".join(f"{statement} ({period}): {error}" for (statement, period), error in errors.items())
+        raise RuntimeError(f"{ticker} 화면을 가져오지 못했습니다 - {failed}")
+    return results
+
+
+def scrape_many(jobs, pool=None, use_http=True, max_workers=DRIVER_POOL_SIZE, cache=None, max_age=None):
+    """
+    여러 (ticker, statement, period) 작업을 작업자 스레드에 나눠 스크래핑합니다.
+
+    작업은 티커별로 묶여 scrape_ticker_views로 처리되므로, 티커마다 브라우저
+    세션은 많아야 하나입니다. HTTP 경로는 공유 세션과 호스트별 속도 제한을
+    따르고, Selenium 경로는 pool의 드라이버를 빌려 씁니다. 한 작업의 실패는
+    errors에 기록되고 나머지 작업은 계속됩니다.
+
+    Args:
+        jobs (list): (ticker, statement, period) 튜플 리스트
+        pool (DriverPool): Selenium 경로에서 쓸 드라이버 풀 (None이면 티커마다 새 드라이버)
+        use_http (bool): HTTP 경로를 먼저 시도 (기본값: True)
+        max_workers (int): 작업자 스레드 수 (기본값: 2)
+        cache (ScrapeCache): 파싱된 테이블 캐시 (기본값: None = 캐시 없음)
+        max_age (float): 이 시간(초) 안에 가져온 화면은 캐시에서 반환 (기본값: None = 항상 다시 확인)
+
+    Returns:
+        tuple: (results, errors), 둘 다 입력 순서의 (ticker, statement, period) 키
+               - results (dict): 작업 -> DataFrame
+               - errors (dict): 작업 -> 오류 메시지
+
+    Raises:
+        ValueError: jobs가 비어 있거나 max_workers가 1보다 작은 경우
+    """
+    if not jobs:
+        raise ValueError("jobs cannot be empty")
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+
+    jobs = list(dict.fromkeys(jobs))
+    views_by_ticker = {}
+    for ticker, statement, period in jobs:
+        views_by_ticker.setdefault(ticker, []).append((statement, period))
+    results = {}
+    errors = {}
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(views_by_ticker))) as executor:
+        futures = {
+            executor.submit(scrape_ticker_views, ticker, views, use_http=use_http, pool=pool,
+                            cache=cache, max_age=max_age): ticker
+            for ticker, views in views_by_ticker.items()
+        }
+        for future in as_completed(futures):
+            ticker = futures[future]
+            try:
+                ticker_results, ticker_errors = future.result()
+            except Exception as e:
+                ticker_results, ticker_errors = {}, {view: str(e) for view in views_by_ticker[ticker]}
+            for (statement, period), df in ticker_results.items():
+                results[(ticker, statement, period)] = df
+            for (statement, period), error in ticker_errors.items():
+                errors[(ticker, statement, period)] = error
+
+    return (
+        {job: results[job] for job in jobs if job in results},
+        {job: errors[job] for job in jobs if job in errors},
+    )
+
+
+def output_basename(ticker, period, statement="financials"):
+    """기본 출력 파일명 (확장자 제외). 손익계산서는 기존 이름 그대로, 그 외는 재무제표 이름을 붙임."""
+    if statement == "financials":
+        return f"{ticker.lower()}_{period}_financials"
+    return f"{ticker.lower()}_{period}_{statement}"
+
+
+def save_data(df, output_name, ticker, period, statement="financials"):
     """DataFrame을 CSV와 Excel 파일로 저장합니다."""
     if output_name:
         base_name = output_name
     else:
-        base_name = f"{ticker.lower()}_{period}_financials"
+        base_name = output_basename(ticker, period, statement)
 
     csv_path = f"{base_name}.csv"
     xlsx_path = f"{base_name}.xlsx"
@@ -160,54 +622,205 @@ def save_data(df, output_name, ticker, period):
     df.to_csv(csv_path, encoding="utf-8-sig")
     print(f"CSV 저장: {csv_path}")
 
-    df.to_excel(xlsx_path, engine="openpyxl")
+    with metrics.timer("excel_write_seconds", writer="scraper"):
+        df.to_excel(xlsx_path, engine="openpyxl")
     print(f"Excel 저장: {xlsx_path}")
 
     return csv_path, xlsx_path
 
 
+# --max-age 단위 (접미사 없으면 초)
+AGE_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+def parse_max_age(text):
+    """
+    --max-age 값을 초로 변환합니다 (예: "3600", "30m", "12h", "7d").
+
+    Raises:
+        argparse.ArgumentTypeError: 형식이 잘못되었거나 음수인 경우
+    """
+    value = text.strip().lower()
+    unit = AGE_UNITS.get(value[-1:]) if value else None
+    try:
+        seconds = float(value[:-1] if unit else value) * (unit or 1)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"잘못된 기간입니다: {text!r} (예: 3600, 30m, 12h, 7d)")
+    if seconds < 0:
+        raise argparse.ArgumentTypeError(f"기간은 0 이상이어야 합니다: {text!r}")
+    return seconds
+
+
+def _format_age(seconds):
+    """초를 가장 큰 단위로 표시합니다 (예: 604800 -> '7d')."""
+    for suffix, size in sorted(AGE_UNITS.items(), key=lambda item: -item[1]):
+        if seconds >= size and seconds % size == 0:
+            return f"{int(seconds // size)}{suffix}"
+    return f"{seconds:g}s"
+
+
+def _output_mode(args):
+    """출력 형식 이름 ('numeric' 또는 'text'), 스크랩 캐시에 저장 기록과 함께 남깁니다."""
+    return "numeric" if args.numeric else "text"
+
+
+def _unchanged(cache, ticker, statement, period, base_name, mode):
+    """
+    마지막 저장이 같은 테이블, 같은 경로, 같은 형식이고 출력 파일이 남아 있으면 True를 반환합니다.
+
+    --numeric을 켜거나 끄면 테이블이 같아도 형식이 달라 다시 저장합니다.
+    """
+    if cache is None or not cache.output_current(ticker, statement, period, base_name, mode):
+        return False
+    return os.path.exists(f"{base_name}.csv") and os.path.exists(f"{base_name}.xlsx")
+
+
+def _print_table(df, title=None):
+    """DataFrame을 터미널에 출력합니다."""
+    print("\n" + "=" * 80)
+    if title:
+        print(title)
+    print(df.to_string())
+    print("=" * 80)
+
+
+def _scrape_jobs(jobs, args, headless, cache=None):
+    """여러 작업을 드라이버 풀로 스크래핑해 저장하고, 실패한 작업의 오류를 반환합니다."""
+    print(f"{len(jobs)}개 작업, Chrome 드라이버 최대 {args.drivers}개 "
+          f"(드라이버당 {args.max_pages}페이지 후 교체)")
+    with DriverPool(args.drivers, args.max_pages, headless) as pool:
+        results, errors = scrape_many(jobs, pool, use_http=not args.selenium, max_workers=args.drivers,
+                                      cache=cache, max_age=args.max_age)
+
+    unchanged = 0
+    for (ticker, statement, period), df in results.items():
+        if args.numeric:
+            df = financials_table.to_numeric(df)
+        if args.print_table:
+            _print_table(df, f"{ticker} {statement} ({period})")
+        base_name = output_basename(ticker, period, statement)
+        if _unchanged(cache, ticker, statement, period, base_name, _output_mode(args)):
+            unchanged += 1
+            continue
+        with profiling.stage("save"):
+            save_data(df, None, ticker, period, statement)
+        if cache is not None:
+            cache.record_output(ticker, statement, period, base_name, _output_mode(args))
+
+    print(f"\n성공 {len(results)}개 / 실패 {len(errors)}개 (Chrome 시작 {pool.started}회)")
+    if cache is not None:
+        stats = cache.stats()
+        print(f"캐시: 요청 생략 {stats['fresh']}개 / 내용 같음(파싱 생략) {stats['hits']}개 / "
+              f"새로 파싱 {stats['misses']}개, 변경 없어 저장 생략 {unchanged}개")
+    for (ticker, statement, period), error in errors.items():
+        print(f"  실패: {ticker} {statement} ({period}): {error}", file=sys.stderr)
+    return errors
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="StockAnalysis.com 재무제표 데이터 다운로더"
     )
     parser.add_argument(
-        "--ticker", default="NVDA", help="주식 티커 심볼 (기본값: NVDA)"
+        "--ticker", nargs="+", action="extend", default=None,
+        help="주식 티커 심볼, 여러 개 가능 (기본값: NVDA)"
     )
     parser.add_argument(
-        "--period",
-        choices=["quarterly", "annual"],
-        default="quarterly",
-        help="기간 (기본값: quarterly)",
+        "--period", nargs="+", action="extend", default=None,
+        choices=PERIODS,
+        help="기간, 여러 개 가능 (기본값: quarterly)",
     )
     parser.add_argument(
-        "--statement",
-        choices=["financials", "balance-sheet", "cash-flow-statement"],
-        default="financials",
-        help="재무제표 종류 (기본값: financials = Income Statement)",
+        "--statement", nargs="+", action="extend", default=None,
+        choices=STATEMENTS,
+        help="재무제표 종류, 여러 개 가능 (기본값: financials = Income Statement)",
     )
-    parser.add_argument("--output", default=None, help="출력 파일명 (확장자 제외)")
+    parser.add_argument(
+        "--all", dest="all_views", action="store_true",
+        help="재무제표 3종 x 분기/연간 6개 화면을 모두 가져오기 (티커당 세션 하나)"
+    )
+    parser.add_argument("--output", default=None, help="출력 파일명 (확장자 제외, 작업이 하나일 때만)")
     parser.add_argument(
         "--print", dest="print_table", action="store_true", help="결과를 터미널에 출력"
     )
+    parser.add_argument(
+        "--numeric", action="store_true",
+        help="값을 float로 변환해 저장 (천 단위 구분자, %%는 비율, B/M 접미사, 괄호 음수, '-'는 빈 값)"
+    )
     parser.add_argument(
         "--visible", action="store_true",
         help="Chrome 창을 보이게 실행 (headless 모드 끔)"
     )
+    parser.add_argument(
+        "--selenium", action="store_true",
+        help="HTTP 경로를 건너뛰고 바로 Chrome으로 가져오기"
+    )
+    parser.add_argument(
+        "--drivers", type=int, default=DRIVER_POOL_SIZE,
+        help=f"작업이 여러 개일 때 동시에 띄울 Chrome 수이자 작업자 수 (기본값: {DRIVER_POOL_SIZE})"
+    )
+    parser.add_argument(
+        "--max-pages", type=int, default=DRIVER_MAX_PAGES,
+        help=f"Chrome 하나가 교체되기 전까지 여는 페이지 수 (기본값: {DRIVER_MAX_PAGES})"
+    )
+    parser.add_argument(
+        "--max-age", type=parse_max_age, default=None, metavar="AGE",
+        help="이 시간 안에 가져온 화면은 요청 없이 캐시 사용 (예: 3600, 30m, 12h, 7d; 기본값: 매번 다시 확인)"
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help="스크랩 캐시를 쓰지 않고 항상 가져와 파싱하고 저장"
+    )
+    parser.add_argument(
+        "--metrics", default=None,
+        help="실행이 끝나면 지표를 저장할 파일 (.prom: Prometheus 텍스트, 그 외: JSON)"
+    )
+    profiling.add_profile_arguments(parser, "scrape_stock_financials")
 
     args = parser.parse_args()
     headless = not args.visible
-
+    if args.all_views and (args.statement or args.period):
+        parser.error("--all은 --statement/--period와 함께 쓸 수 없습니다")
+    statements = STATEMENTS if args.all_views else (args.statement or ["financials"])
+    periods = PERIODS if args.all_views else (args.period or ["quarterly"])
+    jobs = [(ticker, statement, period)
+            for ticker in dict.fromkeys(args.ticker or ["NVDA"])
+            for statement in dict.fromkeys(statements)
+            for period in dict.fromkeys(periods)]
+    if args.output and len(jobs) > 1:
+        parser.error("--output은 작업(티커 x 재무제표 x 기간)이 하나일 때만 쓸 수 있습니다")
+    if args.drivers < 1 or args.max_pages < 1:
+        parser.error("--drivers와 --max-pages는 1 이상이어야 합니다")
+    if args.no_cache and args.max_age is not None:
+        parser.error("--max-age는 --no-cache와 함께 쓸 수 없습니다")
+    if args.metrics:
+        metrics.enable()
+
+    errors = {}
+    cache = None if args.no_cache else ScrapeCache()
     try:
-        df = scrape_financials(args.ticker, args.period, args.statement,
-                               headless=headless)
-
-        if args.print_table:
-            print("\n" + "=" * 80)
-            print(df.to_string())
-            print("=" * 80)
-
-        csv_path, xlsx_path = save_data(df, args.output, args.ticker, args.period)
-        print(f"\n완료! 파일이 저장되었습니다.")
+        with profiling.profile_session(args):
+            if len(jobs) == 1:
+                ticker, statement, period = jobs[0]
+                df = scrape_financials(ticker, period, statement, headless=headless,
+                                       use_http=not args.selenium, cache=cache, max_age=args.max_age)
+                if args.numeric:
+                    df = financials_table.to_numeric(df)
+
+                if args.print_table:
+                    _print_table(df)
+
+                base_name = args.output or output_basename(ticker, period, statement)
+                if _unchanged(cache, ticker, statement, period, base_name, _output_mode(args)):
+                    print(f"변경 없음: {base_name}.csv / {base_name}.xlsx 저장을 건너뜁니다.")
+                else:
+                    with profiling.stage("save"):
+                        csv_path, xlsx_path = save_data(df, args.output, ticker, period, statement)
+                    if cache is not None:
+                        cache.record_output(ticker, statement, period, base_name, _output_mode(args))
+            else:
+                errors = _scrape_jobs(jobs, args, headless, cache)
+        print(f"\n완료!")
 
     except Exception as e:
         error_msg = str(e)
@@ -220,6 +833,15 @@ def main():
             print("  3. VPN을 사용 중이라면 끄고 다시 시도하세요", file=sys.stderr)
         sys.exit(1)
 
+    finally:
+        if cache is not None:
+            cache.close()
+        if args.metrics:
+            print(f"지표 저장: {metrics.dump(args.metrics)}")
+
+    if errors:
+        sys.exit(1)
+
 
 if __name__ == "__main__":
     main()
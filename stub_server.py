@@ -0,0 +1,383 @@
+"""
+Local record/replay stand-in for the Yahoo chart, Google News RSS and
+stockanalysis.com endpoints.
+
+StandIn serves recorded fixtures over HTTP so the fetch paths can be tested
+and benchmarked without the internet, and can make the network worse on
+purpose: fixed latency plus jitter, injected 429/5xx responses and padded
+payloads. Fixture layout (see fixtures/):
+
+    chart/<SYMBOL>.json                               chart API response
+    rss/index.json                                    search query -> feed file
+    rss/<file>.xml                                    RSS search response
+    stockanalysis/<ticker>/<statement>-<period>.html  financials page
+
+An unknown chart symbol or financials page is a 404; an unknown news query
+is an empty feed, as Google News answers.
+
+Usage:
+    python stub_server.py serve --latency 0.05 --error-rate 0.1
+    python stub_server.py record NVDA AAPL
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+DEFAULT_FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+EMPTY_FEED = (b'<?xml version="1.0" encoding="UTF-8"?>'
+              b'<rss version="2.0"><channel><title>Google News</title></channel></rss>')
+
+CONTENT_TYPES = {
+    'chart': 'application/json',
+    'rss': 'application/rss+xml; charset=utf-8',
+    'stockanalysis': 'text/html; charset=utf-8',
+}
+
+
+class StubServer(ThreadingHTTPServer):
+    # The default listen backlog of 5 drops connection bursts (1s SYN retransmit)
+    request_queue_size = 64
+    daemon_threads = True
+
+
+class Fixtures:
+    """
+    Recorded responses read from a fixtures directory (cached after first use).
+
+    Args:
+        directory (str): Fixtures directory (default: fixtures/ next to this module)
+    """
+
+    def __init__(self, directory=None):
+        self.directory = directory or DEFAULT_FIXTURES_DIR
+        self._cache = {}
+        self._lock = threading.Lock()
+
+    def _read(self, *parts):
+        path = os.path.join(self.directory, *parts)
+        with self._lock:
+            if path not in self._cache:
+                try:
+                    with open(path, 'rb') as f:
+                        self._cache[path] = f.read()
+                except FileNotFoundError:
+                    self._cache[path] = None
+            return self._cache[path]
+
+    def chart(self, symbol):
+        """Recorded chart response for symbol, or None."""
+        return self._read('chart', f'{symbol.upper()}.json')
+
+    def rss(self, query):
+        """Recorded feed for a news search query, or None."""
+        index = self._read('rss', 'index.json')
+        filename = json.loads(index).get(query) if index else None
+        return self._read('rss', filename) if filename else None
+
+    def financials(self, ticker, statement, period):
+        """Recorded stockanalysis.com page, or None."""
+        return self._read('stockanalysis', ticker.lower(), f'{statement}-{period}.html')
+
+
+def _route(fixtures, path, query):
+    """Return (kind, body or None) for a request path and parsed query string."""
+    parts = [part for part in path.split('/') if part]
+    if path.startswith('/v8/finance/chart/') and len(parts) == 4:
+        return 'chart', fixtures.chart(parts[3])
+    if path == '/rss/search':
+        return 'rss', fixtures.rss(query.get('q', [''])[0]) or EMPTY_FEED
+    if len(parts) == 3 and parts[0] == 'stocks':
+        period = query.get('p', ['annual'])[0]
+        return 'stockanalysis', fixtures.financials(parts[1], parts[2], period)
+    return None, None
+
+
+class StandIn:
+    """
+    Threaded HTTP server replaying fixtures with configurable faults.
+
+    The fault settings are plain attributes and may be changed while the
+    server runs. Injected errors are drawn from a seeded random generator,
+    so a run with the same seed and request order fails the same requests.
+
+    Args:
+        fixtures (Fixtures or str): Fixtures or a fixtures directory (default: fixtures/)
+        host (str): Address to bind (default: 127.0.0.1)
+        port (int): Port to bind (default: 0, any free port)
+        latency (float): Seconds added to every response (default: 0)
+        jitter (float): Extra uniform random delay of up to jitter seconds (default: 0)
+        error_rate (float): Fraction of requests answered with an error status (default: 0)
+        error_statuses (tuple): Statuses to inject, chosen at random (default: 429, 503)
+        retry_after (float): Retry-After seconds sent with injected errors, None to omit (default: 0)
+        pad_bytes (int): Pad each body with trailing whitespace to at least this size (default: 0)
+        seed (int): Seed for jitter and error injection (default: None)
+    """
+
+    def __init__(self, fixtures=None, host='127.0.0.1', port=0, latency=0.0, jitter=0.0, error_rate=0.0,
+                 error_statuses=(429, 503), retry_after=0.0, pad_bytes=0, seed=None):
+        self.fixtures = fixtures if isinstance(fixtures, Fixtures) else Fixtures(fixtures)
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_statuses = tuple(error_statuses)
+        self.retry_after = retry_after
+        self.pad_bytes = pad_bytes
+        self._random = random.Random(seed)
+        self._stats_lock = threading.Lock()
+        self.reset_stats()
+
+        self.server = StubServer((host, port), self._handler_class())
+        self._thread = None
+
+    def _handler_class(self):
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                stand_in._handle(self)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def _faults(self):
+        """Draw (delay, injected status or None) for one request."""
+        with self._stats_lock:
+            delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+            inject = self.error_rate and self._random.random() < self.error_rate
+            status = self._random.choice(self.error_statuses) if inject else None
+        return delay, status
+
+    def _handle(self, handler):
+        url = urlparse(handler.path)
+        kind, body = _route(self.fixtures, url.path, parse_qs(url.query))
+        delay, injected = self._faults()
+        if delay:
+            time.sleep(delay)
+
+        headers = {}
+        if injected is not None:
+            status, body = injected, b''
+            if self.retry_after is not None:
+                headers['Retry-After'] = f'{self.retry_after:g}'
+        elif body is None:
+            status, body = 404, b''
+        else:
+            status = 200
+            headers['Content-Type'] = CONTENT_TYPES[kind]
+            if len(body) < self.pad_bytes:
+                # Trailing whitespace is valid after JSON, XML and HTML documents
+                body += b' ' * (self.pad_bytes - len(body))
+
+        # Counted before replying, so a client sees its own request in stats
+        with self._stats_lock:
+            self.stats['requests'] += 1
+            self.stats['bytes'] += len(body)
+            self.stats['status'][status] += 1
+            self.stats['kinds'][kind or 'unknown'] += 1
+
+        handler.send_response(status)
+        for name, value in headers.items():
+            handler.send_header(name, value)
+        handler.send_header('Content-Length', str(len(body)))
+        handler.end_headers()
+        handler.wfile.write(body)
+
+    def reset_stats(self):
+        """Zero the request counters."""
+        with self._stats_lock:
+            self.stats = {'requests': 0, 'bytes': 0, 'status': Counter(), 'kinds': Counter()}
+
+    @property
+    def base_url(self):
+        host, port = self.server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    @property
+    def chart_url(self):
+        """Replacement for finance_util YAHOO_CHART_URL."""
+        return f'{self.base_url}/v8/finance/chart/{{symbol}}'
+
+    @property
+    def news_url(self):
+        """Replacement for finance_util GOOGLE_NEWS_RSS_URL."""
+        return f'{self.base_url}/rss/search'
+
+    @property
+    def stockanalysis_url(self):
+        """Replacement for scrape_stock_financials STOCKANALYSIS_URL."""
+        return self.base_url
+
+    def environ(self):
+        """Environment variables that point a new process at this server."""
+        return {
+            'FINANCE_UTIL_CHART_URL': self.chart_url,
+            'FINANCE_UTIL_NEWS_URL': self.news_url,
+            'FINANCE_UTIL_STOCKANALYSIS_URL': self.stockanalysis_url,
+        }
+
+    def start(self):
+        """Serve in a background thread."""
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving and close the socket."""
+        if self._thread is not None:
+            self.server.shutdown()
+            self._thread = None
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def summarize_latencies(latencies, elapsed):
+    """
+    Summarize request latencies from a load run.
+
+    Args:
+        latencies (list): Seconds per call
+        elapsed (float): Wall-clock seconds of the whole run
+
+    Returns:
+        dict: {'count', 'throughput' (calls/s), 'p50', 'p99', 'max'} with latencies in seconds
+    """
+    if not latencies:
+        raise ValueError("latencies cannot be empty")
+
+    ordered = sorted(latencies)
+    if len(ordered) > 1:
+        cuts = statistics.quantiles(ordered, n=100, method='inclusive')
+        p50, p99 = cuts[49], cuts[98]
+    else:
+        p50 = p99 = ordered[0]
+    return {
+        'count': len(ordered),
+        'throughput': len(ordered) / elapsed if elapsed > 0 else float('inf'),
+        'p50': p50,
+        'p99': p99,
+        'max': ordered[-1],
+    }
+
+
+def record(symbols, directory=None, statements=('financials',), period='quarterly'):
+    """
+    Record live responses for symbols into a fixtures directory.
+
+    Writes the chart range used by the tests (1 year of daily bars), the
+    news feed for each symbol's search query and the given stockanalysis.com
+    statements. Existing fixtures for the same keys are overwritten.
+
+    Args:
+        symbols (list): Stock ticker symbols
+        directory (str): Fixtures directory (default: fixtures/)
+        statements (tuple): stockanalysis.com statement pages to record
+        period (str): 'quarterly' or 'annual' (default: 'quarterly')
+
+    Returns:
+        list: Paths written
+    """
+    from finance_util.news import GOOGLE_NEWS_RSS_URL, NEWS_HEADERS, _news_query, _news_search_params
+    from finance_util.prices import CHART_HEADERS, YAHOO_CHART_URL
+    from finance_util.transport import _get_with_retries
+    from scrape_stock_financials import build_url
+
+    directory = directory or DEFAULT_FIXTURES_DIR
+    written = []
+
+    def save(body, *parts):
+        path = os.path.join(directory, *parts)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(body)
+        written.append(path)
+
+    index_path = os.path.join(directory, 'rss', 'index.json')
+    index = {}
+    if os.path.exists(index_path):
+        with open(index_path, encoding='utf-8') as f:
+            index = json.load(f)
+
+    for symbol in symbols:
+        response = _get_with_retries(YAHOO_CHART_URL.format(symbol=symbol),
+                                     {'range': '1y', 'interval': '1d'}, CHART_HEADERS)
+        save(response.content, 'chart', f'{symbol.upper()}.json')
+
+        query = _news_query([symbol])
+        response = _get_with_retries(GOOGLE_NEWS_RSS_URL, _news_search_params(query), NEWS_HEADERS)
+        index[query] = f'{symbol.lower()}.xml'
+        save(response.content, 'rss', index[query])
+
+        for statement in statements:
+            response = _get_with_retries(build_url(symbol, period, statement), None,
+                                         {'User-Agent': CHART_HEADERS['User-Agent']})
+            save(response.content, 'stockanalysis', symbol.lower(), f'{statement}-{period}.html')
+
+    save((json.dumps(index, indent=2, ensure_ascii=False) + '\n').encode('utf-8'), 'rss', 'index.json')
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for the chart, news and financials endpoints")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    serve = commands.add_parser('serve', help="Serve recorded fixtures")
+    serve.add_argument('--fixtures', default=None, help="Fixtures directory (default: fixtures/)")
+    serve.add_argument('--host', default='127.0.0.1')
+    serve.add_argument('--port', type=int, default=8765)
+    serve.add_argument('--latency', type=float, default=0.0, help="Seconds added to every response")
+    serve.add_argument('--jitter', type=float, default=0.0, help="Extra random delay of up to this many seconds")
+    serve.add_argument('--error-rate', type=float, default=0.0, help="Fraction of requests failed on purpose")
+    serve.add_argument('--error-status', type=int, nargs='+', default=[429, 503], help="Statuses to inject")
+    serve.add_argument('--pad-bytes', type=int, default=0, help="Minimum response body size")
+    serve.add_argument('--seed', type=int, default=None)
+
+    rec = commands.add_parser('record', help="Record live responses as fixtures")
+    rec.add_argument('symbols', nargs='+')
+    rec.add_argument('--fixtures', default=None, help="Fixtures directory (default: fixtures/)")
+    rec.add_argument('--statement', dest='statements', action='append', default=None,
+                     help="stockanalysis.com statement to record (repeatable, default: financials)")
+    rec.add_argument('--period', choices=['quarterly', 'annual'], default='quarterly')
+
+    args = parser.parse_args()
+
+    if args.command == 'record':
+        for path in record(args.symbols, args.fixtures, tuple(args.statements or ['financials']), args.period):
+            print(f"Recorded {path}")
+        return 0
+
+    stand_in = StandIn(args.fixtures, args.host, args.port, args.latency, args.jitter, args.error_rate,
+                       args.error_status, pad_bytes=args.pad_bytes, seed=args.seed)
+    print(f"Serving {stand_in.fixtures.directory} on {stand_in.base_url}")
+    for name, value in stand_in.environ().items():
+        print(f"export {name}='{value}'")
+    try:
+        stand_in.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stand_in.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+"""
+Symbol to company name directory used to build news search queries.
+
+The directory is a CSV (symbol,name,aliases) or JSON file; aliases are
+separated by '|'. Loaded directories are cached per path, and each one keeps
+a compiled keyword index for finding which symbols a headline mentions.
+"""
+
+import csv
+import json
+import os
+import re
+import threading
+
+
+DEFAULT_DIRECTORY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'symbol_directory.csv')
+
+_loaded = {}
+_loaded_lock = threading.Lock()
+
+
+class SymbolDirectory:
+    """
+    Indexed symbol -> company directory.
+
+    Args:
+        entries (dict): symbol -> {'name': str, 'aliases': list of str}
+    """
+
+    def __init__(self, entries):
+        self.entries = {symbol.upper(): entry for symbol, entry in entries.items()}
+        self._keyword_symbols = {}
+        alternatives = {}
+        for symbol, entry in self.entries.items():
+            for name in [entry['name'], *entry['aliases']]:
+                self._keyword_symbols.setdefault(name.lower(), set()).add(symbol)
+                alternatives[name.lower()] = re.escape(name)
+            # Tickers only match in upper case, and one-letter tickers (V, F) not at all
+            if len(symbol) > 1:
+                self._keyword_symbols.setdefault(symbol.lower(), set()).add(symbol)
+                alternatives.setdefault(symbol.lower(), f'(?-i:{re.escape(symbol)})')
+        # Longest keywords first so 'Bank of America' wins over shorter overlaps
+        ordered = sorted(alternatives, key=len, reverse=True)
+        self._pattern = re.compile(
+            r'(?<!\w)(' + '|'.join(alternatives[k] for k in ordered) + r')(?!\w)', re.IGNORECASE
+        ) if ordered else None
+
+    def __contains__(self, symbol):
+        return symbol.upper() in self.entries
+
+    def __len__(self):
+        return len(self.entries)
+
+    def search_term(self, symbol):
+        """Return the company name to search news for (the symbol itself if unknown)."""
+        entry = self.entries.get(symbol.upper())
+        return entry['name'] if entry else symbol
+
+    def keywords(self, symbol):
+        """Return the names a headline may use for symbol: company name, aliases and ticker."""
+        entry = self.entries.get(symbol.upper())
+        if entry is None:
+            return [symbol]
+        return [entry['name'], *entry['aliases'], symbol.upper()]
+
+    def match(self, text, symbols=None):
+        """
+        Return the symbols whose company name, alias or ticker appears in text.
+
+        Args:
+            text (str): Text to search, e.g. a news headline
+            symbols (iterable): Only report these symbols (default: any symbol)
+
+        Returns:
+            set: Matching symbols
+        """
+        if self._pattern is None or not text:
+            return set()
+        found = set()
+        for keyword in self._pattern.findall(text):
+            found |= self._keyword_symbols.get(keyword.lower(), set())
+        if symbols is not None:
+            found &= {s.upper() for s in symbols}
+        return found
+
+
+def _read_entries(path):
+    """Read directory entries from a CSV or JSON file."""
+    if path.lower().endswith('.json'):
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        # Accept {"NVDA": "NVIDIA"} or {"NVDA": {"name": ..., "aliases": [...]}} or a list of rows
+        if isinstance(data, dict):
+            rows = [{'symbol': symbol, **(value if isinstance(value, dict) else {'name': value})}
+                    for symbol, value in data.items()]
+        else:
+            rows = data
+    else:
+        with open(path, newline='', encoding='utf-8') as f:
+            rows = list(csv.DictReader(f))
+
+    entries = {}
+    for row in rows:
+        symbol = (row.get('symbol') or '').strip()
+        name = (row.get('name') or '').strip()
+        if not symbol or not name:
+            raise ValueError(f"Symbol directory rows need 'symbol' and 'name': {row}")
+        aliases = row.get('aliases') or []
+        if isinstance(aliases, str):
+            aliases = [a.strip() for a in aliases.split('|') if a.strip()]
+        entries[symbol] = {'name': name, 'aliases': list(aliases)}
+    return entries
+
+
+def load_symbol_directory(path=None):
+    """
+    Load a symbol directory from CSV or JSON (cached per path).
+
+    Args:
+        path (str): Directory file (default: $FINANCE_UTIL_SYMBOL_DIRECTORY or the
+                    bundled symbol_directory.csv)
+
+    Returns:
+        SymbolDirectory: Loaded directory
+
+    Raises:
+        ValueError: If a row is missing its symbol or name
+    """
+    if path is None:
+        path = os.environ.get('FINANCE_UTIL_SYMBOL_DIRECTORY', DEFAULT_DIRECTORY_PATH)
+    path = os.path.abspath(path)
+
+    with _loaded_lock:
+        if path not in _loaded:
+            _loaded[path] = SymbolDirectory(_read_entries(path))
+        return _loaded[path]
@@ -0,0 +1,62 @@
+"""
+Tests for the benchmark suite's runner and baseline comparison.
+"""
+
+import json
+
+from benchmarks import suite
+from benchmarks.datagen import make_rss_feed
+from finance_util.news import _iter_feed_items
+
+
+def timing(median_s, **extra):
+    return {'median_s': median_s, 'min_s': median_s, 'repeats': 3, **extra}
+
+
+def test_compare_flags_regressions_beyond_threshold_and_noise_floor():
+    baseline = {
+        'slow[1]': timing(1.0),
+        'same[1]': timing(1.0),
+        'fast[1]': timing(1.0),
+        'tiny[1]': timing(0.0005),
+        'loose[1]': timing(1.0, threshold=1.0),
+    }
+    results = {
+        'slow[1]': timing(1.3),
+        'same[1]': timing(1.2),
+        'fast[1]': timing(0.5),
+        'tiny[1]': timing(0.0015),  # 3x slower but within the noise floor
+        'loose[1]': timing(1.9),
+        'added[1]': timing(0.1),
+    }
+
+    status = {row[0]: row[4] for row in suite.compare(results, baseline, threshold=0.25)}
+    assert status == {'slow[1]': 'regression', 'same[1]': 'ok', 'fast[1]': 'faster',
+                      'tiny[1]': 'ok', 'loose[1]': 'ok', 'added[1]': 'new'}
+
+
+def test_run_suite_writes_comparable_json(tmp_path):
+    cases = suite.build_cases(quick=True, only=['rss_parse'])
+    assert [case.name for case in cases] == ['rss_parse[1000]', 'rss_parse[10000]']
+
+    data = suite.run_suite(cases, repeats=1)
+    path = tmp_path / 'results.json'
+    suite.save_results(data, str(path))
+
+    loaded = json.loads(path.read_text(encoding='utf-8'))
+    assert set(loaded['results']) == {'rss_parse[1000]', 'rss_parse[10000]'}
+    assert loaded['environment']['python']
+    assert all(row[4] == 'ok' for row in suite.compare(loaded['results'], loaded['results']))
+
+
+def test_quick_cases_are_a_subset_of_the_full_suite():
+    full = {case.name for case in suite.build_cases()}
+    quick = {case.name for case in suite.build_cases(quick=True)}
+    assert quick < full
+    assert {'per_vectorized[10000000]', 'append_daily_record[100000]', 'rss_scan[100000]'} <= full - quick
+
+
+def test_make_rss_feed_is_reproducible():
+    feed = make_rss_feed(50, seed=3)
+    assert feed == make_rss_feed(50, seed=3)
+    assert sum(1 for _ in _iter_feed_items(feed, 100)) == 50
@@ -0,0 +1,657 @@
+"""
+Offline tests for finance_util helpers (no network access required).
+"""
+
+import asyncio
+import json
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+from urllib.parse import parse_qs, urlparse
+from xml.etree import ElementTree as ET
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import feed_cache
+import finance_util
+import finance_util.news
+import finance_util.prices
+import http_retry
+import ohlcv_cache
+from finance_util import (
+    PER_ERROR_MESSAGES,
+    PER_ERROR_NEGATIVE_PRICE,
+    PER_ERROR_NON_POSITIVE_EPS,
+    PER_ERROR_NOT_NUMERIC,
+    PER_OK,
+    calculate_per,
+    calculate_per_for_stocks,
+    calculate_per_vectorized,
+    fetch_daily_stock_data_many,
+    fetch_daily_stock_data,
+    fetch_price_and_news_async,
+    fetch_stock_history,
+    fetch_stock_news,
+    fetch_stock_news_many,
+)
+from ohlcv_cache import OHLCVCache
+
+
+@pytest.fixture(autouse=True)
+def fast_retry_scheduler():
+    """Use short retry delays and no rate limit for the local stub server."""
+    http_retry.set_scheduler(http_retry.RetryScheduler(
+        base_delay=0.01, max_delay=0.05, host_rates={'127.0.0.1': (1000.0, 1000)}))
+    yield
+    http_retry.set_scheduler(None)
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path):
+    """Point the shared OHLCV cache at a temporary file for every test."""
+    cache = OHLCVCache(str(tmp_path / 'ohlcv.sqlite'))
+    ohlcv_cache.set_default_cache(cache)
+    yield cache
+    ohlcv_cache.set_default_cache(None)
+    cache.close()
+
+
+@pytest.fixture(autouse=True)
+def isolated_feed_cache(tmp_path):
+    """Point the shared news feed cache at a temporary file for every test."""
+    cache = feed_cache.FeedCache(str(tmp_path / 'feeds.sqlite'))
+    feed_cache.set_default_feed_cache(cache)
+    yield cache
+    feed_cache.set_default_feed_cache(None)
+    cache.close()
+
+
+def legacy_per_for_stocks(stocks_data):
+    """Row-by-row reference implementation (the original calculate_per_for_stocks loop)."""
+    results = []
+    for stock in stocks_data:
+        try:
+            per = round(calculate_per(stock['price'], stock['eps']), 2)
+        except (ValueError, TypeError) as e:
+            per = f'Error: {str(e)}'
+        results.append({
+            'Stock Name': stock['name'],
+            'Price': stock['price'],
+            'EPS': stock['eps'],
+            'PER': per
+        })
+    return pd.DataFrame(results)
+
+
+MIXED_STOCKS = [
+    {'name': 'Samsung Electronics', 'price': 70000, 'eps': 3500},
+    {'name': 'SK Hynix', 'price': 120000.5, 'eps': 8000},
+    {'name': 'Zero EPS', 'price': 1000, 'eps': 0},
+    {'name': 'Negative EPS', 'price': 1000, 'eps': -5},
+    {'name': 'Negative Price', 'price': -10, 'eps': 5},
+    {'name': 'Both Bad', 'price': -10, 'eps': -5},
+    {'name': 'String Price', 'price': '1000', 'eps': 5},
+    {'name': 'None EPS', 'price': 1000, 'eps': None},
+    {'name': 'Bool Price', 'price': True, 'eps': 4},
+    {'name': 'NaN Price', 'price': float('nan'), 'eps': 4},
+]
+
+
+def test_calculate_per_for_stocks_matches_legacy_loop():
+    pd.testing.assert_frame_equal(calculate_per_for_stocks(MIXED_STOCKS),
+                                  legacy_per_for_stocks(MIXED_STOCKS))
+
+
+def test_calculate_per_for_stocks_all_valid_keeps_float_column():
+    stocks = [{'name': f'S{i}', 'price': 1000 + i * 37, 'eps': 3 + i * 0.7} for i in range(200)]
+    result = calculate_per_for_stocks(stocks)
+    assert result['PER'].dtype == np.float64
+    pd.testing.assert_frame_equal(result, legacy_per_for_stocks(stocks))
+
+
+def test_calculate_per_vectorized_error_codes():
+    result = calculate_per_vectorized([100.0, 100.0, -1.0, 100.0], [4.0, 0.0, 2.0, -3.0])
+    assert result['PER'].dtype == np.float64
+    assert result['PER'].iloc[0] == 25.0
+    assert result['PER'].iloc[1:].isna().all()
+    assert result['PER Error'].tolist() == [
+        PER_OK, PER_ERROR_NON_POSITIVE_EPS, PER_ERROR_NEGATIVE_PRICE, PER_ERROR_NON_POSITIVE_EPS
+    ]
+    assert set(PER_ERROR_MESSAGES) == {PER_ERROR_NOT_NUMERIC, PER_ERROR_NON_POSITIVE_EPS,
+                                       PER_ERROR_NEGATIVE_PRICE}
+
+
+def test_calculate_per_vectorized_accepts_dataframe_and_series():
+    df = pd.DataFrame({'price': [50.0, 80.0], 'eps': [2.0, 0.0]}, index=['A', 'B'])
+    from_frame = calculate_per_vectorized(df)
+    from_series = calculate_per_vectorized(df['price'], df['eps'])
+    pd.testing.assert_frame_equal(from_frame, from_series)
+    assert list(from_frame.index) == ['A', 'B']
+    assert from_frame.loc['A', 'PER'] == 25.0
+
+
+def test_calculate_per_vectorized_matches_scalar_on_random_data():
+    rng = np.random.default_rng(7)
+    prices = rng.uniform(-50, 1000, 5000)
+    eps = rng.uniform(-5, 50, 5000)
+    result = calculate_per_vectorized(prices, eps, decimals=2)
+    for price, e, per, code in zip(prices, eps, result['PER'], result['PER Error']):
+        try:
+            expected = round(calculate_per(float(price), float(e)), 2)
+        except ValueError:
+            assert code != PER_OK and np.isnan(per)
+        else:
+            assert code == PER_OK and per == expected
+
+
+def test_calculate_per_for_stocks_rounds_like_builtin_round():
+    rng = np.random.default_rng(11)
+    stocks = [{'name': f'S{i}', 'price': float(p), 'eps': float(e)}
+              for i, (p, e) in enumerate(zip(rng.uniform(0, 100000, 2000), rng.uniform(0.01, 500, 2000)))]
+    stocks.append({'name': 'Half', 'price': 24132.24, 'eps': 387.2})
+    result = calculate_per_for_stocks(stocks)
+    assert result['PER'].iloc[-1] == 62.33
+    assert result['PER'].tolist() == [round(s['price'] / s['eps'], 2) for s in stocks]
+    pd.testing.assert_frame_equal(result, legacy_per_for_stocks(stocks))
+
+
+def test_calculate_per_vectorized_length_mismatch():
+    with pytest.raises(ValueError):
+        calculate_per_vectorized([1.0, 2.0], [1.0])
+
+
+def make_chart_payload(dates, closes):
+    """Build a minimal Yahoo chart API payload with one daily bar per date."""
+    timestamps = [int(datetime.strptime(d, '%Y-%m-%d').replace(hour=14, minute=30, tzinfo=timezone.utc)
+                      .timestamp()) for d in dates]
+    return {'chart': {'result': [{
+        'meta': {'gmtoffset': -18000, 'exchangeTimezoneName': 'America/New_York'},
+        'timestamp': timestamps,
+        'indicators': {'quote': [{
+            'open': [c - 1 for c in closes],
+            'close': list(closes),
+            'high': [c + 2 for c in closes],
+            'low': [c - 2 for c in closes],
+            'volume': [1_000_000] * len(closes),
+        }]},
+    }], 'error': None}}
+
+
+def make_rss_feed(items):
+    """Build a Google News style RSS document from (title, link, 'YYYY-MM-DD', publisher) tuples."""
+    entries = ''.join(
+        f'<item><title>{title}</title><link>{link}</link>'
+        f'<pubDate>{datetime.strptime(day, "%Y-%m-%d").strftime("%a, %d %b %Y 12:00:00 GMT")}</pubDate>'
+        f'<source url="https://example.com">{publisher}</source></item>'
+        for title, link, day, publisher in items
+    )
+    return f'<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>{entries}</channel></rss>'.encode()
+
+
+DEFAULT_FEED = make_rss_feed([
+    ('NVIDIA beats estimates', 'https://example.com/1', '2026-01-15', 'Reuters'),
+    ('NVIDIA old story', 'https://example.com/2', '2025-12-01', 'Reuters'),
+    ('NVIDIA new chip', 'https://example.com/3', '2026-01-14', 'Bloomberg'),
+])
+
+
+class StubServer(ThreadingHTTPServer):
+    # The default listen backlog of 5 drops connection bursts (1s SYN retransmit)
+    request_queue_size = 64
+
+
+@pytest.fixture
+def chart_server(monkeypatch):
+    """
+    Local stand-in for the Yahoo chart and Google News RSS endpoints.
+
+    'BAD' returns an empty result, symbols in state.payloads return that payload,
+    anything else returns two bars; /rss/search returns state.feed with ETag state.etag
+    (304 when If-None-Match matches). Each request's (symbol or 'rss', query) is
+    appended to state.requests.
+    """
+    state = SimpleNamespace(delay=0.2, payloads={}, requests=[], feed=DEFAULT_FEED, etag='"v1"')
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            time.sleep(state.delay)
+            url = urlparse(self.path)
+            if url.path == '/rss/search':
+                state.requests.append(('rss', parse_qs(url.query)))
+                if self.headers.get('If-None-Match') == state.etag:
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+                body, content_type = state.feed, 'application/rss+xml'
+            else:
+                symbol = url.path.rsplit('/', 1)[-1]
+                state.requests.append((symbol, parse_qs(url.query)))
+                if symbol == 'BAD':
+                    payload = {'chart': {'result': None, 'error': None}}
+                elif symbol in state.payloads:
+                    payload = state.payloads[symbol]
+                else:
+                    payload = make_chart_payload(['2026-01-14', '2026-01-15'], [100.0, 110.0])
+                body, content_type = json.dumps(payload).encode(), 'application/json'
+            self.send_response(200)
+            self.send_header('Content-Type', content_type)
+            self.send_header('ETag', state.etag)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = StubServer(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(finance_util.prices, 'YAHOO_CHART_URL',
+                        f'http://127.0.0.1:{server.server_port}/v8/finance/chart/{{symbol}}')
+    monkeypatch.setattr(finance_util.news, 'GOOGLE_NEWS_RSS_URL', f'http://127.0.0.1:{server.server_port}/rss/search')
+    yield state
+    server.shutdown()
+    server.server_close()
+
+
+def test_fetch_daily_stock_data_many_runs_concurrently(chart_server):
+    symbols = [f'S{i}' for i in range(12)] + ['BAD']
+    start = time.perf_counter()
+    results, errors = fetch_daily_stock_data_many(symbols, '2026-01-15', max_workers=16)
+    elapsed = time.perf_counter() - start
+
+    assert list(results) == symbols[:-1]
+    assert list(errors) == ['BAD']
+    assert results['S0']['close'] == 110.0
+    assert results['S0']['change_pct'] == 10.0
+    # 13 requests of 0.2s each would take 2.6s if run one after another
+    assert elapsed < chart_server.delay * 5
+
+
+def test_fetch_stock_history_single_request_and_vectorized_changes(chart_server):
+    chart_server.delay = 0
+    payload = make_chart_payload(['2026-01-09', '2026-01-12', '2026-01-13', '2026-01-14', '2026-01-15'],
+                                 [90.0, 100.0, 105.0, 95.0, 99.75])
+    payload['chart']['result'][0]['indicators']['quote'][0]['high'][3] = None
+    chart_server.payloads['NVDA'] = payload
+
+    df = fetch_stock_history('NVDA', '2026-01-12', '2026-01-15')
+
+    assert len(chart_server.requests) == 1
+    assert df['date'].dt.strftime('%Y-%m-%d').tolist() == ['2026-01-12', '2026-01-13', '2026-01-15']
+    assert df['prev_close'].tolist() == [90.0, 100.0, 95.0]
+    assert df['change'].tolist() == [10.0, 5.0, 4.75]
+    assert df['change_pct'].tolist() == [11.11, 5.0, 5.0]
+    assert df['volume'].dtype == np.int64
+    assert df['close'].dtype == np.float64
+
+
+def test_fetch_stock_history_chunks_intraday_ranges(chart_server):
+    chart_server.delay = 0
+    fetch_stock_history('NVDA', '2026-01-01', '2026-01-20', interval='1m')
+    assert len(chart_server.requests) == 4  # 27 days (incl. one week lead-in) in 7-day chunks
+
+
+def test_fetch_daily_stock_data_serves_settled_days_from_cache(chart_server, isolated_cache):
+    chart_server.delay = 0
+    first = fetch_daily_stock_data('NVDA', '2026-01-15')
+    second = fetch_daily_stock_data('NVDA', '2026-01-15')
+
+    assert first == second
+    assert len(chart_server.requests) == 1
+    assert isolated_cache.stats() == {'hits': 1, 'misses': 1}
+
+    fetch_daily_stock_data('NVDA', '2026-01-15', refresh=True)
+    assert len(chart_server.requests) == 2
+
+    assert isolated_cache.invalidate('NVDA') == 1
+    fetch_daily_stock_data('NVDA', '2026-01-15')
+    assert len(chart_server.requests) == 3
+
+
+def test_fetch_stock_history_fills_cache(chart_server, isolated_cache):
+    chart_server.delay = 0
+    fetch_stock_history('NVDA', '2026-01-14', '2026-01-15')
+    record = fetch_daily_stock_data('NVDA', '2026-01-15')
+
+    assert len(chart_server.requests) == 1
+    assert record['close'] == 110.0 and record['prev_close'] == 100.0
+
+
+def make_random_chart_payload(seed=3):
+    """Chart payload over January 2026 with unrounded closes, including a half-cent tie (202.695)."""
+    dates = pd.bdate_range('2026-01-02', '2026-01-30').strftime('%Y-%m-%d').tolist()
+    closes = np.random.default_rng(seed).uniform(100, 300, len(dates)).tolist()
+    closes[5] = 202.695
+    return dates, make_chart_payload(dates, closes)
+
+
+def test_fetch_stock_history_rounds_like_daily_records(chart_server):
+    chart_server.delay = 0
+    dates, chart_server.payloads['NVDA'] = make_random_chart_payload()
+
+    df = fetch_stock_history('NVDA', dates[0], dates[-1], use_cache=False)
+    rows = df.assign(date=df['date'].dt.strftime('%Y-%m-%d')).to_dict('records')
+
+    assert [row['date'] for row in rows] == dates
+    assert rows[5]['close'] == 202.69
+    for row in rows:
+        assert row == fetch_daily_stock_data('NVDA', row['date'], use_cache=False)
+
+
+def test_fetch_stock_history_cache_matches_daily_records(chart_server, isolated_cache):
+    chart_server.delay = 0
+    dates, chart_server.payloads['NVDA'] = make_random_chart_payload(seed=4)
+
+    fetch_stock_history('NVDA', dates[0], dates[-1])
+    for date in dates:
+        assert isolated_cache.get('NVDA', date) == fetch_daily_stock_data('NVDA', date, use_cache=False)
+
+
+def test_ohlcv_cache_unsettled_records_expire(tmp_path):
+    cache = OHLCVCache(str(tmp_path / 'c.sqlite'), today_ttl=60)
+    record = {'date': '2026-01-15', 'open': 1.0, 'close': 2.0, 'high': 3.0, 'low': 0.5,
+              'volume': 10, 'change': 1.0, 'change_pct': 100.0, 'prev_close': 1.0}
+    settled = datetime(2026, 1, 16, 1, tzinfo=timezone.utc).timestamp()
+    cache.put_many('NVDA', [('2026-01-15', record)], fetched_at=settled)
+    assert cache.get('NVDA', '2026-01-15') == record
+
+    intraday = datetime(2026, 1, 15, 18, tzinfo=timezone.utc).timestamp()
+    cache.put_many('NVDA', [('2026-01-15', record)], fetched_at=intraday)
+    assert cache.get('NVDA', '2026-01-15') is None
+    assert cache.stats() == {'hits': 1, 'misses': 1}
+    cache.close()
+
+
+def test_ohlcv_cache_drops_rows_from_older_versions(tmp_path):
+    path = str(tmp_path / 'c.sqlite')
+    record = {'date': '2026-01-15', 'open': 1.0, 'close': 202.7, 'high': 3.0, 'low': 0.5,
+              'volume': 10, 'change': 1.0, 'change_pct': 100.0, 'prev_close': 1.0}
+    settled = datetime(2026, 1, 16, 1, tzinfo=timezone.utc).timestamp()
+    cache = OHLCVCache(path)
+    cache.put_many('NVDA', [('2026-01-15', record)], fetched_at=settled)
+    cache._conn.execute("PRAGMA user_version = 0")
+    cache._conn.commit()
+    cache.close()
+
+    cache = OHLCVCache(path)
+    assert cache.get('NVDA', '2026-01-15') is None
+    cache.put_many('NVDA', [('2026-01-15', record)], fetched_at=settled)
+    cache.close()
+
+    cache = OHLCVCache(path)
+    assert cache.get('NVDA', '2026-01-15') == record
+    cache.close()
+
+
+def test_fetch_stock_news_filters_by_date(chart_server):
+    chart_server.delay = 0
+    news = fetch_stock_news('NVDA', '2026-01-15')
+    assert [item['link'] for item in news] == ['https://example.com/1', 'https://example.com/3']
+    assert news[0]['publisher'] == 'Reuters'
+
+
+def test_fetch_price_and_news_async_runs_both_requests_concurrently(chart_server):
+    chart_server.delay = 0.3
+    start = time.perf_counter()
+    stock_data, news = asyncio.run(fetch_price_and_news_async('NVDA', '2026-01-15'))
+    elapsed = time.perf_counter() - start
+
+    assert stock_data['date'] == '2026-01-15'
+    assert len(news) == 2
+    assert sorted(symbol for symbol, _ in chart_server.requests) == ['NVDA', 'rss']
+    assert elapsed < chart_server.delay * 1.8
+
+
+def test_fetch_stock_news_revalidates_with_etag(chart_server, isolated_feed_cache):
+    chart_server.delay = 0
+    first = fetch_stock_news('NVDA', '2026-01-15')
+    second = fetch_stock_news('NVDA', '2026-01-15')
+
+    assert first == second
+    assert len(chart_server.requests) == 2
+    assert isolated_feed_cache.not_modified == 1
+
+
+def test_fetch_stock_news_dedupes_by_link(chart_server):
+    chart_server.delay = 0
+    chart_server.feed = make_rss_feed([
+        ('NVIDIA beats estimates', 'https://example.com/1', '2026-01-15', 'Reuters'),
+        ('NVIDIA beats estimates', 'https://example.com/1', '2026-01-15', 'Yahoo'),
+        ('NVIDIA new chip', 'https://example.com/3', '2026-01-14', 'Bloomberg'),
+    ])
+    assert [n['link'] for n in fetch_stock_news('NVDA', '2026-01-15')] == [
+        'https://example.com/1', 'https://example.com/3']
+
+    chart_server.feed = make_rss_feed([
+        ('NVIDIA new chip', 'https://example.com/3', '2026-01-14', 'Bloomberg'),
+        ('NVIDIA guidance', 'https://example.com/4', '2026-01-15', 'CNBC'),
+    ])
+    chart_server.etag = '"v2"'
+    assert [n['link'] for n in fetch_stock_news('NVDA', '2026-01-15', new_only=True)] == [
+        'https://example.com/4']
+
+
+def test_parse_news_items_stops_early_on_large_feeds():
+    items = [(f'NVIDIA story {i}', f'https://example.com/{i}', '2026-01-15', 'Reuters')
+             for i in range(20000)]
+    content = make_rss_feed(items)
+    start = time.perf_counter()
+    news = finance_util.news._parse_news_items(content, datetime(2026, 1, 15).date(), 5)
+    elapsed = time.perf_counter() - start
+
+    assert [n['link'] for n in news] == [f'https://example.com/{i}' for i in range(5)]
+    full = time.perf_counter()
+    ET.fromstring(content)
+    assert elapsed < time.perf_counter() - full
+
+
+def test_fetch_stock_news_many_batches_queries_and_splits_per_symbol(chart_server):
+    chart_server.delay = 0
+    chart_server.feed = make_rss_feed([
+        ('NVIDIA and Apple lead chip rally', 'https://example.com/1', '2026-01-15', 'Reuters'),
+        ('Microsoft cloud growth slows', 'https://example.com/2', '2026-01-15', 'CNBC'),
+        ('Tesla deliveries beat', 'https://example.com/3', '2026-01-14', 'Bloomberg'),
+        ('Amazon old story', 'https://example.com/4', '2025-12-01', 'Reuters'),
+        ('Markets close higher', 'https://example.com/5', '2026-01-15', 'AP'),
+    ])
+    symbols = ['NVDA', 'AAPL', 'MSFT', 'AMZN', 'TSLA', 'META', 'ZZZZ']
+
+    news = fetch_stock_news_many(symbols, '2026-01-15', batch_size=3)
+
+    assert list(news) == symbols
+    queries = sorted(query['q'][0] for _, query in chart_server.requests)
+    assert queries == ['("Amazon" OR "Tesla" OR "Meta") stock',
+                       '("NVIDIA" OR "Apple" OR "Microsoft") stock',
+                       'ZZZZ stock']
+    assert [n['link'] for n in news['NVDA']] == ['https://example.com/1']
+    assert [n['link'] for n in news['AAPL']] == ['https://example.com/1']
+    assert [n['link'] for n in news['MSFT']] == ['https://example.com/2']
+    assert [n['link'] for n in news['TSLA']] == ['https://example.com/3']
+    assert news['AMZN'] == [] and news['META'] == []
+    # An unknown symbol is queried on its own, so every matching item is kept
+    assert len(news['ZZZZ']) == 4
+
+
+def test_fetch_stock_news_many_reports_failed_batches_as_empty(chart_server, monkeypatch):
+    monkeypatch.setattr(finance_util.news, 'GOOGLE_NEWS_RSS_URL', 'http://127.0.0.1:1/rss/search')
+    news = fetch_stock_news_many(['NVDA', 'AAPL'], '2026-01-15')
+    assert news == {'NVDA': [], 'AAPL': []}
+
+
+def legacy_append_daily_record(stock_data, news_summary, filepath):
+    """Read-modify-write reference (the original append_daily_record, with its row update fixed)."""
+    new_record = pd.DataFrame([{
+        '날짜': stock_data['date'], '전일종가': stock_data['prev_close'], '시가': stock_data['open'],
+        '종가': stock_data['close'], '최고가': stock_data['high'], '최저가': stock_data['low'],
+        '거래량': stock_data['volume'], '변동가격': stock_data['change'],
+        '변동률(%)': stock_data['change_pct'], '뉴스/이유': news_summary
+    }])
+    if os.path.exists(filepath):
+        existing_df = pd.read_excel(filepath, engine='openpyxl')
+        if stock_data['date'] in existing_df['날짜'].values:
+            existing_df = existing_df.astype(object)
+            existing_df.loc[existing_df['날짜'] == stock_data['date'], new_record.columns] = new_record.values
+            df = existing_df
+        else:
+            df = pd.concat([existing_df, new_record], ignore_index=True)
+    else:
+        df = new_record
+    df['날짜'] = pd.to_datetime(df['날짜'])
+    df = df.sort_values('날짜', ascending=False)
+    df['날짜'] = df['날짜'].dt.strftime('%Y-%m-%d')
+    df.to_excel(filepath, index=False, engine='openpyxl')
+
+
+def make_tracker_record(date, close, volume=1_000_000):
+    return {'date': date, 'open': close - 1.0, 'close': close, 'high': close + 2.0, 'low': close - 2.0,
+            'volume': volume, 'change': 1.5, 'change_pct': 1.38, 'prev_close': close - 1.5}
+
+
+def test_append_daily_records_matches_single_record_loop(tmp_path):
+    seed = [make_tracker_record(f'2026-01-{day:02d}', 100.0 + day) for day in (5, 6, 7)]
+    batch = [
+        make_tracker_record('2026-01-09', 120.0),
+        make_tracker_record('2026-01-06', 99.0, volume=5),     # replaces an existing day
+        make_tracker_record('2026-01-08', 115.0),
+        make_tracker_record('2026-01-09', 121.0, volume=7),    # repeated in the batch: last one wins
+    ]
+    summaries = ['a', 'b', None, 'd']
+
+    for name in ('legacy.xlsx', 'single.xlsx', 'bulk.xlsx'):
+        for record in seed:
+            legacy_append_daily_record(record, 'seed', str(tmp_path / name))
+
+    for record, summary in zip(batch, summaries):
+        legacy_append_daily_record(record, summary, str(tmp_path / 'legacy.xlsx'))
+        finance_util.append_daily_record(record, summary, 'single.xlsx', str(tmp_path))
+    finance_util.append_daily_records(batch, summaries, 'bulk.xlsx', str(tmp_path))
+
+    expected = pd.read_excel(tmp_path / 'legacy.xlsx')
+    assert expected['날짜'].tolist() == ['2026-01-09', '2026-01-08', '2026-01-07', '2026-01-06', '2026-01-05']
+    assert expected.loc[expected['날짜'] == '2026-01-06', '거래량'].item() == 5
+    pd.testing.assert_frame_equal(pd.read_excel(tmp_path / 'single.xlsx'), expected)
+    pd.testing.assert_frame_equal(pd.read_excel(tmp_path / 'bulk.xlsx'), expected)
+
+
+def test_append_daily_records_merges_timestamp_dates(tmp_path):
+    finance_util.append_daily_records([make_tracker_record('2026-01-14', 100.0)], ['seed'],
+                                      'history.xlsx', str(tmp_path))
+    history = pd.DataFrame([make_tracker_record(date, 110.0) for date in ('2026-01-14', '2026-01-15')])
+    history['date'] = pd.to_datetime(history['date'])
+    records = history.to_dict('records')
+
+    for _ in range(2):
+        finance_util.append_daily_records(records, ['', ''], 'history.xlsx', str(tmp_path))
+
+    df = pd.read_excel(tmp_path / 'history.xlsx')
+    assert df['날짜'].tolist() == ['2026-01-15', '2026-01-14']
+    assert df['종가'].tolist() == [110.0, 110.0]
+
+
+def test_append_daily_records_validates_input(tmp_path):
+    with pytest.raises(ValueError):
+        finance_util.append_daily_records([], [], 'x.xlsx', str(tmp_path))
+    with pytest.raises(ValueError):
+        finance_util.append_daily_records([make_tracker_record('2026-01-05', 1.0)], [], 'x.xlsx', str(tmp_path))
+    with pytest.raises(ValueError):
+        finance_util.append_daily_records([{'date': '2026-01-05'}], ['x'], 'x.xlsx', str(tmp_path))
+
+
+def make_seoul_result():
+    """KRX daily bars: 09:00 KST is 00:00 UTC, so UTC dates are one day behind."""
+    timestamps = [int(datetime(2026, 1, day, 0, 0, tzinfo=timezone.utc).timestamp()) - 9 * 3600
+                  for day in (13, 14, 15)]
+    return {
+        'meta': {'gmtoffset': 32400, 'exchangeTimezoneName': 'Asia/Seoul'},
+        'timestamp': timestamps,
+        'indicators': {'quote': [{
+            'open': [70000.0, 71000.0, 72000.0],
+            'close': [71000.0, 72000.0, 73500.0],
+            'high': [71500.0, 72500.0, 74000.0],
+            'low': [69500.0, 70500.0, 71500.0],
+            'volume': [10, None, 30],
+        }]},
+    }
+
+
+def test_daily_record_uses_exchange_timezone(monkeypatch):
+    monkeypatch.setenv('TZ', 'UTC')
+    time.tzset()
+    try:
+        result = make_seoul_result()
+        record = finance_util.prices._daily_record_from_chart('005930.KS', result, datetime(2026, 1, 15))
+        assert record['date'] == '2026-01-15'
+        assert record['close'] == 73500.0
+        assert record['prev_close'] == 72000.0
+        assert record['change_pct'] == 2.08
+
+        # Unknown zone names fall back to the numeric offset
+        result['meta']['exchangeTimezoneName'] = 'Nowhere/Invalid'
+        assert finance_util.prices._daily_record_from_chart('005930.KS', result, datetime(2026, 1, 14))['volume'] == 0
+
+        with pytest.raises(ValueError, match='No trading data'):
+            finance_util.prices._daily_record_from_chart('005930.KS', result, datetime(2026, 1, 12))
+    finally:
+        monkeypatch.delenv('TZ')
+        time.tzset()
+
+
+def test_chart_columns_honour_dst_inside_a_range():
+    # gmtoffset is the offset at request time (EST); July bars are in EDT
+    result = make_chart_payload(['2026-01-15', '2026-07-15'], [100.0, 110.0])['chart']['result'][0]
+    result['timestamp'] = [int(datetime(2026, 1, 15, 14, 30, tzinfo=timezone.utc).timestamp()),
+                           int(datetime(2026, 7, 15, 13, 30, tzinfo=timezone.utc).timestamp())]
+    times = finance_util.prices._chart_columns([result])['time']
+    assert [str(t) for t in times] == ['2026-01-15T09:30:00', '2026-07-15T09:30:00']
+
+
+def test_daily_record_rejects_inconsistent_bars():
+    result = make_seoul_result()
+    result['indicators']['quote'][0]['high'][2] = 60000.0
+    with pytest.raises(ValueError, match='high 60000.0 is below low'):
+        finance_util.prices._daily_record_from_chart('005930.KS', result, datetime(2026, 1, 15))
+    result['indicators']['quote'][0]['close'][2] = None
+    with pytest.raises(ValueError, match='Missing close price'):
+        finance_util.prices._daily_record_from_chart('005930.KS', result, datetime(2026, 1, 15))
+
+
+def test_fetch_stock_history_skips_inconsistent_bars(chart_server, capsys):
+    chart_server.delay = 0
+    payload = make_chart_payload(['2026-01-13', '2026-01-14', '2026-01-15'], [100.0, 105.0, 110.0])
+    quote = payload['chart']['result'][0]['indicators']['quote'][0]
+    quote['high'][1] = 50.0
+    chart_server.payloads['NVDA'] = payload
+
+    df = fetch_stock_history('NVDA', '2026-01-13', '2026-01-15', use_cache=False)
+
+    assert df['date'].dt.strftime('%Y-%m-%d').tolist() == ['2026-01-13', '2026-01-15']
+    assert df['prev_close'].tolist() == [99.0, 105.0]
+    assert 'Skipping 1 bar(s)' in capsys.readouterr().out
+
+
+def test_fetch_intraday_bars_since_last_bar(chart_server):
+    chart_server.delay = 0
+    payload = make_chart_payload(['2026-01-13', '2026-01-14', '2026-01-15'], [100.0, 105.0, 110.0])
+    payload['chart']['result'][0]['indicators']['quote'][0]['close'][2] = None
+    chart_server.payloads['NVDA'] = payload
+    timestamps = payload['chart']['result'][0]['timestamp']
+
+    bars = finance_util.fetch_intraday_bars('NVDA', since=timestamps[1], interval='5m')
+
+    assert bars['timestamp'].tolist() == [timestamps[1]]
+    assert bars['close'].tolist() == [105.0]
+    assert chart_server.requests[-1][1]['period1'] == [str(timestamps[1])]
+    assert chart_server.requests[-1][1]['interval'] == ['5m']
+
+    chart_server.payloads['NVDA'] = {'chart': {'result': [{'meta': {}, 'indicators': {'quote': [{}]}}]}}
+    assert len(finance_util.fetch_intraday_bars('NVDA', since=timestamps[2])['timestamp']) == 0
+    with pytest.raises(ValueError):
+        finance_util.fetch_intraday_bars('NVDA')
+    with pytest.raises(ValueError):
+        finance_util.fetch_intraday_bars('NVDA', interval='1d')
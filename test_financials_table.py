@@ -0,0 +1,112 @@
+"""
+Tests for the lxml financial statement table extractor (financials_table.py).
+"""
+
+import math
+import time
+
+import pandas as pd
+import pytest
+
+from benchmarks.datagen import make_financials_page
+from financials_table import read_numeric_table, read_table, to_numeric
+from stub_server import DEFAULT_FIXTURES_DIR
+
+NVDA_FINANCIALS = f'{DEFAULT_FIXTURES_DIR}/stockanalysis/nvda/financials-quarterly.html'
+
+
+@pytest.fixture(scope='module')
+def nvda_page():
+    with open(NVDA_FINANCIALS, encoding='utf-8') as f:
+        return f.read()
+
+
+def test_read_table_matches_the_displayed_strings(nvda_page):
+    df = read_table(nvda_page)
+    assert df.index.name == 'Period Ending'
+    assert list(df.columns)[:2] == ['Oct 26, 2025', 'Jul 27, 2025']
+    assert df.shape == (28, 5)
+    assert df.loc['Revenue', 'Oct 26, 2025'] == '57,006'
+    assert df.loc['Research & Development', 'Oct 27, 2024'] == '3,390'
+    assert df.loc['Other Unusual Items', 'Oct 26, 2025'] == '-'
+
+
+def test_read_numeric_table(nvda_page):
+    df = read_numeric_table(nvda_page)
+    assert (df.dtypes == 'float64').all()
+    assert df.loc['Revenue', 'Oct 26, 2025'] == 57006.0
+    assert df.loc['Revenue Growth (YoY)', 'Oct 26, 2025'] == pytest.approx(0.6249)
+    assert df.loc['Interest Expense', 'Oct 26, 2025'] == -61.0
+    assert df.loc['EPS (Diluted)', 'Oct 26, 2025'] == 1.30
+    assert df.loc['Other Unusual Items'].isna().all()
+    pd.testing.assert_frame_equal(df, to_numeric(read_table(nvda_page)))
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('35,082', 35082.0),
+    ('12.5%', 0.125),
+    ('-1.17%', -0.0117),
+    ('1.2B', 1.2e9),
+    ('350.5M', 350.5e6),
+    ('12 K', 12e3),
+    ('2.1t', 2.1e12),
+    ('(1,234)', -1234.0),
+    ('(5.5%)', -0.055),
+    ('−2.5', -2.5),
+    ('$3.50', 3.5),
+    ('+4', 4.0),
+    ('.5', 0.5),
+    ('-', math.nan),
+    ('—', math.nan),
+    ('', math.nan),
+    ('n/a', math.nan),
+    ('Upgrade', math.nan),
+    ('1.2.3', math.nan),
+])
+def test_to_numeric_cell_formats(text, expected):
+    value = to_numeric(pd.DataFrame({'Q1': [text]})).loc[0, 'Q1']
+    if math.isnan(expected):
+        assert math.isnan(value)
+    else:
+        assert value == pytest.approx(expected)
+
+
+def test_only_the_first_table_is_parsed():
+    page = ('<html><head><script>var html = "<div>" + "x".repeat(10);</script></head><body>'
+            '<table><thead><tr><th>Item</th><th>FY 2025</th></tr></thead>'
+            '<tbody><tr><td><a href="#">Revenue</a></td><td>1,000</td></tr></tbody></table>'
+            '<table><tbody><tr><td>Other</td><td>2</td></tr></tbody></table></body></html>')
+    assert read_numeric_table(page).to_dict() == {'FY 2025': {'Revenue': 1000.0}}
+
+
+def test_nested_tables_fall_back_to_the_whole_document():
+    page = ('<table><thead><tr><th>Item</th><th>FY 2025</th></tr></thead><tbody>'
+            '<tr><td>Revenue<table><tr><td>note</td></tr></table></td><td>1,000</td></tr>'
+            '</tbody></table>')
+    assert read_table(page).loc['Revenuenote', 'FY 2025'] == '1,000'
+
+
+def test_header_mismatch_and_ragged_rows():
+    page = ('<table><thead><tr><th>Item</th><th>A</th></tr></thead><tbody>'
+            '<tr><td>x</td><td>1</td><td>2</td></tr><tr><td>y</td><td>3</td></tr></tbody></table>')
+    df = read_numeric_table(page)
+    assert list(df.columns) == ['A', 'Col_2']
+    assert df.loc['y', 'A'] == 3.0 and math.isnan(df.loc['y', 'Col_2'])
+
+
+@pytest.mark.parametrize('page', [
+    '<html><body><p>No statement yet</p></body></html>',
+    '<table><thead><tr><th>Item</th></tr></thead><tbody></tbody></table>',
+])
+def test_missing_table_raises(page):
+    with pytest.raises(ValueError):
+        read_table(page)
+
+
+def test_many_pages_parse_in_seconds():
+    pages = [make_financials_page(seed=i) for i in range(200)]
+    start = time.perf_counter()
+    tables = [read_numeric_table(page) for page in pages]
+    # 30 x 10 values behind a 200 KB script payload; well under 10 ms per page
+    assert (time.perf_counter() - start) / len(pages) < 0.01
+    assert all(table.shape == (30, 10) for table in tables)
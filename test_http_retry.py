@@ -0,0 +1,121 @@
+"""
+Tests for http_retry against a local stub server that returns 429/503.
+"""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from http_retry import RetryBudget, RetryScheduler, TokenBucket, parse_retry_after
+
+
+@pytest.fixture
+def stub_server():
+    """
+    Server whose responses are popped from state['responses'] as (status, headers);
+    once the list is empty it answers 200. Request times are appended to state['times'].
+    """
+    state = {'responses': [], 'times': []}
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            with lock:
+                state['times'].append(time.monotonic())
+                status, headers = state['responses'].pop(0) if state['responses'] else (200, {})
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header('Content-Length', '2')
+            self.end_headers()
+            self.wfile.write(b'ok')
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    state['url'] = f'http://127.0.0.1:{server.server_port}/chart'
+    yield state
+    server.shutdown()
+    server.server_close()
+
+
+def fast_scheduler(**kwargs):
+    options = dict(max_retries=4, base_delay=0.01, max_delay=0.05, host_rates={'127.0.0.1': (1000.0, 1000)})
+    options.update(kwargs)
+    return RetryScheduler(**options)
+
+
+def test_retries_429_and_503_then_succeeds(stub_server):
+    stub_server['responses'] = [(429, {}), (503, {})]
+    response = fast_scheduler().request(requests.Session(), 'GET', stub_server['url'], verbose=False)
+    assert response.status_code == 200
+    assert len(stub_server['times']) == 3
+
+
+def test_non_retryable_status_fails_immediately(stub_server):
+    stub_server['responses'] = [(404, {})]
+    with pytest.raises(requests.exceptions.HTTPError):
+        fast_scheduler().request(requests.Session(), 'GET', stub_server['url'], verbose=False)
+    assert len(stub_server['times']) == 1
+
+
+def test_gives_up_after_max_retries(stub_server):
+    stub_server['responses'] = [(503, {})] * 10
+    with pytest.raises(requests.exceptions.HTTPError):
+        fast_scheduler(max_retries=2).request(requests.Session(), 'GET', stub_server['url'], verbose=False)
+    assert len(stub_server['times']) == 3
+
+
+def test_retry_after_pauses_the_whole_host(stub_server):
+    stub_server['responses'] = [(429, {'Retry-After': '0.3'})]
+    scheduler = fast_scheduler()
+    session = requests.Session()
+    scheduler.request(session, 'GET', stub_server['url'], verbose=False)
+    # A second worker starting right after the 429 also waits for Retry-After
+    start = time.monotonic()
+    scheduler.request(session, 'GET', stub_server['url'], verbose=False)
+    assert stub_server['times'][1] - stub_server['times'][0] >= 0.3
+    assert time.monotonic() - start < 0.3
+
+
+def test_retry_budget_stops_retry_storms(stub_server):
+    stub_server['responses'] = [(503, {})] * 20
+    scheduler = fast_scheduler(budget=RetryBudget(ratio=0.0, min_retries=1))
+    session = requests.Session()
+    for _ in range(3):
+        with pytest.raises(requests.exceptions.HTTPError):
+            scheduler.request(session, 'GET', stub_server['url'], verbose=False)
+    # 3 first attempts plus the single retry the budget allows
+    assert len(stub_server['times']) == 4
+
+
+def test_token_bucket_limits_rate():
+    now = [0.0]
+    bucket = TokenBucket(rate=2.0, capacity=2, clock=lambda: now[0])
+    assert [bucket.reserve() for _ in range(4)] == [0.0, 0.0, 0.5, 1.0]
+    now[0] = 10.0
+    assert bucket.reserve() == 0.0
+
+
+def test_call_retries_arbitrary_functions():
+    attempts = []
+
+    def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise ConnectionError("boom")
+        return 'done'
+
+    assert fast_scheduler().call('stockanalysis.com', flaky, retry_on=(ConnectionError,), verbose=False) == 'done'
+    assert len(attempts) == 3
+
+
+def test_parse_retry_after():
+    assert parse_retry_after('5') == 5.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after('Thu, 01 Jan 2026 00:00:10 GMT', now=1767225600.0) == 10.0
@@ -0,0 +1,60 @@
+"""
+Import-time regression tests for the command-line entry points.
+
+Each entry point is imported in a fresh interpreter with -X importtime. The
+tests check which heavy libraries get loaded and that the cumulative import
+time of the entry point stays within a budget. Modules the interpreter loads
+at startup (site, .pth hooks) are not counted.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+
+# (statement, heavy modules that must not be imported, budget in milliseconds)
+ENTRY_POINTS = [
+    ("import finance_util; finance_util.calculate_per", ('numpy', 'pandas', 'requests'), 20),
+    ("from finance_util import fetch_daily_stock_data", ('pandas',), 350),
+    ("import nvda_daily_tracker", ('pandas',), 400),
+    ("import tracker_daemon", ('pandas',), 400),
+    ("import test_stock_tracker", ('pandas',), 400),
+    ("import nvda_daily_tracker_demo", ('pandas',), 400),
+]
+
+# Best of this many runs, to ride out a cold disk cache or a busy machine
+RUNS = 3
+
+
+def import_times(statement):
+    """Return [(module, cumulative microseconds, is_top_level)] for the imports done by statement."""
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement],
+                            capture_output=True, text=True, check=True)
+    imports = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line.split('|')
+        # Nested imports are indented by two spaces per level under the single leading space
+        imports.append((name.strip(), int(cumulative), not name.startswith('  ')))
+    return imports
+
+
+@pytest.fixture(scope='module')
+def startup_modules():
+    return {module for module, _, _ in import_times('pass')}
+
+
+@pytest.mark.parametrize('statement, forbidden, budget_ms', ENTRY_POINTS,
+                         ids=[statement for statement, _, _ in ENTRY_POINTS])
+def test_entry_point_import_time(statement, forbidden, budget_ms, startup_modules):
+    runs = [import_times(statement) for _ in range(RUNS)]
+    loaded = {module for module, _, _ in runs[0]}
+    assert not [module for module in forbidden if module in loaded]
+
+    elapsed_ms = min(
+        sum(us for module, us, top_level in imports if top_level and module not in startup_modules)
+        for imports in runs
+    ) / 1000
+    assert elapsed_ms < budget_ms, f"{statement!r} took {elapsed_ms:.1f} ms (budget {budget_ms} ms)"
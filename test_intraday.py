@@ -0,0 +1,96 @@
+"""
+Tests for the intraday ring buffer and poller (no network access required).
+"""
+
+import numpy as np
+import pytest
+
+import intraday
+from intraday import IntradayBuffer, IntradayPoller
+
+
+def make_columns(timestamps, closes, volumes, day='2026-01-15'):
+    """fetch_intraday_bars style columns; bar i starts 09:30 + timestamp offset in minutes."""
+    timestamps = np.asarray(timestamps, dtype=np.int64)
+    closes = np.asarray(closes, dtype=np.float64)
+    base = np.datetime64(f'{day}T09:30:00')
+    return {
+        'timestamp': timestamps,
+        'time': base + ((timestamps - timestamps.min()) if len(timestamps) else timestamps).astype('timedelta64[s]'),
+        'open': closes - 0.5,
+        'high': closes + 1.0,
+        'low': closes - 1.0,
+        'close': closes,
+        'volume': np.asarray(volumes, dtype=np.float64),
+    }
+
+
+def reference_vwap(bars):
+    typical = (bars['high'] + bars['low'] + bars['close']) / 3
+    return (typical * bars['volume']).sum() / bars['volume'].sum()
+
+
+def test_buffer_wraps_without_growing_and_keeps_session_stats():
+    buffer = IntradayBuffer(capacity=4)
+    closes = np.arange(100.0, 110.0)
+    columns = make_columns(np.arange(10) * 60, closes, np.arange(1, 11) * 100)
+
+    assert buffer.extend(columns) == 10
+    assert len(buffer) == 4
+    bars = buffer.bars()
+    assert bars['close'].tolist() == [106.0, 107.0, 108.0, 109.0]
+    assert buffer.timestamps.shape == (4,)
+
+    all_bars = {field: columns[field] for field in ('high', 'low', 'close', 'volume')}
+    assert buffer.vwap == pytest.approx(reference_vwap(all_bars))
+    assert buffer.stats()['high'] == 110.0
+    assert buffer.stats()['low'] == 99.0
+    assert buffer.stats()['volume'] == 5500
+
+
+def test_buffer_replaces_forming_bar_in_place():
+    buffer = IntradayBuffer(capacity=8)
+    buffer.extend(make_columns([0, 60], [100.0, 101.0], [500, 100]))
+    # The 60s bar keeps forming: more volume, higher close
+    buffer.extend(make_columns([60, 120], [102.0, 103.0], [300, 50]))
+
+    bars = buffer.bars()
+    assert bars['close'].tolist() == [100.0, 102.0, 103.0]
+    assert buffer.volume == 850
+    assert buffer.vwap == pytest.approx(reference_vwap(bars))
+    assert buffer.push(30, np.datetime64('2026-01-15T09:30:30'), 1, 1, 1, 1, 1) is False
+
+
+def test_poller_requests_only_new_bars_and_resets_on_new_session(monkeypatch):
+    calls = []
+    responses = [
+        make_columns([0, 60, 120], [100.0, 101.0, 102.0], [10, 20, 30]),
+        make_columns([120, 180], [102.5, 103.0], [40, 50]),
+        make_columns([], [], []),
+        None,
+    ]
+
+    def fake_fetch(symbol, since=None, interval='1m', session=None):
+        calls.append(since)
+        return responses[len(calls) - 1]
+
+    monkeypatch.setattr(intraday, 'fetch_intraday_bars', fake_fetch)
+    poller = IntradayPoller('NVDA', session=object())
+
+    assert poller.poll() == 3
+    assert poller.poll() == 2
+    assert poller.poll() == 0
+    assert calls == [None, 120, 180]
+    assert poller.buffer.volume == 10 + 20 + 40 + 50
+    assert poller.buffer.stats()['bars'] == 4
+
+    next_day = make_columns([180, 86400], [103.0, 90.0], [50, 7])
+    next_day['time'] = np.array(['2026-01-15T09:33:00', '2026-01-16T09:30:00'], dtype='datetime64[s]')
+    responses[3] = next_day
+    poller.poll()
+    assert poller.buffer.stats() == {'vwap': 90.0, 'high': 91.0, 'low': 89.0, 'volume': 7, 'bars': 1}
+
+
+def test_poller_rejects_daily_interval():
+    with pytest.raises(ValueError):
+        IntradayPoller('NVDA', interval='1d', session=object())
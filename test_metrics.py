@@ -0,0 +1,143 @@
+"""
+Tests for the metrics registry and the instrumented fetch, cache and write paths.
+"""
+
+import json
+import time
+
+import pytest
+
+import feed_cache
+import finance_util.news
+import finance_util.prices
+import http_retry
+import metrics
+import ohlcv_cache
+from finance_util import export_to_excel, fetch_daily_stock_data, fetch_stock_news
+from stub_server import StandIn
+
+
+@pytest.fixture
+def registry():
+    """Enable a fresh registry for one test and disable metrics afterwards."""
+    registry = metrics.enable(metrics.MetricsRegistry())
+    yield registry
+    metrics.disable()
+
+
+@pytest.fixture
+def stand_in(monkeypatch, tmp_path):
+    http_retry.set_scheduler(http_retry.RetryScheduler(
+        base_delay=0.01, max_delay=0.05, host_rates={'127.0.0.1': (1000.0, 1000)}))
+    cache = ohlcv_cache.OHLCVCache(str(tmp_path / 'ohlcv.sqlite'))
+    feeds = feed_cache.FeedCache(str(tmp_path / 'feeds.sqlite'))
+    ohlcv_cache.set_default_cache(cache)
+    feed_cache.set_default_feed_cache(feeds)
+    with StandIn(seed=0) as server:
+        monkeypatch.setattr(finance_util.prices, 'YAHOO_CHART_URL', server.chart_url)
+        monkeypatch.setattr(finance_util.news, 'GOOGLE_NEWS_RSS_URL', server.news_url)
+        yield server
+    http_retry.set_scheduler(None)
+    ohlcv_cache.set_default_cache(None)
+    feed_cache.set_default_feed_cache(None)
+    cache.close()
+    feeds.close()
+
+
+def test_counters_and_histograms(registry):
+    metrics.inc('http_requests_total', host='a', status=200)
+    metrics.inc('http_requests_total', 2, status=200, host='a')
+    metrics.inc('http_requests_total', host='a', status=503)
+    for value in (0.002, 0.02, 0.2, 100.0):
+        metrics.observe('parse_seconds', value, kind='chart')
+
+    assert registry.counter('http_requests_total', host='a', status=200) == 3
+    assert registry.counter('http_requests_total', host='a', status=503) == 1
+    assert registry.counter('http_requests_total', host='b', status=200) == 0
+
+    histogram = registry.histogram('parse_seconds', kind='chart')
+    assert histogram.count == 4
+    assert histogram.sum == pytest.approx(100.222)
+    cumulative = dict(histogram.cumulative())
+    assert cumulative[0.005] == 1
+    assert cumulative[0.25] == 3
+    assert cumulative[30.0] == 3
+    assert cumulative[float('inf')] == 4
+
+
+def test_timer_records_even_on_error(registry):
+    with pytest.raises(RuntimeError):
+        with metrics.timer('excel_write_seconds', writer='test'):
+            raise RuntimeError
+    assert registry.histogram('excel_write_seconds', writer='test').count == 1
+
+
+def test_prometheus_and_json_output(registry, tmp_path):
+    metrics.inc('http_response_bytes_total', 1024, host='query1.finance.yahoo.com')
+    metrics.observe('http_request_seconds', 0.3, host='query1.finance.yahoo.com')
+
+    text = registry.to_prometheus()
+    assert '# TYPE http_response_bytes_total counter' in text
+    assert 'http_response_bytes_total{host="query1.finance.yahoo.com"} 1024' in text
+    assert '# TYPE http_request_seconds histogram' in text
+    assert 'http_request_seconds_bucket{host="query1.finance.yahoo.com",le="0.25"} 0' in text
+    assert 'http_request_seconds_bucket{host="query1.finance.yahoo.com",le="0.5"} 1' in text
+    assert 'http_request_seconds_bucket{host="query1.finance.yahoo.com",le="+Inf"} 1' in text
+    assert 'http_request_seconds_count{host="query1.finance.yahoo.com"} 1' in text
+
+    assert metrics.dump(str(tmp_path / 'run.prom')).endswith('run.prom')
+    assert (tmp_path / 'run.prom').read_text() == text
+
+    metrics.dump(str(tmp_path / 'run.json'))
+    snapshot = json.loads((tmp_path / 'run.json').read_text())
+    assert snapshot['counters'] == [{'name': 'http_response_bytes_total',
+                                     'labels': {'host': 'query1.finance.yahoo.com'}, 'value': 1024}]
+    assert snapshot['histograms'][0]['buckets']['+Inf'] == 1
+
+
+def test_disabled_metrics_are_no_ops():
+    assert not metrics.enabled()
+    assert metrics.timer('parse_seconds', kind='chart') is metrics.timer('excel_write_seconds')
+    assert metrics.dump('unused.json') is None
+
+    calls = 200_000
+    start = time.perf_counter()
+    for _ in range(calls):
+        metrics.inc('http_requests_total', host='a', status=200)
+        with metrics.timer('parse_seconds', kind='chart'):
+            pass
+    # Two disabled calls per iteration: a few None checks, no locking or timing
+    assert (time.perf_counter() - start) / calls < 5e-6
+
+
+def test_fetch_paths_are_instrumented(registry, stand_in):
+    fetch_daily_stock_data('NVDA', '2026-01-15')
+    fetch_daily_stock_data('NVDA', '2026-01-15')
+    fetch_stock_news('NVDA', '2026-01-15')
+    fetch_stock_news('NVDA', '2026-01-15')
+
+    assert registry.counter('http_requests_total', host='127.0.0.1', status=200) == 3
+    assert registry.counter('http_response_bytes_total', host='127.0.0.1') == stand_in.stats['bytes']
+    assert registry.histogram('http_request_seconds', host='127.0.0.1').count == 3
+    assert registry.counter('cache_requests_total', cache='ohlcv', result='miss') == 1
+    assert registry.counter('cache_requests_total', cache='ohlcv', result='hit') == 1
+    # The stand-in sends no validators, so both feed downloads are misses
+    assert registry.counter('cache_requests_total', cache='feed', result='miss') == 2
+    assert registry.histogram('parse_seconds', kind='chart').count == 1
+    assert registry.histogram('parse_seconds', kind='news').count == 2
+
+
+def test_retries_are_counted(registry, stand_in):
+    stand_in.error_rate, stand_in.error_statuses = 0.5, (503,)
+    for _ in range(10):
+        fetch_daily_stock_data('AAPL', '2026-01-15', use_cache=False)
+
+    errors = registry.counter('http_requests_total', host='127.0.0.1', status=503)
+    assert errors == stand_in.stats['status'][503] > 0
+    assert registry.counter('http_retries_total', host='127.0.0.1') == errors
+    assert registry.counter('http_requests_total', host='127.0.0.1', status=200) == 10
+
+
+def test_excel_write_time(registry, tmp_path):
+    export_to_excel([{'name': 'NVDA', 'price': 180.0, 'eps': 3.0}], output_dir=str(tmp_path))
+    assert registry.histogram('excel_write_seconds', writer='export_to_excel').count == 1
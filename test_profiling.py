@@ -0,0 +1,87 @@
+"""
+Tests for the shared --profile support (profiling.py).
+"""
+
+import argparse
+import asyncio
+import json
+import pstats
+
+import profiling
+
+
+def test_stage_is_a_no_op_without_profiler():
+    assert profiling.get_profiler() is None
+    assert profiling.stage('fetch') is profiling.stage('write')
+    with profiling.stage('fetch'):
+        pass
+
+
+def test_stage_table_and_trace(tmp_path):
+    profiler = profiling.Profiler(cprofile=False)
+    profiler.start()
+    try:
+        for _ in range(3):
+            with profiling.stage('fetch'):
+                sum(range(10000))
+        with profiling.stage('write'):
+            buffer = [bytes(1024) for _ in range(1024)]
+            del buffer
+    finally:
+        profiler.stop()
+
+    assert profiling.get_profiler() is None
+    assert profiler.stages['fetch'].calls == 3
+    assert profiler.stages['write'].peak >= 1024 * 1024
+    assert profiler.stages['total'].wall >= profiler.stages['fetch'].wall + profiler.stages['write'].wall
+
+    table = profiler.stage_table().splitlines()
+    assert table[0].split() == ['stage', 'calls', 'wall', 's', 'cpu', 's', 'peak', 'MB']
+    assert [line.split()[0] for line in table[1:]] == ['fetch', 'write', 'total']
+
+    trace = json.loads(open(profiler.write_trace(str(tmp_path / 'trace.json'))).read())
+    spans = [event for event in trace['traceEvents'] if event['ph'] == 'X']
+    assert [event['name'] for event in spans] == ['fetch'] * 3 + ['write']
+    assert all(event['dur'] > 0 and 'cpu_ms' in event['args'] for event in spans)
+    assert spans[1]['ts'] >= spans[0]['ts'] + spans[0]['dur']
+
+
+def test_async_tasks_get_their_own_tracks():
+    async def work(name):
+        with profiling.stage(name):
+            await asyncio.sleep(0.01)
+
+    async def run():
+        await asyncio.gather(work('fetch'), work('news'))
+
+    profiler = profiling.Profiler(cprofile=False, trace_memory=False)
+    profiler.start()
+    try:
+        asyncio.run(run())
+    finally:
+        profiler.stop()
+
+    tracks = {event['name']: event['tid'] for event in profiler.events}
+    assert tracks['fetch'] != tracks['news']
+    assert profiler.stages['fetch'].wall >= 0.01
+
+
+def test_profile_session_writes_pstats_and_trace(tmp_path, capsys):
+    parser = argparse.ArgumentParser()
+    profiling.add_profile_arguments(parser, 'test')
+    assert parser.parse_args([]).profile is None
+    assert parser.parse_args(['--profile']).profile == 'test.pstats'
+
+    pstats_path, trace_path = str(tmp_path / 'run.pstats'), str(tmp_path / 'run.json')
+    args = parser.parse_args(['--profile', pstats_path, '--profile-trace', trace_path])
+    with profiling.profile_session(args) as profiler:
+        with profiling.stage('parse'):
+            sorted(range(100000), key=lambda x: -x)
+
+    assert profiler is not None
+    assert 'parse' in capsys.readouterr().out
+    assert pstats.Stats(pstats_path).total_calls > 0
+    assert json.loads(open(trace_path).read())['traceEvents']
+
+    with profiling.profile_session(parser.parse_args([])) as profiler:
+        assert profiler is None
@@ -0,0 +1,126 @@
+"""
+Tests for the content-addressed scrape cache (scrape_cache.py).
+"""
+
+import time
+
+import pandas as pd
+import pytest
+
+from financials_table import read_table
+from scrape_cache import ScrapeCache, page_hash
+
+
+def make_page(revenue, footer='build 1'):
+    return ('<html><head><script>window.build = "' + footer + '";</script></head><body>'
+            '<table><thead><tr><th>Fiscal Quarter</th><th>Q3 2026</th><th>Q2 2026</th></tr></thead>'
+            f'<tbody><tr><td>Revenue</td><td>{revenue}</td><td>46,743</td></tr>'
+            '<tr><td>Other Unusual Items</td><td>-</td><td>-</td></tr></tbody></table></body></html>')
+
+
+class CountingParser:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, html):
+        self.calls += 1
+        return read_table(html)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = ScrapeCache(str(tmp_path / 'scrape.sqlite'))
+    yield cache
+    cache.close()
+
+
+def test_page_hash_only_covers_the_table():
+    assert page_hash(make_page('57,006', 'build 1')) == page_hash(make_page('57,006', 'build 2'))
+    assert page_hash(make_page('57,006')) != page_hash(make_page('57,007'))
+    assert page_hash('<p>no table</p>') != page_hash('<p>still no table</p>')
+
+
+def test_unchanged_pages_are_not_parsed_again(cache):
+    parser = CountingParser()
+    first = cache.parse('nvda', 'financials', 'quarterly', make_page('57,006', 'build 1'), parser)
+    second = cache.parse('NVDA', 'financials', 'quarterly', make_page('57,006', 'build 2'), parser)
+
+    assert parser.calls == 1
+    pd.testing.assert_frame_equal(first, second)
+    assert second.index.name == 'Fiscal Quarter'
+    assert second.loc['Revenue', 'Q3 2026'] == '57,006'
+    assert cache.stats() == {'fresh': 0, 'hits': 1, 'misses': 1}
+
+
+def test_changed_at_moves_only_when_the_table_changes(cache):
+    parser = CountingParser()
+    cache.parse('NVDA', 'financials', 'quarterly', make_page('57,006'), parser)
+    first = cache.entry('NVDA', 'financials', 'quarterly')
+
+    time.sleep(0.01)
+    run_started = time.time()
+    cache.parse('NVDA', 'financials', 'quarterly', make_page('57,006'), parser)
+    assert cache.entry('NVDA', 'financials', 'quarterly')['changed_at'] == first['changed_at']
+    assert not cache.changed_since('NVDA', 'financials', 'quarterly', run_started)
+
+    df = cache.parse('NVDA', 'financials', 'quarterly', make_page('58,000'), parser)
+    assert df.loc['Revenue', 'Q3 2026'] == '58,000'
+    assert cache.changed_since('NVDA', 'financials', 'quarterly', run_started)
+    assert cache.changed_since('AAPL', 'financials', 'quarterly', run_started)
+    assert parser.calls == 2
+
+    # The replaced table is dropped; going back to it means parsing again
+    cache.parse('NVDA', 'financials', 'quarterly', make_page('57,006'), parser)
+    assert parser.calls == 3
+
+
+def test_fresh_respects_max_age(cache):
+    assert cache.fresh('NVDA', 'financials', 'quarterly', 3600) is None
+    cache.parse('NVDA', 'financials', 'quarterly', make_page('57,006'), CountingParser())
+
+    df = cache.fresh('nvda', 'financials', 'quarterly', 3600)
+    assert df.loc['Revenue', 'Q3 2026'] == '57,006'
+    assert cache.fresh('NVDA', 'financials', 'quarterly', 0) is None
+    assert cache.fresh('NVDA', 'financials', 'annual', 3600) is None
+    assert cache.stats()['fresh'] == 1
+
+
+def test_pages_without_a_table_are_not_recorded(cache):
+    with pytest.raises(ValueError):
+        cache.parse('NVDA', 'financials', 'quarterly', '<p>loading...</p>', CountingParser())
+    assert cache.entry('NVDA', 'financials', 'quarterly') is None
+
+
+def test_cache_persists_and_invalidates(tmp_path):
+    path = str(tmp_path / 'scrape.sqlite')
+    cache = ScrapeCache(path)
+    cache.parse('NVDA', 'financials', 'quarterly', make_page('57,006'), CountingParser())
+    cache.parse('AAPL', 'financials', 'quarterly', make_page('102,466'), CountingParser())
+    cache.close()
+
+    cache = ScrapeCache(path)
+    parser = CountingParser()
+    cache.parse('NVDA', 'financials', 'quarterly', make_page('57,006'), parser)
+    assert parser.calls == 0
+
+    assert cache.invalidate('nvda') == 1
+    assert cache.entry('NVDA', 'financials', 'quarterly') is None
+    assert cache.entry('AAPL', 'financials', 'quarterly') is not None
+    cache.parse('NVDA', 'financials', 'quarterly', make_page('57,006'), parser)
+    assert parser.calls == 1
+    assert cache.invalidate() == 2
+    cache.close()
+
+
+def test_output_current_tracks_table_path_and_format(cache):
+    parser = CountingParser()
+    assert not cache.output_current('NVDA', 'financials', 'quarterly', 'nvda_quarterly_financials', 'text')
+    cache.parse('NVDA', 'financials', 'quarterly', make_page('57,006'), parser)
+    cache.record_output('NVDA', 'financials', 'quarterly', 'nvda_quarterly_financials', 'text')
+
+    assert cache.output_current('nvda', 'financials', 'quarterly', 'nvda_quarterly_financials', 'text')
+    assert not cache.output_current('NVDA', 'financials', 'quarterly', 'nvda_quarterly_financials', 'numeric')
+    assert not cache.output_current('NVDA', 'financials', 'quarterly', 'my_output', 'text')
+
+    cache.parse('NVDA', 'financials', 'quarterly', make_page('58,000'), parser)
+    assert not cache.output_current('NVDA', 'financials', 'quarterly', 'nvda_quarterly_financials', 'text')
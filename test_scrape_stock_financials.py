@@ -0,0 +1,125 @@
+"""
+Tests for the scraper's Chrome driver pool (no browser needed: drivers are test doubles).
+"""
+
+import argparse
+import threading
+import time
+
+import pytest
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+from scrape_stock_financials import DriverPool, output_basename, parse_max_age
+
+
+class CountingDriver:
+    """Driver double that only records whether it was quit."""
+
+    def __init__(self):
+        self.quit_calls = 0
+
+    def quit(self):
+        self.quit_calls += 1
+
+
+class Factory:
+    def __init__(self):
+        self.drivers = []
+
+    def __call__(self, headless=True):
+        driver = CountingDriver()
+        self.drivers.append(driver)
+        return driver
+
+
+def test_drivers_are_reused_and_recycled_after_max_pages():
+    factory = Factory()
+    with DriverPool(size=1, max_pages=3, factory=factory) as pool:
+        seen = []
+        for _ in range(7):
+            with pool.driver() as driver:
+                seen.append(driver)
+
+    # Pages 1-3 on the first driver, 4-6 on the second, 7 on the third
+    assert [factory.drivers.index(driver) for driver in seen] == [0, 0, 0, 1, 1, 1, 2]
+    assert pool.started == 3 and pool.recycled == 2
+    assert all(driver.quit_calls == 1 for driver in factory.drivers)
+
+
+def test_crashed_driver_is_replaced_but_timeouts_keep_it():
+    factory = Factory()
+    pool = DriverPool(size=1, max_pages=100, factory=factory)
+
+    with pytest.raises(TimeoutException):
+        with pool.driver():
+            raise TimeoutException("no table")
+    with pytest.raises(WebDriverException):
+        with pool.driver():
+            raise WebDriverException("chrome not reachable")
+    with pool.driver() as driver:
+        pass
+
+    assert len(factory.drivers) == 2
+    assert factory.drivers[0].quit_calls == 1
+    assert driver is factory.drivers[1]
+    pool.close()
+    assert factory.drivers[1].quit_calls == 1
+
+
+def test_pool_never_exceeds_its_size():
+    factory = Factory()
+    pool = DriverPool(size=2, factory=factory)
+    in_use, peak = [0], [0]
+    lock = threading.Lock()
+
+    def work():
+        with pool.driver():
+            with lock:
+                in_use[0] += 1
+                peak[0] = max(peak[0], in_use[0])
+            time.sleep(0.01)
+            with lock:
+                in_use[0] -= 1
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    pool.close()
+
+    assert peak[0] == 2
+    assert len(factory.drivers) == 2
+
+
+def test_failed_driver_start_raises_and_frees_the_slot():
+    def broken_factory(headless=True):
+        raise SystemExit(1)
+
+    pool = DriverPool(size=1, factory=broken_factory)
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            pool.acquire()
+
+
+def test_invalid_pool_settings():
+    with pytest.raises(ValueError):
+        DriverPool(size=0)
+    with pytest.raises(ValueError):
+        DriverPool(max_pages=0)
+
+
+def test_output_basename():
+    assert output_basename('NVDA', 'quarterly') == 'nvda_quarterly_financials'
+    assert output_basename('NVDA', 'annual', 'balance-sheet') == 'nvda_annual_balance-sheet'
+
+
+def test_parse_max_age():
+    assert parse_max_age('3600') == 3600
+    assert parse_max_age('30m') == 1800
+    assert parse_max_age('12h') == 43200
+    assert parse_max_age('7D') == 604800
+    assert parse_max_age('0') == 0
+    for text in ('', 'h', 'soon', '-1d'):
+        with pytest.raises(argparse.ArgumentTypeError):
+            parse_max_age(text)
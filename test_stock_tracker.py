@@ -1,14 +1,19 @@
 #!/usr/bin/env python3
 """
 Test script for stock tracker to verify real data fetching.
+
+Run it directly (python test_stock_tracker.py [YYYY-MM-DD]); it needs network
+access and uses the real OHLCV cache. The checks are not named test_* so pytest
+does not collect them.
 """
 
 import sys
 from datetime import datetime
 from finance_util import fetch_daily_stock_data, fetch_stock_news
+from ohlcv_cache import get_default_cache
 
 
-def test_stock_data_fetch(symbol='NVDA'):
+def check_stock_data_fetch(symbol='NVDA', date=None):
     """Test fetching stock data from Yahoo Finance API."""
     print("=" * 70)
     print(f"Testing Stock Data Fetch for {symbol}")
@@ -19,7 +24,7 @@ def test_stock_data_fetch(symbol='NVDA'):
         print(f"📅 Current date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
 
         # Fetch stock data
-        stock_data = fetch_daily_stock_data(symbol)
+        stock_data = fetch_daily_stock_data(symbol, date)
 
         print("✅ Successfully fetched stock data!")
         print("\n" + "─" * 70)
@@ -60,7 +65,7 @@ def test_stock_data_fetch(symbol='NVDA'):
         return False, None
 
 
-def test_news_fetch(symbol='NVDA', date=None):
+def check_news_fetch(symbol='NVDA', date=None):
     """Test fetching news from Google News RSS."""
     print("\n" + "=" * 70)
     print(f"Testing News Fetch for {symbol}")
@@ -106,11 +111,14 @@ def main():
     print("╚" + "═" * 68 + "╝")
     print()
 
+    # Optional date argument (YYYY-MM-DD); settled dates are served from the local cache
+    date = sys.argv[1] if len(sys.argv) > 1 else None
+
     # Test 1: Stock data fetch
-    stock_success, stock_data = test_stock_data_fetch('NVDA')
+    stock_success, stock_data = check_stock_data_fetch('NVDA', date)
 
     # Test 2: News fetch
-    news_success, news_items = test_news_fetch('NVDA')
+    news_success, news_items = check_news_fetch('NVDA', date)
 
     # Summary
     print("\n" + "=" * 70)
@@ -118,6 +126,8 @@ def main():
     print("=" * 70)
     print(f"  Stock Data Fetch: {'✅ PASS' if stock_success else '❌ FAIL'}")
     print(f"  News Fetch:       {'✅ PASS' if news_success else '⚠️  WARN (not critical)'}")
+    cache_stats = get_default_cache().stats()
+    print(f"  Price Cache:      {cache_stats['hits']} hit(s) / {cache_stats['misses']} miss(es)")
     print("=" * 70)
 
     if stock_success:
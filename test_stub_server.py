@@ -0,0 +1,393 @@
+"""
+Fetch paths driven against the local record/replay stand-in (stub_server.py).
+
+The load tests print throughput and p50/p99 latency per fetch path.
+"""
+
+import json
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import pytest
+import requests
+
+import feed_cache
+import finance_util.news
+import finance_util.prices
+import finance_util.transport
+import http_retry
+import ohlcv_cache
+import scrape_stock_financials
+from finance_util import fetch_daily_stock_data, fetch_stock_news
+from scrape_cache import ScrapeCache
+from stub_server import DEFAULT_FIXTURES_DIR, StandIn, summarize_latencies
+
+
+@pytest.fixture(autouse=True)
+def fast_retry_scheduler():
+    """Use short retry delays and no rate limit for the local stand-in."""
+    http_retry.set_scheduler(http_retry.RetryScheduler(
+        base_delay=0.01, max_delay=0.05, host_rates={'127.0.0.1': (10000.0, 10000)}))
+    yield
+    http_retry.set_scheduler(None)
+
+
+@pytest.fixture(autouse=True)
+def isolated_caches(tmp_path):
+    """Point the shared OHLCV and feed caches at temporary files for every test."""
+    cache = ohlcv_cache.OHLCVCache(str(tmp_path / 'ohlcv.sqlite'))
+    feeds = feed_cache.FeedCache(str(tmp_path / 'feeds.sqlite'))
+    ohlcv_cache.set_default_cache(cache)
+    feed_cache.set_default_feed_cache(feeds)
+    yield
+    ohlcv_cache.set_default_cache(None)
+    feed_cache.set_default_feed_cache(None)
+    cache.close()
+    feeds.close()
+
+
+@pytest.fixture
+def stand_in(monkeypatch):
+    with StandIn(seed=0) as server:
+        monkeypatch.setattr(finance_util.prices, 'YAHOO_CHART_URL', server.chart_url)
+        monkeypatch.setattr(finance_util.news, 'GOOGLE_NEWS_RSS_URL', server.news_url)
+        monkeypatch.setattr(scrape_stock_financials, 'STOCKANALYSIS_URL', server.stockanalysis_url)
+        yield server
+
+
+def recorded_bar(symbol, index):
+    with open(f'{DEFAULT_FIXTURES_DIR}/chart/{symbol}.json') as f:
+        result = json.load(f)['chart']['result'][0]
+    quote = result['indicators']['quote'][0]
+    return {field: quote[field][index] for field in ('open', 'high', 'low', 'close', 'volume')}
+
+
+def test_replays_recorded_chart(stand_in):
+    # 2026-01-15 is the second-to-last recorded bar
+    data = fetch_daily_stock_data('NVDA', '2026-01-15')
+    bar, prev = recorded_bar('NVDA', -2), recorded_bar('NVDA', -3)
+
+    assert data['date'] == '2026-01-15'
+    assert data['close'] == round(bar['close'], 2)
+    assert data['volume'] == bar['volume']
+    assert data['prev_close'] == round(prev['close'], 2)
+    assert stand_in.stats['kinds'] == {'chart': 1}
+
+
+def test_unknown_symbol_is_not_found(stand_in):
+    with pytest.raises(ValueError):
+        fetch_daily_stock_data('ZZZZ', '2026-01-15')
+    assert stand_in.stats['status'] == {404: 1}
+
+
+def test_replays_recorded_news(stand_in):
+    news = fetch_stock_news('NVDA', '2026-01-15', max_results=3)
+    assert [item['publisher'] for item in news] == ['Reuters', 'CNBC', 'The Motley Fool']
+
+    # Queries without a recording get an empty feed
+    assert fetch_stock_news('MSFT', '2026-01-15') == []
+
+
+def test_injected_errors_are_retried(stand_in):
+    stand_in.error_rate = 0.5
+    stand_in.error_statuses = (429, 503)
+
+    for _ in range(10):
+        assert fetch_daily_stock_data('AAPL', '2026-01-15', use_cache=False)['date'] == '2026-01-15'
+
+    status = stand_in.stats['status']
+    assert status[200] == 10
+    assert status[429] + status[503] > 0
+
+
+def test_latency_jitter_and_payload_size(stand_in):
+    stand_in.latency, stand_in.jitter, stand_in.pad_bytes = 0.05, 0.02, 256 * 1024
+    session = requests.Session()
+
+    start = time.perf_counter()
+    response = session.get(stand_in.chart_url.format(symbol='NVDA'))
+    elapsed = time.perf_counter() - start
+
+    assert 0.05 <= elapsed < 1.0
+    assert len(response.content) == 256 * 1024
+    assert response.json()['chart']['result'][0]['meta']['symbol'] == 'NVDA'
+
+
+def test_scraper_parses_recorded_financials(stand_in):
+    url = scrape_stock_financials.build_url('NVDA', 'quarterly', 'financials')
+    assert url.startswith(stand_in.base_url)
+
+    html = requests.get(url).text
+    df = scrape_stock_financials.parse_financials_table(html)
+    assert df.index.name == 'Period Ending'
+    assert df.loc['Revenue', 'Oct 26, 2025'] == '57,006'
+    assert df.shape == (28, 5)
+
+    numeric = scrape_stock_financials.parse_financials_table(html, numeric=True)
+    assert numeric.loc['Revenue', 'Oct 26, 2025'] == 57006.0
+    assert numeric.loc['Gross Margin', 'Oct 26, 2025'] == pytest.approx(0.7341)
+
+
+def test_scraper_selenium_against_stand_in(stand_in):
+    try:
+        driver = scrape_stock_financials.create_driver()
+    except SystemExit:
+        pytest.skip("Chrome WebDriver is not available")
+    driver.quit()
+
+    url = scrape_stock_financials.build_url('NVDA', 'quarterly', 'financials')
+    df = scrape_stock_financials.fetch_financials_selenium(url)
+    assert df.loc['Revenue', 'Oct 26, 2025'] == '57,006'
+
+
+class FixtureDriver:
+    """Stand-in for a Chrome driver whose rendered page is a recorded fixture."""
+
+    def __init__(self, path):
+        self.path = path
+        self.page_source = ''
+        self.loaded = []
+
+    def get(self, url):
+        self.loaded.append(url)
+        with open(self.path, encoding='utf-8') as f:
+            self.page_source = f.read()
+
+    def find_element(self, by, value):
+        assert '<table' in self.page_source
+        return object()
+
+    def quit(self):
+        pass
+
+
+@pytest.fixture
+def fixture_driver(monkeypatch):
+    driver = FixtureDriver(f'{DEFAULT_FIXTURES_DIR}/stockanalysis/nvda/financials-quarterly.html')
+    monkeypatch.setattr(scrape_stock_financials, 'create_driver', lambda headless=True: driver)
+    monkeypatch.setattr(scrape_stock_financials, 'SELENIUM_SETTLE_SECONDS', 0)
+    return driver
+
+
+def test_scraper_http_fast_path_skips_browser(stand_in, fixture_driver):
+    df = scrape_stock_financials.scrape_financials('NVDA', 'quarterly', 'financials')
+
+    assert fixture_driver.loaded == []
+    assert stand_in.stats['kinds'] == {'stockanalysis': 1}
+    assert df.loc['Revenue', 'Oct 26, 2025'] == '57,006'
+    assert df.shape == (28, 5)
+
+
+def test_scraper_falls_back_to_selenium_when_blocked(stand_in, fixture_driver):
+    stand_in.error_rate, stand_in.error_statuses = 1.0, (403,)
+    df = scrape_stock_financials.scrape_financials('NVDA', 'quarterly', 'financials')
+
+    # Both paths parse the same recorded page to the same table
+    url = scrape_stock_financials.build_url('NVDA', 'quarterly', 'financials')
+    assert fixture_driver.loaded == [url]
+    assert stand_in.stats['status'] == {403: 1}
+    stand_in.error_rate = 0.0
+    assert df.equals(scrape_stock_financials.fetch_financials_http(url))
+
+
+def test_scraper_falls_back_when_page_has_no_table(tmp_path, fixture_driver, monkeypatch):
+    shell = tmp_path / 'stockanalysis' / 'nvda'
+    shell.mkdir(parents=True)
+    (shell / 'financials-quarterly.html').write_text('<html><body><div id="app"></div></body></html>')
+
+    with StandIn(str(tmp_path)) as server:
+        monkeypatch.setattr(scrape_stock_financials, 'STOCKANALYSIS_URL', server.stockanalysis_url)
+        df = scrape_stock_financials.scrape_financials('NVDA', 'quarterly', 'financials')
+
+    assert len(fixture_driver.loaded) == 1
+    assert df.loc['Revenue', 'Oct 26, 2025'] == '57,006'
+
+
+NVDA_FINANCIALS = f'{DEFAULT_FIXTURES_DIR}/stockanalysis/nvda/financials-quarterly.html'
+ALL_VIEWS = [(statement, period) for statement in scrape_stock_financials.STATEMENTS
+             for period in scrape_stock_financials.PERIODS]
+
+
+def test_scrape_many_uses_one_pooled_session_per_ticker(stand_in, monkeypatch):
+    monkeypatch.setattr(scrape_stock_financials, 'SELENIUM_SETTLE_SECONDS', 0)
+    stand_in.error_rate, stand_in.error_statuses = 1.0, (403,)
+    drivers = []
+
+    def factory(headless=True):
+        drivers.append(FixtureDriver(NVDA_FINANCIALS))
+        return drivers[-1]
+
+    jobs = [(ticker, statement, period) for ticker in ('NVDA', 'AAPL', 'MSFT') for statement, period in ALL_VIEWS]
+    with scrape_stock_financials.DriverPool(size=2, max_pages=100, factory=factory) as pool:
+        results, errors = scrape_stock_financials.scrape_many(jobs, pool, max_workers=2)
+
+    assert errors == {}
+    assert list(results) == jobs
+    # Three tickers share two drivers; each ticker's six views load in one session
+    assert len(drivers) == 2
+    sessions = sorted(len(driver.loaded) for driver in drivers)
+    assert sessions == [6, 12]
+
+
+@pytest.fixture
+def views_dir(tmp_path):
+    """Fixtures directory where every NVDA view replays the recorded income statement."""
+    directory = tmp_path / 'stockanalysis' / 'nvda'
+    directory.mkdir(parents=True)
+    with open(NVDA_FINANCIALS, 'rb') as f:
+        page = f.read()
+    for statement, period in ALL_VIEWS:
+        (directory / f'{statement}-{period}.html').write_bytes(page)
+    return tmp_path
+
+
+def test_scrape_ticker_all_over_http(views_dir, fixture_driver, monkeypatch):
+    with StandIn(str(views_dir)) as server:
+        monkeypatch.setattr(scrape_stock_financials, 'STOCKANALYSIS_URL', server.stockanalysis_url)
+        tables = scrape_stock_financials.scrape_ticker_all('NVDA')
+        assert server.stats['kinds'] == {'stockanalysis': 6}
+
+    assert list(tables) == ALL_VIEWS
+    assert all(df.loc['Revenue', 'Oct 26, 2025'] == '57,006' for df in tables.values())
+    assert fixture_driver.loaded == []
+
+
+def test_scrape_ticker_all_falls_back_in_one_browser_session(views_dir, fixture_driver, monkeypatch):
+    for period in scrape_stock_financials.PERIODS:
+        (views_dir / 'stockanalysis' / 'nvda' / f'balance-sheet-{period}.html').unlink()
+    starts = []
+    monkeypatch.setattr(scrape_stock_financials, 'create_driver',
+                        lambda headless=True: starts.append(headless) or fixture_driver)
+
+    with StandIn(str(views_dir)) as server:
+        monkeypatch.setattr(scrape_stock_financials, 'STOCKANALYSIS_URL', server.stockanalysis_url)
+        tables = scrape_stock_financials.scrape_ticker_all('NVDA')
+
+        assert list(tables) == ALL_VIEWS
+        assert starts == [True]
+        assert fixture_driver.loaded == [scrape_stock_financials.build_url('NVDA', period, 'balance-sheet')
+                                         for period in scrape_stock_financials.PERIODS]
+
+
+def test_scrape_ticker_all_reports_missing_views(views_dir, monkeypatch):
+    (views_dir / 'stockanalysis' / 'nvda' / 'cash-flow-statement-annual.html').unlink()
+    monkeypatch.setattr(scrape_stock_financials, 'create_driver', lambda headless=True: sys.exit(1))
+
+    with StandIn(str(views_dir)) as server:
+        monkeypatch.setattr(scrape_stock_financials, 'STOCKANALYSIS_URL', server.stockanalysis_url)
+        with pytest.raises(RuntimeError, match='cash-flow-statement \\(annual\\)'):
+            scrape_stock_financials.scrape_ticker_all('NVDA')
+        results, errors = scrape_stock_financials.scrape_ticker_views('NVDA', ALL_VIEWS)
+
+    assert len(results) == 5
+    assert list(errors) == [('cash-flow-statement', 'annual')]
+
+
+def test_scrape_cache_skips_parsing_and_fetching(views_dir, tmp_path, monkeypatch):
+    cache = ScrapeCache(str(tmp_path / 'scrape.sqlite'))
+    with StandIn(str(views_dir)) as server:
+        monkeypatch.setattr(scrape_stock_financials, 'STOCKANALYSIS_URL', server.stockanalysis_url)
+        first = scrape_stock_financials.scrape_ticker_all('NVDA', cache=cache)
+        second = scrape_stock_financials.scrape_ticker_all('NVDA', cache=cache)
+        assert server.stats['kinds'] == {'stockanalysis': 12}
+        third = scrape_stock_financials.scrape_ticker_all('NVDA', cache=cache, max_age=3600)
+        assert server.stats['kinds'] == {'stockanalysis': 12}
+    cache.close()
+
+    # All six views replay the same table, so only the first page is ever parsed
+    assert cache.stats() == {'fresh': 6, 'hits': 11, 'misses': 1}
+    for view in ALL_VIEWS:
+        assert first[view].equals(second[view]) and first[view].equals(third[view])
+
+
+def test_cli_rewrites_only_changed_views(views_dir, tmp_path, monkeypatch, capsys):
+    monkeypatch.setenv('FINANCE_UTIL_CACHE_DIR', str(tmp_path / 'cache'))
+    output_dir = tmp_path / 'out'
+    output_dir.mkdir()
+    monkeypatch.chdir(output_dir)
+
+    def run(*args):
+        """Run the CLI against a stand-in serving the current fixtures; return (stdout, page requests)."""
+        with StandIn(str(views_dir)) as server:
+            monkeypatch.setattr(scrape_stock_financials, 'STOCKANALYSIS_URL', server.stockanalysis_url)
+            monkeypatch.setattr(sys, 'argv', ['scrape_stock_financials.py', '--ticker', 'NVDA', '--all', *args])
+            scrape_stock_financials.main()
+            return capsys.readouterr().out, server.stats['kinds'].get('stockanalysis', 0)
+
+    run()
+    written = {path.name: path.stat().st_mtime_ns for path in output_dir.iterdir()}
+    assert len(written) == 12
+
+    out, requested = run()
+    assert requested == 6 and '저장 생략 6개' in out
+    assert {path.name: path.stat().st_mtime_ns for path in output_dir.iterdir()} == written
+
+    page = views_dir / 'stockanalysis' / 'nvda' / 'balance-sheet-annual.html'
+    page.write_text(page.read_text(encoding='utf-8').replace('57,006', '57,007'), encoding='utf-8')
+    out, requested = run()
+    assert '새로 파싱 1개' in out and '저장 생략 5개' in out
+    changed = {path.name for path in output_dir.iterdir() if path.stat().st_mtime_ns != written[path.name]}
+    assert changed == {'nvda_annual_balance-sheet.csv', 'nvda_annual_balance-sheet.xlsx'}
+
+    out, requested = run('--max-age', '1h')
+    assert requested == 0 and '요청 생략 6개' in out
+
+    # Same tables in a different output format: every file is rewritten, then kept
+    written = {path.name: path.stat().st_mtime_ns for path in output_dir.iterdir()}
+    out, requested = run('--numeric', '--max-age', '1h')
+    assert '저장 생략 0개' in out
+    assert all(path.stat().st_mtime_ns != written[path.name] for path in output_dir.iterdir())
+    assert pd.read_csv(output_dir / 'nvda_quarterly_financials.csv', index_col=0).loc['Revenue'].iloc[0] == 57006.0
+    out, requested = run('--numeric', '--max-age', '1h')
+    assert '저장 생략 6개' in out
+
+
+def run_load(func, calls, workers):
+    """Run func(i) for i in range(calls) on a thread pool; return the latency summary."""
+    def timed(i):
+        start = time.perf_counter()
+        func(i)
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        latencies = list(executor.map(timed, range(calls)))
+    return summarize_latencies(latencies, time.perf_counter() - start)
+
+
+def test_fetch_paths_under_load(stand_in, capsys):
+    stand_in.latency, stand_in.jitter, stand_in.error_rate = 0.01, 0.01, 0.05
+    stand_in.error_statuses = (429, 500, 503)
+    financials_url = scrape_stock_financials.build_url('NVDA', 'quarterly', 'financials')
+    session = requests.Session()
+
+    paths = {
+        'fetch_daily_stock_data': lambda i: fetch_daily_stock_data(
+            ('NVDA', 'AAPL')[i % 2], '2026-01-15', use_cache=False),
+        'fetch_stock_news': lambda i: fetch_stock_news(('NVDA', 'AAPL')[i % 2], '2026-01-15'),
+        'parse_financials_table': lambda i: scrape_stock_financials.parse_financials_table(
+            finance_util.transport._get_with_retries(financials_url, None, {}, session, verbose=False).text),
+    }
+    reports = {name: run_load(func, calls=100, workers=8) for name, func in paths.items()}
+
+    with capsys.disabled():
+        print(f"\n{'path':<24} {'calls':>6} {'calls/s':>9} {'p50 ms':>8} {'p99 ms':>8}")
+        for name, report in reports.items():
+            print(f"{name:<24} {report['count']:>6} {report['throughput']:>9.1f} "
+                  f"{report['p50'] * 1000:>8.1f} {report['p99'] * 1000:>8.1f}")
+
+    for report in reports.values():
+        assert report['count'] == 100
+        assert 0.01 <= report['p50'] <= report['p99']
+
+
+def test_summarize_latencies():
+    summary = summarize_latencies([0.01 * i for i in range(1, 101)], elapsed=2.0)
+    assert summary['count'] == 100
+    assert summary['throughput'] == 50.0
+    assert summary['p50'] == pytest.approx(0.505)
+    assert summary['p99'] == pytest.approx(0.9901)
+    with pytest.raises(ValueError):
+        summarize_latencies([], 1.0)
@@ -0,0 +1,52 @@
+"""
+Tests for the symbol -> company directory.
+"""
+
+import json
+
+import pytest
+
+from symbol_directory import SymbolDirectory, load_symbol_directory
+
+
+def test_bundled_directory_covers_original_names():
+    directory = load_symbol_directory()
+    assert directory.search_term('NVDA') == 'NVIDIA'
+    assert directory.search_term('META') == 'Meta'
+    assert directory.search_term('XYZ') == 'XYZ'
+    assert 'aapl' in directory
+    assert len(directory) > 7
+
+
+def test_load_csv_and_json_directories(tmp_path):
+    csv_path = tmp_path / 'names.csv'
+    csv_path.write_text('symbol,name,aliases\nAAA,Alpha Corp,Alpha|AlphaCo\n', encoding='utf-8')
+    json_path = tmp_path / 'names.json'
+    json_path.write_text(json.dumps({'BBB': 'Beta Inc', 'CCC': {'name': 'Gamma', 'aliases': ['Gam']}}))
+
+    assert load_symbol_directory(str(csv_path)).keywords('AAA') == ['Alpha Corp', 'Alpha', 'AlphaCo', 'AAA']
+    directory = load_symbol_directory(str(json_path))
+    assert directory.search_term('BBB') == 'Beta Inc'
+    assert directory.keywords('CCC') == ['Gamma', 'Gam', 'CCC']
+    assert load_symbol_directory(str(json_path)) is directory
+
+
+def test_load_rejects_rows_without_name(tmp_path):
+    path = tmp_path / 'bad.csv'
+    path.write_text('symbol,name,aliases\nAAA,,\n', encoding='utf-8')
+    with pytest.raises(ValueError):
+        load_symbol_directory(str(path))
+
+
+def test_match_uses_word_boundaries_and_case_sensitive_tickers():
+    directory = SymbolDirectory({
+        'ARM': {'name': 'Arm Holdings', 'aliases': []},
+        'BAC': {'name': 'Bank of America', 'aliases': ['BofA']},
+        'NVDA': {'name': 'NVIDIA', 'aliases': ['Nvidia']},
+        'V': {'name': 'Visa', 'aliases': []},
+    })
+    assert directory.match('Nvidia and Bank of America rally') == {'NVDA', 'BAC'}
+    assert directory.match('An arm and a leg; V shaped recovery') == set()
+    assert directory.match('ARM jumps after Visa deal') == {'ARM', 'V'}
+    assert directory.match('NVIDIAN gains') == set()
+    assert directory.match('Nvidia and BofA', symbols=['nvda']) == {'NVDA'}
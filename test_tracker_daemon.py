@@ -0,0 +1,150 @@
+"""
+Tests for the tracker daemon schedules and cycles (no network access required).
+"""
+
+import asyncio
+import json
+from datetime import datetime, timedelta, timezone
+
+import pandas as pd
+import pytest
+
+import nvda_daily_tracker
+from tracker_daemon import SymbolSchedule, TrackerDaemon
+
+
+def utc(*args):
+    return datetime(*args, tzinfo=timezone.utc)
+
+
+def test_schedule_runs_once_per_weekday_after_the_close():
+    schedule = SymbolSchedule('NVDA', delay_minutes=10)
+    # 2026-01-15 is a Thursday; 16:10 New York (EST) is 21:10 UTC
+    assert not schedule.due(utc(2026, 1, 15, 21, 0))
+    assert schedule.next_run(utc(2026, 1, 15, 21, 0)) == utc(2026, 1, 15, 21, 10)
+    assert schedule.due(utc(2026, 1, 15, 21, 10))
+
+    schedule.mark_done(utc(2026, 1, 15, 21, 10))
+    assert not schedule.due(utc(2026, 1, 15, 23, 0))
+    # Friday's run is next; Saturday and Sunday are skipped
+    assert schedule.next_run(utc(2026, 1, 15, 23, 0)) == utc(2026, 1, 16, 21, 10)
+    schedule.mark_done(utc(2026, 1, 16, 21, 10))
+    assert not schedule.due(utc(2026, 1, 17, 22, 0))
+    assert schedule.next_run(utc(2026, 1, 17, 22, 0)) == utc(2026, 1, 19, 21, 10)
+
+
+def test_schedule_uses_exchange_market_hours():
+    schedule = SymbolSchedule('005930.KS', delay_minutes=0)
+    # 15:30 Seoul is 06:30 UTC
+    assert not schedule.due(utc(2026, 1, 15, 6, 29))
+    assert schedule.due(utc(2026, 1, 15, 6, 30))
+
+
+@pytest.fixture
+def fake_fetch(monkeypatch):
+    calls = []
+
+    async def fetch(symbol, date=None, max_results=5, new_only=False):
+        calls.append(symbol)
+        if symbol == 'BAD':
+            raise ValueError("No data available for BAD")
+        return ({'date': date or '2026-01-15', 'open': 100.0, 'close': 110.0, 'high': 112.0, 'low': 99.0,
+                 'volume': 1000, 'change': 10.0, 'change_pct': 10.0, 'prev_close': 100.0},
+                [{'title': f'{symbol} rallies', 'publisher': 'Reuters', 'link': 'x', 'published': ''}])
+
+    monkeypatch.setattr(nvda_daily_tracker, 'fetch_price_and_news_async', fetch)
+    return calls
+
+
+def test_cycle_tracks_due_symbols_and_reports_status(tmp_path, fake_fetch):
+    now = [utc(2026, 1, 15, 12, 0)]
+    daemon = TrackerDaemon(['NVDA', '005930.KS', 'BAD'], str(tmp_path), export_interval=3600,
+                           clock=lambda: now[0])
+
+    # Noon UTC: Seoul has closed, New York has not opened yet
+    cycle = asyncio.run(daemon.run_cycle())
+    assert cycle['symbols'] == ['005930.KS']
+    assert fake_fetch == ['005930.KS']
+
+    now[0] = utc(2026, 1, 15, 21, 30)
+    cycle = asyncio.run(daemon.run_cycle())
+    assert cycle['symbols'] == ['NVDA', 'BAD']
+    assert cycle['failed'] == ['BAD']
+    assert daemon.store.count('NVDA') == 1
+
+    # Exports are coalesced until the interval passes or the daemon closes
+    assert not (tmp_path / 'nvda_daily_tracker.xlsx').exists()
+    status = json.loads((tmp_path / 'tracker_daemon_status.json').read_text(encoding='utf-8'))
+    assert status['pending_exports'] == ['005930.KS', 'NVDA']
+    assert status['symbols']['BAD']['failures'] == 1
+    assert status['symbols']['BAD']['next_run'] == utc(2026, 1, 15, 21, 35).isoformat()
+    assert status['symbols']['NVDA']['last_date'] == '2026-01-15'
+    assert status['symbols']['NVDA']['next_run'] == utc(2026, 1, 16, 21, 10).isoformat()
+
+    # Only the failed symbol is retried, once its backoff has passed
+    fake_fetch.clear()
+    asyncio.run(daemon.run_cycle())
+    assert fake_fetch == []
+    now[0] = utc(2026, 1, 15, 21, 35)
+    asyncio.run(daemon.run_cycle())
+    assert fake_fetch == ['BAD']
+
+    daemon.close()
+    df = pd.read_excel(tmp_path / 'nvda_daily_tracker.xlsx')
+    assert df['뉴스/이유'].tolist() == ['1. [Reuters] NVDA rallies']
+    assert (tmp_path / '005930.ks_daily_tracker.xlsx').exists()
+
+
+def test_failed_symbols_back_off_until_the_next_session(tmp_path, fake_fetch):
+    now = [utc(2026, 1, 15, 21, 10)]
+    daemon = TrackerDaemon(['BAD'], str(tmp_path), clock=lambda: now[0])
+
+    # Poll every minute until midnight in New York (05:00 UTC)
+    attempts = []
+    while now[0] < utc(2026, 1, 16, 5, 0):
+        fake_fetch.clear()
+        asyncio.run(daemon.run_cycle())
+        if fake_fetch:
+            attempts.append(now[0])
+        now[0] += timedelta(minutes=1)
+
+    minutes = [round((at - attempts[0]).total_seconds() / 60) for at in attempts]
+    assert minutes == [0, 5, 15, 35, 75, 155, 275, 395]
+    assert daemon.symbol_status['BAD']['failures'] == 8
+
+    # The next session starts again with the short interval
+    now[0] = utc(2026, 1, 16, 21, 10)
+    asyncio.run(daemon.run_cycle())
+    assert daemon.schedules['BAD'].retry_at == utc(2026, 1, 16, 21, 15)
+    daemon.close()
+
+
+def test_cycle_uses_the_exchange_local_date(tmp_path, fake_fetch):
+    # 06:45 UTC on Friday 2026-01-16 is 15:45 in Seoul, after the close
+    daemon = TrackerDaemon(['NVDA', '005930.KS'], str(tmp_path), export_interval=3600,
+                           clock=lambda: utc(2026, 1, 16, 6, 45))
+    asyncio.run(daemon.run_cycle())
+    assert daemon.symbol_status['005930.KS']['last_date'] == '2026-01-16'
+    assert daemon.store.records('005930.KS')['날짜'].tolist() == ['2026-01-16']
+
+    # 04:30 UTC on Friday is still Thursday 23:30 in New York
+    daemon.clock = lambda: utc(2026, 1, 16, 4, 30)
+    asyncio.run(daemon.run_cycle(force=True))
+    assert daemon.symbol_status['NVDA']['last_date'] == '2026-01-15'
+    assert daemon.store.records('NVDA')['날짜'].tolist() == ['2026-01-15']
+    daemon.close()
+
+
+def test_run_forever_stops_and_flushes(tmp_path, fake_fetch):
+    daemon = TrackerDaemon(['NVDA'], str(tmp_path), clock=lambda: utc(2026, 1, 15, 22, 0))
+
+    async def run():
+        task = asyncio.create_task(daemon.run_forever(poll_seconds=0.01))
+        await asyncio.sleep(0.1)
+        daemon.stop()
+        await task
+
+    asyncio.run(run())
+    assert fake_fetch == ['NVDA']
+    assert daemon.cycles > 1
+    assert (tmp_path / 'nvda_daily_tracker.xlsx').exists()
@@ -0,0 +1,191 @@
+"""
+Tests for the SQLite tracker store and the tracker's store-backed write path.
+"""
+
+import asyncio
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import nvda_daily_tracker
+from finance_util import append_daily_record
+from indicators import INDICATOR_FIELDS, compute_indicators
+from tracker_store import TRACKER_COLUMNS, TrackerStore
+
+
+def make_record(date, close):
+    return {
+        'date': date, 'prev_close': close - 1.0, 'open': close - 0.5, 'close': close,
+        'high': close + 1.0, 'low': close - 2.0, 'volume': 1_000_000,
+        'change': 1.0, 'change_pct': round(100 / (close - 1.0), 2),
+    }
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = TrackerStore(str(tmp_path / 'tracker.sqlite'))
+    yield store
+    store.close()
+
+
+def test_upsert_replaces_same_day_and_sorts_newest_first(store):
+    store.upsert('NVDA', make_record('2026-01-14', 100.0), 'first')
+    store.upsert('NVDA', make_record('2026-01-15', 110.0), 'second')
+    store.upsert('NVDA', make_record('2026-01-14', 101.0), 'updated')
+    store.upsert('AAPL', make_record('2026-01-15', 200.0), 'other symbol')
+
+    df = store.records('NVDA')
+    assert list(df.columns) == list(TRACKER_COLUMNS.values())
+    assert df['날짜'].tolist() == ['2026-01-15', '2026-01-14']
+    assert df['종가'].tolist() == [110.0, 101.0]
+    assert df['뉴스/이유'].tolist() == ['second', 'updated']
+    assert store.count('NVDA') == 2
+    assert store.symbols() == ['AAPL', 'NVDA']
+
+
+def test_upsert_rejects_incomplete_records(store):
+    record = make_record('2026-01-15', 110.0)
+    del record['volume']
+    with pytest.raises(ValueError):
+        store.upsert('NVDA', record, '')
+
+
+def test_export_matches_append_daily_record_workbook(store, tmp_path):
+    days = [('2026-01-13', 90.0), ('2026-01-15', 110.0), ('2026-01-14', 100.0)]
+    for day, close in days:
+        append_daily_record(make_record(day, close), f'news {day}', 'legacy.xlsx', str(tmp_path))
+        store.upsert('NVDA', make_record(day, close), f'news {day}')
+
+    exported = store.export_excel('NVDA', 'store.xlsx', str(tmp_path))
+
+    pd.testing.assert_frame_equal(pd.read_excel(exported), pd.read_excel(tmp_path / 'legacy.xlsx'))
+
+
+def test_import_excel_round_trips(store, tmp_path):
+    for day, close in [('2026-01-14', 100.0), ('2026-01-15', 110.0)]:
+        append_daily_record(make_record(day, close), f'news {day}', 'legacy.xlsx', str(tmp_path))
+
+    assert store.import_excel('NVDA', str(tmp_path / 'legacy.xlsx')) == 2
+    pd.testing.assert_frame_equal(
+        store.records('NVDA'), pd.read_excel(tmp_path / 'legacy.xlsx'), check_dtype=False)
+
+
+def test_track_symbols_migrates_workbook_and_exports_once_per_symbol(tmp_path, monkeypatch):
+    append_daily_record(make_record('2026-01-14', 100.0), 'old news', 'nvda_daily_tracker.xlsx', str(tmp_path))
+
+    async def fake_fetch(symbol, date=None, max_results=5, new_only=False):
+        return make_record(date, 110.0), [{'title': f'{symbol} up', 'publisher': 'Reuters',
+                                            'link': 'https://example.com', 'published': date}]
+
+    exports = []
+    original_export = TrackerStore.export_excel
+
+    def counting_export(self, symbol, filename, output_dir=None):
+        exports.append(symbol)
+        return original_export(self, symbol, filename, output_dir)
+
+    monkeypatch.setattr(nvda_daily_tracker, 'fetch_price_and_news_async', fake_fetch)
+    monkeypatch.setattr(TrackerStore, 'export_excel', counting_export)
+
+    results = asyncio.run(nvda_daily_tracker.track_symbols_async(['NVDA', 'AAPL'], '2026-01-15', str(tmp_path)))
+
+    assert all(result['success'] for result in results.values())
+    assert sorted(exports) == ['AAPL', 'NVDA']
+    nvda = pd.read_excel(tmp_path / 'nvda_daily_tracker.xlsx')
+    assert nvda['날짜'].tolist() == ['2026-01-15', '2026-01-14']
+    assert nvda['뉴스/이유'].tolist() == ['1. [Reuters] NVDA up', 'old news']
+    assert (tmp_path / 'aapl_daily_tracker.xlsx').exists()
+
+
+def make_history(days, seed=0):
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range('2025-01-01', periods=days).strftime('%Y-%m-%d')
+    close = np.round(100 * np.cumprod(1 + rng.normal(0, 0.02, days)), 2)
+    prev_close = np.r_[close[0], close[:-1]]
+    return [
+        {'date': d, 'prev_close': p, 'open': p, 'close': c, 'high': max(p, c) + 1.0, 'low': min(p, c) - 1.0,
+         'volume': 1000, 'change': round(c - p, 2), 'change_pct': round((c - p) / p * 100, 2)}
+        for d, p, c in zip(dates, prev_close.tolist(), close.tolist())
+    ]
+
+
+def assert_indicators_match_full_recompute(store, symbol):
+    df = store.records(symbol, with_indicators=True).iloc[::-1].reset_index(drop=True)
+    history = df.rename(columns={column: field for field, column in TRACKER_COLUMNS.items()})
+    expected = compute_indicators(history)
+    pd.testing.assert_frame_equal(df[INDICATOR_FIELDS], expected, check_exact=False, rtol=1e-9)
+
+
+def test_indicators_advance_incrementally_and_match_full_recompute(store, tmp_path):
+    history = make_history(60)
+    for record in history[:40]:
+        store.upsert('NVDA', record, '')
+    # Rewriting the latest day redoes it from the state before it
+    store.upsert('NVDA', {**history[39], 'close': history[39]['close'] + 5}, '')
+    store.upsert('NVDA', history[39], '')
+    assert_indicators_match_full_recompute(store, 'NVDA')
+
+    # State survives reopening the store
+    store.close()
+    reopened = TrackerStore(store.path)
+    reopened.upsert_many('NVDA', [(record, '') for record in history[40:]])
+    assert_indicators_match_full_recompute(reopened, 'NVDA')
+    latest = reopened.records('NVDA', with_indicators=True).iloc[0]
+    assert not latest[INDICATOR_FIELDS].isna().any()
+    reopened.close()
+
+
+def test_backfilling_an_older_day_replays_indicators(store):
+    history = make_history(30, seed=1)
+    store.upsert_many('NVDA', [(record, '') for record in history[10:]])
+    store.upsert_many('NVDA', [(record, '') for record in history[:10]])
+    assert_indicators_match_full_recompute(store, 'NVDA')
+
+    df = store.records('NVDA', with_indicators=True)
+    assert df['sma_20'].notna().sum() == 11
+    assert list(store.records('NVDA').columns) == list(TRACKER_COLUMNS.values())
+
+
+def test_load_watchlist_skips_comments_and_duplicates(tmp_path):
+    path = tmp_path / 'watchlist.txt'
+    path.write_text("# semis\nNVDA, amd\n\nAAPL  # big tech\nnvda\n", encoding='utf-8')
+    assert nvda_daily_tracker.load_watchlist(str(path)) == ['NVDA', 'AMD', 'AAPL']
+
+    path.write_text("# nothing yet\n", encoding='utf-8')
+    with pytest.raises(ValueError):
+        nvda_daily_tracker.load_watchlist(str(path))
+
+
+def test_track_symbols_writes_one_workbook_in_one_transaction(tmp_path, monkeypatch, capsys):
+    async def fake_fetch(symbol, date=None, max_results=5, new_only=False):
+        if symbol == 'BAD':
+            raise ValueError("No trading data available for BAD")
+        return make_record(date, 110.0), []
+
+    commits = []
+    original_upsert_symbols = TrackerStore.upsert_symbols
+
+    def counting_upsert_symbols(self, entries):
+        entries = list(entries)
+        commits.append(sorted(symbol for symbol, _, _ in entries))
+        return original_upsert_symbols(self, entries)
+
+    monkeypatch.setattr(nvda_daily_tracker, 'fetch_price_and_news_async', fake_fetch)
+    monkeypatch.setattr(TrackerStore, 'upsert_symbols', counting_upsert_symbols)
+
+    results = asyncio.run(nvda_daily_tracker.track_symbols_async(
+        ['NVDA', 'BAD', 'AAPL'], '2026-01-15', str(tmp_path), workbook='watchlist.xlsx', max_concurrency=2))
+
+    assert commits == [['AAPL', 'NVDA']]
+    assert [result['success'] for result in results.values()] == [True, False, True]
+    assert all(result['latency_s'] >= 0 for result in results.values())
+    sheets = pd.read_excel(tmp_path / 'watchlist.xlsx', sheet_name=None)
+    assert list(sheets) == ['NVDA', 'AAPL']
+    assert sheets['AAPL']['날짜'].tolist() == ['2026-01-15']
+    assert not (tmp_path / 'nvda_daily_tracker.xlsx').exists()
+
+    nvda_daily_tracker.print_summary(results)
+    out = capsys.readouterr().out
+    assert '성공 2/3개' in out
+    assert 'No trading data available for BAD' in out
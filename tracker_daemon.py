@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+"""
+Daily Tracker Daemon
+
+관심 종목을 상주 프로세스에서 추적합니다. cron으로 매번 nvda_daily_tracker.py를
+실행하는 대신, 프로세스가 살아 있는 동안 HTTP 세션과 추적 저장소를 열어 둔 채
+종목별 거래소 장 마감 시각에 맞춰 기록합니다.
+
+- 종목별 일정: 거래소 시간대 기준 평일 장 마감 후 (기본 10분 뒤) 하루 한 번
+- 실패한 종목은 5분부터 두 배씩 (최대 2시간) 늘어나는 간격으로 재시도
+- 같은 주기에 실행되는 종목은 동시에 가져와 저장소에 한 번에 기록
+- Excel 내보내기는 변경된 종목만 모아서 주기적으로, 그리고 종료 시 수행
+- 주기별 소요 시간과 실패 내역은 상태 파일(JSON)에 기록
+
+사용법:
+    python tracker_daemon.py NVDA AAPL 005930.KS --output-dir ./data
+    python tracker_daemon.py NVDA --once
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import signal
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from datetime import time as dtime
+from zoneinfo import ZoneInfo
+
+import metrics
+from nvda_daily_tracker import (
+    MAX_CONCURRENCY,
+    _fetch_symbol,
+    format_news_summary,
+    migrate_workbook,
+    open_tracker_store,
+    tracker_filename,
+)
+
+
+@dataclass(frozen=True)
+class Market:
+    """거래소 시간대와 정규장 시간"""
+    timezone: str
+    open: dtime
+    close: dtime
+
+
+MARKETS = {
+    'US': Market('America/New_York', dtime(9, 30), dtime(16, 0)),
+    'KRX': Market('Asia/Seoul', dtime(9, 0), dtime(15, 30)),
+}
+
+# 티커 접미사 -> 거래소 (접미사가 없으면 US)
+SUFFIX_MARKETS = {
+    '.KS': 'KRX',
+    '.KQ': 'KRX',
+}
+
+DEFAULT_STATUS_FILENAME = 'tracker_daemon_status.json'
+
+# 실패한 종목의 재시도 간격: 처음 5분, 실패할 때마다 두 배, 최대 2시간
+RETRY_INITIAL = timedelta(minutes=5)
+RETRY_MAX = timedelta(hours=2)
+
+
+def market_for(symbol):
+    """티커의 거래소 정보를 반환합니다 (예: 005930.KS -> KRX)."""
+    for suffix, market in SUFFIX_MARKETS.items():
+        if symbol.upper().endswith(suffix):
+            return MARKETS[market]
+    return MARKETS['US']
+
+
+class SymbolSchedule:
+    """
+    한 종목의 추적 일정 (거래소 시간대 기준 평일 장 마감 후 하루 한 번).
+
+    공휴일은 따로 알지 못하므로 그날도 실행되며, 이 경우 직전 거래일
+    기록을 다시 저장합니다 (같은 날짜는 덮어쓰기). 실패하면 같은 거래일
+    안에서 RETRY_INITIAL 부터 두 배씩 (최대 RETRY_MAX) 늘어나는 간격으로
+    다시 시도합니다.
+
+    Args:
+        symbol (str): 주식 티커
+        delay_minutes (int): 장 마감 후 대기 시간 (분, 기본값: 10)
+    """
+
+    def __init__(self, symbol, delay_minutes=10):
+        self.symbol = symbol
+        self.market = market_for(symbol)
+        self.tz = ZoneInfo(self.market.timezone)
+        self.delay = timedelta(minutes=delay_minutes)
+        self.last_session = None
+        self.retry_session = None
+        self.retry_at = None
+        self.failed_attempts = 0
+
+    def _run_at(self, day):
+        """day(거래소 현지 날짜) 의 실행 시각 (UTC)"""
+        close = datetime.combine(day, self.market.close, tzinfo=self.tz)
+        return (close + self.delay).astimezone(timezone.utc)
+
+    def due(self, now):
+        """now(UTC) 에 실행할 차례인지 여부"""
+        local = now.astimezone(self.tz)
+        return (self._pending(local.date(), now)
+                and not (self.retry_session == local.date() and now < self.retry_at))
+
+    def _pending(self, day, now):
+        """day(거래소 현지 날짜) 의 실행 시각이 지났지만 아직 완료되지 않았는지 여부"""
+        return day.weekday() < 5 and now >= self._run_at(day) and self.last_session != day
+
+    def next_run(self, now):
+        """now(UTC) 이후 (또는 지금) 의 다음 실행 시각 (UTC)"""
+        if self.due(now):
+            return now
+        day = now.astimezone(self.tz).date()
+        if self._pending(day, now):
+            # 실패 후 재시도 대기 중
+            return self.retry_at
+        while day.weekday() >= 5 or day == self.last_session or self._run_at(day) <= now:
+            day += timedelta(days=1)
+        return self._run_at(day)
+
+    def session_date(self, now):
+        """now(UTC) 의 거래소 현지 날짜 (YYYY-MM-DD, 호스트 시간대와 무관)"""
+        return now.astimezone(self.tz).strftime('%Y-%m-%d')
+
+    def mark_done(self, now):
+        """now(UTC) 의 거래소 현지 날짜를 추적 완료로 표시합니다."""
+        self.last_session = now.astimezone(self.tz).date()
+        self.retry_session = None
+        self.retry_at = None
+        self.failed_attempts = 0
+
+    def mark_failed(self, now):
+        """
+        실패를 기록하고 같은 거래일의 다음 재시도 시각을 정합니다.
+
+        Returns:
+            datetime: 다음 재시도 시각 (UTC)
+        """
+        day = now.astimezone(self.tz).date()
+        if self.retry_session != day:
+            self.retry_session = day
+            self.failed_attempts = 0
+        self.failed_attempts += 1
+        self.retry_at = now + min(RETRY_INITIAL * 2 ** (self.failed_attempts - 1), RETRY_MAX)
+        return self.retry_at
+
+
+class TrackerDaemon:
+    """
+    상주 추적기: 저장소를 열어 둔 채 종목별 일정에 따라 기록합니다.
+
+    Args:
+        symbols (list): 주식 티커 리스트
+        output_dir (str): 출력 디렉토리 경로 (None이면 현재 디렉토리)
+        status_file (str): 상태 파일 경로 (None이면 출력 디렉토리의 tracker_daemon_status.json)
+        export_interval (float): Excel 내보내기 최소 간격 (초, 기본값: 300)
+        delay_minutes (int): 장 마감 후 대기 시간 (분, 기본값: 10)
+        clock (callable): 현재 UTC 시각을 반환하는 함수 (테스트용)
+    """
+
+    def __init__(self, symbols, output_dir=None, status_file=None, export_interval=300.0,
+                 delay_minutes=10, clock=None):
+        symbols = list(dict.fromkeys(symbols))
+        if not symbols:
+            raise ValueError("symbols cannot be empty")
+
+        self.output_dir = output_dir
+        self.status_file = status_file or (
+            os.path.join(output_dir, DEFAULT_STATUS_FILENAME) if output_dir else DEFAULT_STATUS_FILENAME
+        )
+        self.export_interval = export_interval
+        self.clock = clock or (lambda: datetime.now(timezone.utc))
+        self.schedules = {symbol: SymbolSchedule(symbol, delay_minutes) for symbol in symbols}
+        self.store = open_tracker_store(output_dir)
+        self.dirty = set()
+        self.last_export = time.monotonic()
+        self.cycles = 0
+        self.last_cycle = None
+        self.symbol_status = {symbol: {'last_date': None, 'last_run': None, 'latency_s': None,
+                                       'failures': 0, 'last_error': None} for symbol in symbols}
+        self._stop = None
+
+        for symbol in symbols:
+            migrate_workbook(self.store, symbol, output_dir)
+
+    def _write(self, results):
+        """성공한 결과를 한 번의 트랜잭션으로 저장소에 기록합니다 (스레드에서 실행)."""
+        entries = [(symbol, stock_data, news_summary)
+                   for symbol, stock_data, news_summary, _, error in results if error is None]
+        if entries:
+            self.store.upsert_symbols(entries)
+
+    async def run_cycle(self, force=False):
+        """
+        실행할 차례인 종목들을 동시에 가져와 한 번에 기록합니다.
+
+        Args:
+            force (bool): 일정과 관계없이 모든 종목을 실행 (기본값: False)
+
+        Returns:
+            dict: 주기 결과 {'symbols': [...], 'failed': [...], 'latency_s': float}
+        """
+        now = self.clock()
+        due = [symbol for symbol, schedule in self.schedules.items() if force or schedule.due(now)]
+        start = time.perf_counter()
+
+        # 날짜는 호스트 시간대가 아니라 종목별 거래소 현지 날짜
+        semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+        fetched = await asyncio.gather(*(
+            _fetch_symbol(symbol, self.schedules[symbol].session_date(now), semaphore) for symbol in due
+        ))
+        results = []
+        for symbol, (stock_data, news_items, latency, error) in zip(due, fetched):
+            news_summary = format_news_summary(news_items) if error is None else None
+            results.append((symbol, stock_data, news_summary, latency, error))
+        await asyncio.to_thread(self._write, results)
+
+        failed = []
+        for symbol, stock_data, _, latency, error in results:
+            status = self.symbol_status[symbol]
+            status['last_run'] = now.isoformat()
+            status['latency_s'] = round(latency, 3)
+            if error is None:
+                self.schedules[symbol].mark_done(now)
+                self.dirty.add(symbol)
+                status['last_date'] = stock_data['date']
+                status['last_error'] = None
+                print(f"✅ [{symbol}] {stock_data['date']} 종가 ${stock_data['close']} ({stock_data['change_pct']}%)")
+            else:
+                # 실패한 종목은 간격을 늘려 가며 다시 시도 (상장폐지 등으로 계속 실패해도 폭주하지 않도록)
+                failed.append(symbol)
+                status['failures'] += 1
+                status['last_error'] = error
+                retry_at = self.schedules[symbol].mark_failed(now)
+                print(f"❌ [{symbol}] 오류 발생: {error} (재시도: {retry_at.isoformat()})", file=sys.stderr)
+
+        if self.dirty and time.monotonic() - self.last_export >= self.export_interval:
+            await asyncio.to_thread(self.flush)
+
+        self.cycles += 1
+        self.last_cycle = {'at': now.isoformat(), 'symbols': due, 'failed': failed,
+                           'latency_s': round(time.perf_counter() - start, 3)}
+        self.write_status()
+        return self.last_cycle
+
+    def flush(self):
+        """변경된 종목만 Excel 파일로 내보냅니다."""
+        for symbol in sorted(self.dirty):
+            self.store.export_excel(symbol, tracker_filename(symbol), self.output_dir)
+        self.dirty.clear()
+        self.last_export = time.monotonic()
+
+    def status(self):
+        """현재 상태 (상태 파일 내용) 를 반환합니다."""
+        now = self.clock()
+        return {
+            'updated_at': now.isoformat(),
+            'cycles': self.cycles,
+            'last_cycle': self.last_cycle,
+            'pending_exports': sorted(self.dirty),
+            'symbols': {
+                symbol: {**status, 'next_run': self.schedules[symbol].next_run(now).isoformat()}
+                for symbol, status in self.symbol_status.items()
+            },
+        }
+
+    def write_status(self):
+        """상태 파일을 원자적으로 다시 씁니다."""
+        tmp = f"{self.status_file}.tmp"
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(self.status(), f, ensure_ascii=False, indent=2)
+        os.replace(tmp, self.status_file)
+
+    def stop(self):
+        """실행 중인 run_forever 를 멈춥니다."""
+        if self._stop is not None:
+            self._stop.set()
+
+    async def run_forever(self, poll_seconds=60.0):
+        """
+        멈출 때까지 poll_seconds 마다 일정을 확인하며 실행합니다.
+
+        종료 시 남은 Excel 내보내기를 마치고 저장소를 닫습니다.
+        """
+        self._stop = asyncio.Event()
+        try:
+            while not self._stop.is_set():
+                await self.run_cycle()
+                try:
+                    await asyncio.wait_for(self._stop.wait(), timeout=poll_seconds)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self.close()
+
+    def close(self):
+        """남은 Excel 내보내기를 마치고 저장소를 닫습니다."""
+        self.flush()
+        self.write_status()
+        self.store.close()
+
+
+async def _run(args):
+    daemon = TrackerDaemon(args.symbols, args.output_dir, args.status_file,
+                           args.export_interval, args.delay_minutes)
+    if args.once:
+        # 일정과 관계없이 모든 종목을 한 번 추적
+        try:
+            cycle = await daemon.run_cycle(force=True)
+        finally:
+            daemon.close()
+        return 1 if cycle['failed'] else 0
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, daemon.stop)
+        except NotImplementedError:
+            # Windows: Ctrl+C는 KeyboardInterrupt로 처리
+            pass
+
+    await daemon.run_forever(args.poll_seconds)
+    return 0
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description="관심 종목 상주 추적기")
+    parser.add_argument("symbols", nargs='+', help="추적할 티커 (예: NVDA AAPL 005930.KS)")
+    parser.add_argument("--output-dir", default=None, help="출력 디렉토리 (기본값: 현재 디렉토리)")
+    parser.add_argument("--status-file", default=None,
+                        help=f"상태 파일 경로 (기본값: 출력 디렉토리의 {DEFAULT_STATUS_FILENAME})")
+    parser.add_argument("--poll-seconds", type=float, default=60.0, help="일정 확인 간격 (초, 기본값: 60)")
+    parser.add_argument("--export-interval", type=float, default=300.0,
+                        help="Excel 내보내기 최소 간격 (초, 기본값: 300)")
+    parser.add_argument("--delay-minutes", type=int, default=10, help="장 마감 후 대기 시간 (분, 기본값: 10)")
+    parser.add_argument("--once", action="store_true", help="모든 종목을 한 번 추적하고 종료")
+    parser.add_argument("--metrics", default=None,
+                        help="종료할 때 지표를 저장할 파일 (.prom: Prometheus 텍스트, 그 외: JSON)")
+    args = parser.parse_args()
+    if args.metrics:
+        metrics.enable()
+
+    print("=" * 60)
+    print(f"일일 주가 추적 데몬: {', '.join(args.symbols)}")
+    print("=" * 60)
+
+    try:
+        return asyncio.run(_run(args))
+    except KeyboardInterrupt:
+        return 0
+    finally:
+        if args.metrics:
+            print(f"지표 저장: {metrics.dump(args.metrics)}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
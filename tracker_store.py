@@ -0,0 +1,379 @@
+"""
+Append-optimized store for daily tracker records keyed by (symbol, date).
+
+Each daily record is an O(1) upsert into SQLite instead of a read-modify-write
+of the whole workbook. The Korean-column Excel layout written by
+finance_util.append_daily_record is produced on demand by export_excel, and
+import_excel migrates an existing workbook into the store once.
+
+Technical indicators (see indicators.py) are stored next to each row and
+advanced from a saved per-symbol IndicatorState as days are added.
+
+pandas is only imported by the DataFrame and Excel methods, so writing rows
+keeps the tracker's startup light.
+"""
+
+import json
+import math
+import os
+import sqlite3
+import threading
+import time
+
+import metrics
+from indicators import INDICATOR_FIELDS, IndicatorState
+
+
+DEFAULT_STORE_FILENAME = 'daily_tracker.sqlite'
+
+# Store field -> Excel column, in workbook column order
+TRACKER_COLUMNS = {
+    'date': '날짜',
+    'prev_close': '전일종가',
+    'open': '시가',
+    'close': '종가',
+    'high': '최고가',
+    'low': '최저가',
+    'volume': '거래량',
+    'change': '변동가격',
+    'change_pct': '변동률(%)',
+    'news': '뉴스/이유',
+}
+
+STOCK_FIELDS = ['date', 'prev_close', 'open', 'close', 'high', 'low', 'volume', 'change', 'change_pct']
+
+
+def store_path(output_dir=None):
+    """
+    Return the path of the tracker store inside output_dir.
+
+    Args:
+        output_dir (str): Directory holding the tracker files (default: current directory)
+
+    Returns:
+        str: Path to the SQLite store
+    """
+    return os.path.join(output_dir, DEFAULT_STORE_FILENAME) if output_dir else DEFAULT_STORE_FILENAME
+
+
+def sheet_name(symbol):
+    """
+    Return the workbook sheet name used for symbol.
+
+    Excel sheet names are at most 31 characters and cannot contain []:*?/\\.
+
+    Args:
+        symbol (str): Stock ticker symbol
+
+    Returns:
+        str: Sheet name
+    """
+    return ''.join('_' if char in '[]:*?/\\' else char for char in symbol)[:31]
+
+
+class TrackerStore:
+    """
+    SQLite store of daily tracker rows with a (symbol, date) primary key.
+
+    Upserting a day replaces that day's row only, so the cost of a daily run
+    does not grow with the length of the history. Thread-safe.
+    """
+
+    def __init__(self, path=None):
+        """
+        Args:
+            path (str): SQLite file path (default: daily_tracker.sqlite in the current directory)
+        """
+        if path is None:
+            path = store_path()
+
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory, exist_ok=True)
+
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS daily_records ("
+            " symbol TEXT NOT NULL,"
+            " date TEXT NOT NULL,"
+            " prev_close REAL, open REAL, close REAL, high REAL, low REAL, volume INTEGER,"
+            " change REAL, change_pct REAL, news TEXT,"
+            " updated_at REAL NOT NULL,"
+            " PRIMARY KEY (symbol, date))"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS daily_indicators ("
+            " symbol TEXT NOT NULL,"
+            " date TEXT NOT NULL,"
+            f" {', '.join(f'{field} REAL' for field in INDICATOR_FIELDS)},"
+            " PRIMARY KEY (symbol, date))"
+        )
+        # state is the IndicatorState after last_date, prev_state the one before it
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS indicator_state ("
+            " symbol TEXT PRIMARY KEY,"
+            " last_date TEXT NOT NULL,"
+            " prev_state TEXT NOT NULL,"
+            " state TEXT NOT NULL)"
+        )
+        self._conn.commit()
+
+    def upsert(self, symbol, stock_data, news_summary):
+        """
+        Insert or replace the record for (symbol, stock_data['date']).
+
+        Args:
+            symbol (str): Stock ticker symbol
+            stock_data (dict): Record in fetch_daily_stock_data format
+            news_summary (str): Summary of news/reasons for the day's price movement
+
+        Raises:
+            ValueError: If stock_data is missing a required key
+        """
+        self.upsert_many(symbol, [(stock_data, news_summary)])
+
+    def upsert_many(self, symbol, items):
+        """
+        Insert or replace several records in one transaction.
+
+        Indicators are advanced incrementally for new latest days and for a
+        rewrite of the latest day; writing a day older than the latest one
+        replays the symbol's whole history.
+
+        Args:
+            symbol (str): Stock ticker symbol
+            items (list): (stock_data, news_summary) pairs; later pairs win for the same date
+
+        Raises:
+            ValueError: If a stock_data dict is empty or missing a required key
+        """
+        self.upsert_symbols((symbol, stock_data, news_summary) for stock_data, news_summary in items)
+
+    def upsert_symbols(self, entries):
+        """
+        Insert or replace records of any number of symbols in one transaction.
+
+        Args:
+            entries (iterable): (symbol, stock_data, news_summary) triples; later
+                                triples win for the same (symbol, date)
+
+        Raises:
+            ValueError: If a stock_data dict is empty or missing a required key
+        """
+        rows = {}
+        for symbol, stock_data, news_summary in entries:
+            if not stock_data:
+                raise ValueError("stock_data cannot be empty")
+            for key in STOCK_FIELDS:
+                if key not in stock_data:
+                    raise ValueError(f"stock_data must contain '{key}' key")
+            rows.setdefault(symbol, []).append(
+                (symbol, *(stock_data[key] for key in STOCK_FIELDS), news_summary, time.time()))
+
+        with self._lock:
+            for symbol, symbol_rows in rows.items():
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO daily_records"
+                    " (symbol, date, prev_close, open, close, high, low, volume, change, change_pct, news, updated_at)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", symbol_rows
+                )
+                # Later rows win for the same date, matching the INSERT OR REPLACE above
+                days = {row[1]: dict(zip(STOCK_FIELDS, row[1:1 + len(STOCK_FIELDS)])) for row in symbol_rows}
+                self._advance_indicators(symbol, [days[date] for date in sorted(days)])
+            self._conn.commit()
+
+    def _advance_indicators(self, symbol, days):
+        """Update stored indicators for days (oldest first); caller holds the lock."""
+        row = self._conn.execute(
+            "SELECT last_date, prev_state, state FROM indicator_state WHERE symbol = ?", (symbol,)
+        ).fetchone()
+        if row is None:
+            # First indicators for this symbol (it may have rows from before indicators existed)
+            self._replay_indicators(symbol)
+            return
+
+        last_date = row[0]
+        prev_state = IndicatorState.from_dict(json.loads(row[1]))
+        state = IndicatorState.from_dict(json.loads(row[2]))
+
+        values = []
+        for day in days:
+            if day['date'] < last_date:
+                self._replay_indicators(symbol)
+                return
+            if day['date'] == last_date:
+                # The latest day was rewritten: redo it from the state before it
+                state = IndicatorState.from_dict(prev_state.to_dict())
+            else:
+                prev_state = IndicatorState.from_dict(state.to_dict())
+                last_date = day['date']
+            values.append((day['date'], state.update(day)))
+
+        self._save_indicators(symbol, values, last_date, prev_state, state)
+
+    def _replay_indicators(self, symbol):
+        """Recompute a symbol's indicators and state from its whole history; caller holds the lock."""
+        days = [dict(zip(STOCK_FIELDS, row)) for row in self._conn.execute(
+            f"SELECT {', '.join(STOCK_FIELDS)} FROM daily_records WHERE symbol = ? ORDER BY date", (symbol,))]
+        prev_state, state = IndicatorState(), IndicatorState()
+        values = []
+        for day in days:
+            prev_state = IndicatorState.from_dict(state.to_dict())
+            values.append((day['date'], state.update(day)))
+        if values:
+            self._save_indicators(symbol, values, days[-1]['date'], prev_state, state)
+
+    def _save_indicators(self, symbol, values, last_date, prev_state, state):
+        """Write indicator rows and the running state; caller holds the lock."""
+        self._conn.executemany(
+            f"INSERT OR REPLACE INTO daily_indicators VALUES ({', '.join('?' * (2 + len(INDICATOR_FIELDS)))})",
+            [(symbol, date, *(None if math.isnan(v[field]) else v[field] for field in INDICATOR_FIELDS))
+             for date, v in values]
+        )
+        self._conn.execute(
+            "INSERT OR REPLACE INTO indicator_state VALUES (?, ?, ?, ?)",
+            (symbol, last_date, json.dumps(prev_state.to_dict()), json.dumps(state.to_dict()))
+        )
+
+    def rebuild_indicators(self, symbol):
+        """Recompute the stored indicators of symbol from its whole history."""
+        with self._lock:
+            self._replay_indicators(symbol)
+            self._conn.commit()
+
+    def count(self, symbol):
+        """Return the number of stored days for symbol."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM daily_records WHERE symbol = ?", (symbol,)
+            ).fetchone()[0]
+
+    def symbols(self):
+        """Return the stored symbols in alphabetical order."""
+        with self._lock:
+            return [row[0] for row in self._conn.execute(
+                "SELECT DISTINCT symbol FROM daily_records ORDER BY symbol")]
+
+    def records(self, symbol, with_indicators=False):
+        """
+        Return the history of symbol in the tracker workbook layout.
+
+        Args:
+            symbol (str): Stock ticker symbol
+            with_indicators (bool): Append the INDICATOR_FIELDS columns (default: False)
+
+        Returns:
+            pd.DataFrame: Korean-column rows, most recent date first
+        """
+        import pandas as pd
+
+        fields = [f"r.{field}" for field in TRACKER_COLUMNS]
+        columns = list(TRACKER_COLUMNS.values())
+        if with_indicators:
+            fields += [f"i.{field}" for field in INDICATOR_FIELDS]
+            columns += INDICATOR_FIELDS
+
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {', '.join(fields)} FROM daily_records r"
+                " LEFT JOIN daily_indicators i ON i.symbol = r.symbol AND i.date = r.date"
+                " WHERE r.symbol = ? ORDER BY r.date DESC", (symbol,)
+            ).fetchall()
+
+        df = pd.DataFrame(rows, columns=columns)
+        if with_indicators:
+            df[INDICATOR_FIELDS] = df[INDICATOR_FIELDS].astype(float)
+        return df
+
+    def export_excel(self, symbol, filename, output_dir=None):
+        """
+        Write the history of symbol to an Excel workbook.
+
+        Args:
+            symbol (str): Stock ticker symbol
+            filename (str): Output Excel filename
+            output_dir (str): Output directory path (default: current directory)
+
+        Returns:
+            str: Path to the Excel file
+        """
+        if output_dir and not os.path.exists(output_dir):
+            os.makedirs(output_dir)
+
+        filepath = os.path.join(output_dir, filename) if output_dir else filename
+        df = self.records(symbol)
+        with metrics.timer('excel_write_seconds', writer='tracker_store'):
+            df.to_excel(filepath, index=False, engine='openpyxl')
+        return filepath
+
+    def export_workbook(self, symbols, filename, output_dir=None):
+        """
+        Write the history of several symbols to one workbook, one sheet per symbol.
+
+        Args:
+            symbols (list): Stock ticker symbols, in sheet order
+            filename (str): Output Excel filename
+            output_dir (str): Output directory path (default: current directory)
+
+        Returns:
+            str: Path to the Excel file
+
+        Raises:
+            ValueError: If symbols is empty
+        """
+        import pandas as pd
+
+        if not symbols:
+            raise ValueError("symbols cannot be empty")
+        if output_dir and not os.path.exists(output_dir):
+            os.makedirs(output_dir)
+
+        filepath = os.path.join(output_dir, filename) if output_dir else filename
+        frames = [(sheet_name(symbol), self.records(symbol)) for symbol in symbols]
+        with metrics.timer('excel_write_seconds', writer='tracker_workbook'):
+            with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
+                for name, df in frames:
+                    df.to_excel(writer, sheet_name=name, index=False)
+        return filepath
+
+    def import_excel(self, symbol, filepath):
+        """
+        Load an existing tracker workbook into the store (one-time migration).
+
+        Rows already in the store for the same dates are replaced.
+
+        Args:
+            symbol (str): Stock ticker symbol the workbook belongs to
+            filepath (str): Path to a workbook in the tracker layout
+
+        Returns:
+            int: Number of rows imported
+
+        Raises:
+            ValueError: If the workbook is missing a tracker column
+        """
+        import pandas as pd
+
+        df = pd.read_excel(filepath, engine='openpyxl')
+        missing = [column for column in TRACKER_COLUMNS.values() if column not in df.columns]
+        if missing:
+            raise ValueError(f"{filepath} is not a tracker workbook (missing columns: {missing})")
+
+        df = df.rename(columns={column: field for field, column in TRACKER_COLUMNS.items()})
+        df['date'] = pd.to_datetime(df['date']).dt.strftime('%Y-%m-%d')
+        df['news'] = df['news'].astype(object).where(df['news'].notna(), None)
+
+        items = [
+            ({key: row[key] for key in STOCK_FIELDS}, row['news'])
+            for row in df[list(TRACKER_COLUMNS)].astype(object).to_dict('records')
+        ]
+        # Excel rows are newest first; upsert oldest first so duplicates keep the top row
+        self.upsert_many(symbol, reversed(items))
+        return len(items)
+
+    def close(self):
+        """Close the underlying SQLite connection."""
+        with self._lock:
+            self._conn.close()